@@ -8,85 +8,172 @@ and other project utilities.
 import sys
 import asyncio
 from pathlib import Path
-import argparse
-
-from src.database.database_utils import DatabaseUtil
+from types import SimpleNamespace
+from typing import NoReturn, Optional
 
 # from src.logger.default_logger import logger
 from src.logger.default_logger import get_logger
-from src.scripts.setup_database import DatabaseSetupOrchestrator
-from src.utils.api_exceptions import DatabaseException
 
 # Add project root to sys.path
 PROJECT_ROOT = Path(__file__).resolve().parent
-sys.path.insert(0, str(PROJECT_ROOT))
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
 
 logger = get_logger(__name__)
 
 
-def main():
-    parser = argparse.ArgumentParser(description="DocuChatAPI Management CLI")
-    subparsers = parser.add_subparsers(dest="command", required=True)
-
-    # Database commands
-    db_parser = subparsers.add_parser("db", help="Database operations")
-    db_subparsers = db_parser.add_subparsers(dest="db_command", required=True)
-
-    # Init command
-    db_subparsers.add_parser("init", help="Initialize database with migrations")
-
-    # Migrate command with message
-    migrate_parser = db_subparsers.add_parser("migrate", help="Create a new migration")
-    migrate_parser.add_argument(
-        "-m",
-        "--message",
-        required=True,
-        help="Migration message describing the changes",
-    )
+USAGE = """usage: manage.py db <command> [options]
 
-    # Upgrade command
-    upgrade_parser = db_subparsers.add_parser("upgrade", help="Apply migrations")
-    upgrade_parser.add_argument(
-        "revision", nargs="?", default="head", help="Target revision (default: head)"
-    )
+DocuChatAPI Management CLI
 
-    # Downgrade command with required revision
-    downgrade_parser = db_subparsers.add_parser(
-        "downgrade", help="Downgrade to specific revision"
-    )
-    downgrade_parser.add_argument(
-        "revision", help="Target revision to downgrade to (use -1 for previous)"
-    )
-
-    # Status command
-    db_subparsers.add_parser("status", help="Show current migration status")
-
-    # History command
-    db_subparsers.add_parser("history", help="Show migration history")
+Database commands:
+  init                          Initialize database with migrations
+  migrate -m/--message MESSAGE  Create a new migration
+  upgrade [REVISION]            Apply migrations (default: head)
+  downgrade REVISION            Downgrade to specific revision (use -1 for previous)
+  status                        Show current migration status
+  history [--limit N]           Show migration history (newest first)
+  reset [--confirm]             Reset database (DANGEROUS: drops all tables)
+  health [--verbose]            Check database health
+  seed [--skip-plans] [--skip-users]
+                                Seed database with initial data
+"""
 
-    # Reset command with confirmation
-    reset_parser = db_subparsers.add_parser(
-        "reset", help="Reset database (DANGEROUS: drops all tables)"
-    )
-    reset_parser.add_argument(
-        "--confirm", action="store_true", help="Confirm you want to reset the database"
+DB_COMMANDS = (
+    "init",
+    "migrate",
+    "upgrade",
+    "downgrade",
+    "status",
+    "history",
+    "reset",
+    "health",
+    "seed",
+)
+
+
+def _usage_error(message: str) -> NoReturn:
+    """Print the usage and an error message, then exit like argparse does."""
+    sys.stderr.write(f"{USAGE}\nmanage.py: error: {message}\n")
+    sys.exit(2)
+
+
+# Options accepted by each db command: boolean flags, options taking a value
+# (mapped to their attribute name) and the optional positional argument
+_DB_FLAGS = {
+    "reset": ("--confirm",),
+    "health": ("--verbose",),
+    "seed": ("--skip-plans", "--skip-users"),
+}
+_DB_VALUE_OPTIONS = {
+    "migrate": {"-m": "message", "--message": "message"},
+    "history": {"--limit": "limit"},
+}
+_DB_POSITIONALS = {"upgrade": "revision", "downgrade": "revision"}
+
+
+def _is_option(token: str) -> bool:
+    # "-1" is a valid revision, so negative numbers are not options
+    return token.startswith("-") and not token[1:].isdigit()
+
+
+def parse_args(argv: list[str]) -> Optional[SimpleNamespace]:
+    """
+    Parse the CLI arguments with a small hand-written parser instead of argparse.
+
+    Options taking a value accept both "--opt value" and "--opt=value".
+    Unrecognized options and extra arguments are rejected with a usage error.
+
+    Returns:
+        The parsed arguments, or None if help was requested.
+    """
+    if not argv or "-h" in argv or "--help" in argv:
+        sys.stdout.write(USAGE)
+        return None
+
+    command, *rest = argv
+    if command != "db":
+        _usage_error(f"invalid command: '{command}' (choose from 'db')")
+    if not rest or rest[0] not in DB_COMMANDS:
+        _usage_error(f"db command must be one of: {', '.join(DB_COMMANDS)}")
+
+    db_command, *options = rest
+    flags = _DB_FLAGS.get(db_command, ())
+    value_options = _DB_VALUE_OPTIONS.get(db_command, {})
+    positional = _DB_POSITIONALS.get(db_command)
+
+    args = SimpleNamespace(
+        command=command,
+        db_command=db_command,
+        message=None,
+        revision=None,
+        limit=None,
+        confirm=False,
+        verbose=False,
+        skip_plans=False,
+        skip_users=False,
     )
+    unrecognized = []
+
+    index = 0
+    while index < len(options):
+        token = options[index]
+        index += 1
+
+        name, has_value, value = token, False, None
+        if token.startswith("--") and "=" in token:
+            name, _, value = token.partition("=")
+            has_value = True
+
+        if name in value_options:
+            if not has_value:
+                if index >= len(options) or _is_option(options[index]):
+                    _usage_error(
+                        f"db {db_command}: argument {name}: expected one argument"
+                    )
+                value = options[index]
+                index += 1
+            setattr(args, value_options[name], value)
+        elif name in flags and not has_value:
+            setattr(args, name[2:].replace("-", "_"), True)
+        elif (
+            positional is not None
+            and not _is_option(token)
+            and getattr(args, positional) is None
+        ):
+            setattr(args, positional, token)
+        else:
+            unrecognized.append(token)
+
+    if unrecognized:
+        _usage_error(f"unrecognized arguments: {' '.join(unrecognized)}")
+
+    if db_command == "migrate" and args.message is None:
+        _usage_error("db migrate: the following arguments are required: -m/--message")
+
+    if db_command == "downgrade" and args.revision is None:
+        _usage_error("db downgrade: the following arguments are required: revision")
+    if args.revision is None:
+        args.revision = "head"
+
+    if args.limit is not None:
+        if not args.limit.isdigit():
+            _usage_error("db history: --limit expects a positive integer")
+        args.limit = int(args.limit)
+
+    return args
 
-    # Health check command
-    db_subparsers.add_parser("health", help="Check database health")
 
-    # Seed command
-    seed_parser = db_subparsers.add_parser(
-        "seed", help="Seed database with initial data"
-    )
-    seed_parser.add_argument(
-        "--skip-plans", action="store_true", help="Skip seeding plans"
-    )
-    seed_parser.add_argument(
-        "--skip-users", action="store_true", help="Skip creating test users"
-    )
+def main():
+    args = parse_args(sys.argv[1:])
+    if args is None:
+        return
 
-    args = parser.parse_args()
+    # Imported here so --help and usage errors don't load the database stack
+    from src.database.database_utils import DatabaseUtil
+    from src.scripts.setup_database import DatabaseSetupOrchestrator
+    from src.utils.api_exceptions import DatabaseException
+    from src.utils.api_responses import format_stack_trace
 
     orchestrator = DatabaseSetupOrchestrator()
 
@@ -101,6 +188,8 @@ def main():
                 )
 
             if args.db_command == "init":
+                # The database health check reads alembic.ini, env.py and the
+                # versions dir, so the scaffolding has to exist first
                 await orchestrator.setup_migrations_infrastructure()
                 await orchestrator.initialize_database()
                 await orchestrator.create_initial_migration()
@@ -121,11 +210,14 @@ def main():
             elif args.db_command == "status":
                 health_info = await orchestrator.db_manager.engine.health_check()
 
-                DatabaseUtil.is_database_healthy(health_info)
-                DatabaseUtil.check_migration_status(health_info)
+                with DatabaseUtil.buffered_report():
+                    DatabaseUtil.is_database_healthy(health_info)
+                    DatabaseUtil.check_migration_status(health_info)
 
             elif args.db_command == "history":
-                history = orchestrator.migration_manager.get_migration_history()
+                history = orchestrator.migration_manager.get_migration_history(
+                    limit=args.limit
+                )
 
                 if not history:
                     logger.warning("No database migrations found!")
@@ -147,7 +239,7 @@ def main():
                     )
 
             elif args.db_command == "health":
-                await orchestrator.database_health_check()
+                await orchestrator.database_health_check(verbose=args.verbose)
 
             elif args.db_command == "seed":
                 logger.info("Seeding database with initial data...")
@@ -185,7 +277,9 @@ def main():
             if exc.error_detail.details:
                 logger.error("Details: %s", exc.error_detail.details)
             if exc.error_detail.stack_trace:
-                logger.debug("Stack trace: %s", exc.error_detail.stack_trace)
+                logger.debug(
+                    "Stack trace: %s", format_stack_trace(exc.error_detail.stack_trace)
+                )
             exit_code = 1
         except IOError as exc:
             logger.error("IO Error: %s", exc)
@@ -194,7 +288,7 @@ def main():
             logger.warning("Operation cancelled by user")
             exit_code = 0
         except Exception as ex:
-            logger.error("Unexpected error: %s", ex, exc_info=True)
+            logger.exception("Unexpected error: %s", ex)
             exit_code = 1
         finally:
             await orchestrator.cleanup()
@@ -208,7 +302,7 @@ def main():
         logger.warning("Operation cancelled by user")
         sys.exit(0)
     except Exception as e:
-        logger.error("Fatal error: %s", e, exc_info=True)
+        logger.exception("Fatal error: %s", e)
         sys.exit(1)
 
 
@@ -234,7 +328,18 @@ def show_usage_examples():
         logger.info("  %-25s %s", description + ":", command)
 
 
+def use_uvloop() -> None:
+    """Run the CLI's event loop on uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 if __name__ == "__main__":
+    use_uvloop()
+
     if len(sys.argv) == 1 or (len(sys.argv) == 2 and sys.argv[1] in ["-h", "--help"]):
         main()
         logger.info("")
@@ -3,7 +3,11 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
 from src.database.db_manager import get_database_manager
-from src.logger.default_logger import logger
+from src.logger.default_logger import logger, start_log_listener, stop_log_listener
+from src.middleware.http_logging import (
+    start_http_log_consumer,
+    stop_http_log_consumer,
+)
 from src.database.database_utils import DatabaseUtil
 
 # TODO: FIX MIGRATION AND DB CONNECTION ISSUES
@@ -27,31 +31,35 @@ async def lifespan(app: FastAPI):
     """
 
     db_manager = get_database_manager()
+    start_log_listener()
 
     try:
         logger.info("Starting DocuChatAPI application...")
 
+        start_http_log_consumer()
+
         # Initialize connection only
         await db_manager.initialize_for_application()
 
         # Retrieve health check info
         health_info = await db_manager.engine.health_check()
 
-        # Verify database health
-        DatabaseUtil.is_database_healthy(health_info)
-
-        # Check that the required tables exist
-        DatabaseUtil.verify_tables_exist(health_info)
-
-        # Check pending migrations (don't run)
-        DatabaseUtil.check_migration_status(health_info)
+        # Verify database health, that the required tables exist and whether
+        # migrations are pending (don't run them), as one log record
+        with DatabaseUtil.buffered_report():
+            DatabaseUtil.is_database_healthy(health_info)
+            DatabaseUtil.verify_tables_exist(health_info)
+            DatabaseUtil.check_migration_status(health_info)
 
         yield
     except Exception as e:
         raise e
     finally:
         logger.debug("Shutting down application...")
+        await stop_http_log_consumer()
         try:
             await db_manager.shutdown()
         except Exception as e:
-            logger.error("Error during shutdown: %s", str(e))
+            logger.error("Error during shutdown: %s", e)
+        finally:
+            stop_log_listener()
@@ -4,7 +4,7 @@ Each configuration class handles a specific domain of settings.
 """
 
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from pydantic import Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -48,10 +48,18 @@ class DatabaseSettings(BaseSettings):
     DB_NAME: str = Field(default="docu_chat", env="DB_NAME")
     DB_USER: str = Field(default="postgres", env="DB_USER")
     DB_PASSWORD: SecretStr = Field(default="", env="DB_PASSWORD")
+    DB_DRIVER: str = Field(default="asyncpg", env="DB_DRIVER")
 
-    DB_POOL_SIZE: int = Field(default=10)
-    DB_MAX_OVERFLOW: int = Field(default=20)
+    DB_POOL_SIZE: int = Field(default=25)
+    DB_MAX_OVERFLOW: int = Field(default=25)
     DB_POOL_TIMEOUT: int = Field(default=30)
+    DB_POOL_RECYCLE: int = Field(default=1800)
+    DB_QUERY_CACHE_SIZE: int = Field(default=1200)
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = Field(default=500)
+    DB_IS_PGBOUNCER_TRANSACTION_POOLING: bool = Field(default=False)
+    DB_TCP_KEEPALIVES_IDLE: int = Field(default=30)
+    DB_TCP_KEEPALIVES_INTERVAL: int = Field(default=10)
+    DB_TCP_KEEPALIVES_COUNT: int = Field(default=5)
     DB_ECHO: bool = Field(default=False)
     DB_IS_POOL_PRE_PING_ENABLED: bool = Field(default=True)
 
@@ -78,6 +86,10 @@ class AuthSettings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(default=5)
     REFRESH_TOKEN_EXPIRE_DAYS: int = Field(default=7)
 
+    # bcrypt work factor; each +1 doubles the hashing time. Lower it (min 4)
+    # in development and tests, where passwords are hashed repeatedly.
+    BCRYPT_COST: int = Field(default=12, ge=4, le=31)
+
     model_config = SettingsConfigDict(env_file=ENV_FILE, extra="ignore")
 
 
@@ -88,6 +100,17 @@ class FileProcessingSettings(BaseSettings):
     ALLOWED_FILE_EXTENSIONS: List[str] = Field(default=[".pdf", ".docx", ".txt", ".md"])
     MAX_FILE_SIZE_MB: int = Field(default=20)
     MAX_FILES_PER_UPLOAD: int = Field(default=10)
+    UPLOAD_DIRECTORY: str = Field(default="../data/uploads")
+    COMPRESS_UPLOADS: bool = Field(default=True)
+    UPLOAD_COMPRESSION_LEVEL: int = Field(default=3)
+
+    # "local" stores uploads under UPLOAD_DIRECTORY, "s3" in S3_BUCKET_NAME
+    STORAGE_BACKEND: str = Field(default="local")
+    S3_BUCKET_NAME: str = Field(default="")
+    S3_REGION: Optional[str] = Field(default=None)
+    S3_MULTIPART_CHUNK_MB: int = Field(default=8)
+    S3_MAX_CONCURRENCY: int = Field(default=10)
+    S3_UPLOAD_URL_EXPIRY_SECONDS: int = Field(default=900)
 
     RAW_DOCS_DIRECTORY: str = Field(default="../data/raw_docs")
     PROCESSED_DOCS_DIRECTORY: str = Field(default="../data/processed_docs")
@@ -185,6 +208,7 @@ class LoggingSettings(BaseSettings):
     LOG_WEB_SEARCHES: bool = Field(default=False)
     LOG_DATABASE_QUERIES: bool = Field(default=False)
     LOG_API_REQUESTS: bool = Field(default=True)
+    VALIDATE_DATABASE_LOGS: bool = Field(default=False)
 
     model_config = SettingsConfigDict(env_file=ENV_FILE, extra="ignore")
 
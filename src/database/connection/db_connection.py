@@ -4,7 +4,11 @@ using SQLAlchemy with asyncpg. Handling connections to the database and session
 management.
 """
 
+from uuid import uuid4
+
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
 from src.database.connection.base_connection import DatabaseConnection
 from src.config.settings import settings
 from src.utils.api_exceptions import DatabaseException
@@ -17,21 +21,99 @@ class PostgresConnection(DatabaseConnection):
     This class handles connection pooling, session management, and cleanup.
     """
 
+    # Async drivers SQLAlchemy can use for PostgresSQL
+    SUPPORTED_DRIVERS = ("asyncpg", "psycopg")
+    _SUPPORTED_DRIVERS_DETAILS = f"Supported drivers: {', '.join(SUPPORTED_DRIVERS)}"
+
     def __init__(self, database_url: str = None):
-        self.database_url = database_url or str(
-            settings.database.DATABASE_URL.get_secret_value()
+        self.database_url = self._with_async_driver(
+            database_url or str(settings.database.DATABASE_URL.get_secret_value()),
+            settings.database.DB_DRIVER,
         )
         self.engine = None
         self.session_maker = None
 
+    @classmethod
+    def _with_async_driver(cls, database_url: str, driver: str) -> str:
+        """
+        Rewrite a PostgresSQL URL so the async engine uses the given driver.
+
+        asyncpg speaks the binary protocol natively on the event loop and is the
+        default; psycopg (v3) is kept as a fallback.
+        """
+
+        if driver not in cls.SUPPORTED_DRIVERS:
+            raise DatabaseException(
+                message=f"Unsupported database driver: {driver}",
+                error_code="UNSUPPORTED_DB_DRIVER",
+                details=cls._SUPPORTED_DRIVERS_DETAILS,
+            )
+
+        scheme, separator, rest = database_url.partition("://")
+        if separator and scheme.split("+")[0] in ("postgresql", "postgres"):
+            return f"postgresql+{driver}://{rest}"
+
+        return database_url
+
+    def _get_connect_args(self) -> dict:
+        """
+        Driver specific connection arguments.
+
+        For asyncpg, TCP keepalives are requested through the server settings
+        so idle pooled connections are not silently dropped by the network.
+        Statements are prepared server-side once per connection and kept in an
+        LRU cache, so repeated lookups skip PostgresSQL's parse/plan step.
+
+        Behind pgbouncer in transaction pooling mode a prepared statement may
+        not exist on the next server connection, so the caches are disabled
+        and every statement gets a unique name. No server settings are sent
+        there, as pgbouncer rejects unknown startup parameters.
+        """
+
+        if not self.database_url.startswith("postgresql+asyncpg"):
+            return {}
+
+        if settings.database.DB_IS_PGBOUNCER_TRANSACTION_POOLING:
+            return {
+                "prepared_statement_cache_size": 0,
+                "statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+            }
+
+        statement_cache_size = settings.database.DB_PREPARED_STATEMENT_CACHE_SIZE
+        return {
+            "prepared_statement_cache_size": statement_cache_size,
+            "statement_cache_size": statement_cache_size,
+            "server_settings": {
+                "tcp_keepalives_idle": str(settings.database.DB_TCP_KEEPALIVES_IDLE),
+                "tcp_keepalives_interval": str(
+                    settings.database.DB_TCP_KEEPALIVES_INTERVAL
+                ),
+                "tcp_keepalives_count": str(settings.database.DB_TCP_KEEPALIVES_COUNT),
+            },
+        }
+
     async def connect(self):
-        """Create the async SQLAlchemy engine and session factory."""
+        """
+        Create the async SQLAlchemy engine and session factory.
+
+        The engine owns the connection pool, so it is created once and reused
+        by later calls until `disconnect()` disposes it.
+        """
+        if self.engine is not None:
+            return
+
         self.engine = create_async_engine(
             url=self.database_url,
             echo=settings.database.DB_ECHO,
+            poolclass=AsyncAdaptedQueuePool,
             pool_pre_ping=settings.database.DB_IS_POOL_PRE_PING_ENABLED,
             pool_size=settings.database.DB_POOL_SIZE,
             max_overflow=settings.database.DB_MAX_OVERFLOW,
+            pool_timeout=settings.database.DB_POOL_TIMEOUT,
+            pool_recycle=settings.database.DB_POOL_RECYCLE,
+            query_cache_size=settings.database.DB_QUERY_CACHE_SIZE,
+            connect_args=self._get_connect_args(),
         )
         self.session_maker = async_sessionmaker(
             bind=self.engine, expire_on_commit=False, autoflush=False
@@ -41,6 +123,8 @@ class PostgresConnection(DatabaseConnection):
         """Dispose the engine and close connections."""
         if self.engine:
             await self.engine.dispose()
+            self.engine = None
+            self.session_maker = None
 
     def get_session(self) -> AsyncSession:
         """
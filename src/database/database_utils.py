@@ -2,7 +2,12 @@
 Stores utility functions and classes for database operations.
 """
 
-from typing import Any
+import functools
+import logging
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional, Sequence
 
 from src.logger.default_logger import get_logger
 from src.config.settings import settings
@@ -11,157 +16,322 @@ from src.config.settings import settings
 
 logger = get_logger(__name__)
 
+# A report section: its name, its lines and the level to log it at
+_Section = tuple[str, Sequence[str], int]
+
+# Sections collected by DatabaseUtil.buffered_report()
+_report_buffer: ContextVar[Optional[list[_Section]]] = ContextVar(
+    "_report_buffer", default=None
+)
+
+# Report section headers, built once. Each record also carries its section
+# names in the `db_sections` log record field.
+_SEP = "=" * 20
+_SECTION_HEADERS = {
+    section: f"{_SEP} DATABASE {section.replace('_', ' ').upper()} {_SEP}"
+    for section in (
+        "health_status",
+        "health_check",
+        "performance_metrics",
+        "errors",
+        "connection_info",
+        "migration_check",
+        "migration_info",
+        "tables_check",
+    )
+}
+
+# protocol://[user[:password]@]host... The credentials end at the last "@"
+# before the path, so passwords containing "@" stay masked while an "@" in
+# the path or query string is left to the host part.
+_DB_URL_RE = re.compile(
+    r"^(?P<protocol>[^:/]+)://"
+    r"(?:(?P<user>[^:@/]*)(?P<password>:[^/]*)?@)?"
+    r"(?P<host>.*)$",
+    re.DOTALL,
+)
+
 
 class DatabaseUtil:
     """Application wide utility functions for the database and its operations."""
 
     @staticmethod
-    def mask_db_url(db_url) -> str:
+    def mask_db_url(db_url: str) -> str:
         """Censures the sensitive information found in a database url."""
 
-        try:
-            if "://" in db_url:
-                protocol, rest = db_url.split("://", 1)
-                if "@" in rest:
-                    credentials, host_part = rest.split("@", 1)
-
-                    if ":" in credentials:
-                        username = credentials.split(":")[0]
-                        return f"{protocol}://{username}:***@{host_part}"
-
-                    return f"{protocol}://***@{host_part}"
-                else:
-                    return db_url  # No credentials in URL
-            else:
-                return "***"  # Fallback for unexpected format
-        except Exception:
+        match = _DB_URL_RE.match(db_url)
+        if match is None:
             return "*** (URL format not recognized)"
 
+        protocol, user, password, host = match.group(
+            "protocol", "user", "password", "host"
+        )
+        if user is None:
+            return db_url  # No credentials in URL
+        if password is None:
+            return f"{protocol}://***@{host}"
+        return f"{protocol}://{user}:***@{host}"
+
     @staticmethod
-    def is_database_healthy(health_info: dict[str, Any]):
-        """Determines if the database is healthy or not"""
+    def _emit_sections(sections: list[_Section]) -> None:
+        """Emit report sections as one log record at their most severe level."""
+
+        logger.log(
+            max(level for _, _, level in sections),
+            "%s",
+            "\n".join(
+                "\n".join([_SECTION_HEADERS[section], *lines])
+                for section, lines, _ in sections
+            ),
+            extra={"db_sections": tuple(section for section, _, _ in sections)},
+        )
 
-        logger.info(f"{"=" * 20} DATABASE HEALTH STATUS {"=" * 20}")
+    @staticmethod
+    def _log_sections(*sections: _Section) -> None:
+        """Emit report sections, or add them to the active buffered report."""
 
-        health_status = "HEALTHY" if health_info["healthy"] else "UNHEALTHY"
+        buffer = _report_buffer.get()
+        if buffer is not None:
+            buffer.extend(sections)
+            return
 
-        if health_info["healthy"]:
-            logger.info(f"Database status: {health_status}")
-        else:
-            logger.warning(f"Database status: {health_status}")
+        DatabaseUtil._emit_sections(list(sections))
 
     @staticmethod
-    def log_health_checks(health_info: dict[str, Any]):
-        """Displays all health checks"""
+    @contextmanager
+    def buffered_report() -> Iterator[None]:
+        """
+        Collect the sections logged inside the block and emit them as one log
+        record, at the most severe level among them, when the block exits.
+        """
+
+        sections: list[_Section] = []
+        token = _report_buffer.set(sections)
+        try:
+            yield
+        finally:
+            _report_buffer.reset(token)
+            if sections:
+                DatabaseUtil._emit_sections(sections)
 
-        logger.info(f"{"=" * 20} DATABASE HEALTH CHECK {"=" * 20}")
+    # Section builders. Each returns a (section, lines, level) tuple.
 
-        if health_info.get("checks"):
-            for check_name, status in health_info["checks"].items():
-                check_display = check_name.replace("_", " ").title()
-                if status:
-                    logger.info(f"Health check passed: {check_display}")
-                else:
-                    logger.warning(f"Health check failed: {check_display}")
-        else:
-            logger.warning("No health checks available")
+    @staticmethod
+    def _health_status_section(health_info: dict[str, Any]) -> _Section:
+        healthy = health_info["healthy"]
+        return (
+            "health_status",
+            [f"Database status: {'HEALTHY' if healthy else 'UNHEALTHY'}"],
+            logging.INFO if healthy else logging.WARNING,
+        )
 
     @staticmethod
-    def log_performance_metrics(health_info: dict[str, Any]):
-        """Logs database performance metrics"""
+    def _health_check_section(health_info: dict[str, Any]) -> _Section:
+        checks = health_info.get("checks")
+        if not checks:
+            return "health_check", ["No health checks available"], logging.WARNING
+
+        lines = []
+        level = logging.INFO
+        for check_name, status in checks.items():
+            check_display = check_name.replace("_", " ").title()
+            if status:
+                lines.append(f"Health check passed: {check_display}")
+            else:
+                lines.append(f"Health check failed: {check_display}")
+                level = logging.WARNING
+        return "health_check", lines, level
 
-        logger.info(f"{"=" * 20} DATABASE PERFORMANCE METRICS {"=" * 20}")
+    @staticmethod
+    def _performance_metrics_section(metrics: dict[str, Any]) -> _Section:
+        if not metrics:
+            return (
+                "performance_metrics",
+                ["No performance metrics available"],
+                logging.WARNING,
+            )
 
-        metrics = health_info.get("metrics", {})
+        lines = []
+        if "query_response_time" in metrics:
+            response_time = metrics["query_response_time"]
+            lines.append(f"Query response time: {response_time:.3f}s")
 
-        if metrics:
-            if "query_response_time" in metrics:
-                response_time = metrics["query_response_time"]
-                logger.info(f"Query response time: {response_time:.3f}s")
+        if "database_size" in metrics:
+            lines.append(f"Database size: {metrics['database_size']}")
+
+        if "active_connections" in metrics:
+            lines.append(f"Active connections: {metrics['active_connections']}")
+
+        if "existing_tables" in metrics:
+            table_count = len(metrics["existing_tables"])
+            lines.append(f"Tables found: {table_count}")
+        return "performance_metrics", lines, logging.INFO
+
+    @staticmethod
+    def _errors_section(health_info: dict[str, Any]) -> _Section:
+        errors = health_info.get("errors", [])
+        if not errors:
+            return (
+                "errors",
+                ["No errors encountered during health check"],
+                logging.INFO,
+            )
+        return (
+            "errors",
+            [f"Health check error: {error}" for error in errors],
+            logging.ERROR,
+        )
 
-            if "database_size" in metrics:
-                logger.info(f"Database size: {metrics['database_size']}")
+    @staticmethod
+    @functools.cache
+    def _connection_info_section() -> _Section:
+        # The settings don't change at runtime, so this is built once
+        db_url = str(settings.database.DATABASE_URL.get_secret_value())
+        masked_url = DatabaseUtil.mask_db_url(db_url)
+        return (
+            "connection_info",
+            (
+                f"Database URL: {masked_url}",
+                f"Pool size: {settings.database.DB_POOL_SIZE}",
+                f"Max overflow: {settings.database.DB_MAX_OVERFLOW}",
+            ),
+            logging.INFO,
+        )
 
-            if "active_connections" in metrics:
-                logger.info(f"Active connections: {metrics['active_connections']}")
+    @staticmethod
+    def _migration_check_section(metrics: dict[str, Any]) -> _Section:
+        current_revision = metrics.get("current_revision")
+        has_pending = metrics.get("pending_migrations", False)
 
-            if "existing_tables" in metrics:
-                table_count = len(metrics["existing_tables"])
-                logger.info(f"Tables found: {table_count}")
+        lines = []
+        if current_revision:
+            lines.append(f"Current migration revision: {current_revision[:8]}")
         else:
-            logger.warning("No performance metrics available")
+            lines.append("No migrations applied")
+
+        if has_pending:
+            lines.append("Pending migrations detected")
+
+        return (
+            "migration_check",
+            lines,
+            logging.WARNING if has_pending else logging.INFO,
+        )
 
     @staticmethod
-    def log_errors_encountered(health_info: dict[str, Any]):
-        """Log any errors encountered during health checks"""
+    def _migration_info_section(metrics: dict[str, Any]) -> _Section:
+        current_revision = metrics.get("current_revision")
+        if current_revision:
+            status = f"Migration status: {current_revision[:8]} applied"
+        else:
+            status = "Migration status: No migrations applied"
+        return "migration_info", [status], logging.INFO
 
-        logger.info(f"{"=" * 20} DATABASE ERRORS {"=" * 20}")
+    @staticmethod
+    def _tables_check_section(metrics: dict[str, Any]) -> _Section:
+        existing_tables = metrics.get("existing_tables", [])
+        if existing_tables:
+            return (
+                "tables_check",
+                [f"Database tables verified: {len(existing_tables)} tables found"],
+                logging.INFO,
+            )
+        return "tables_check", ["No tables found in database"], logging.WARNING
 
-        errors = health_info.get("errors", [])
+    @staticmethod
+    def log_full_health_report(
+        health_info: dict[str, Any], verbose: bool = False
+    ) -> bool:
+        """
+        Log every section of the health report as a single log record.
 
-        if errors:
-            for error in errors:
-                logger.error(f"Health check error: {error}")
+        An unhealthy database only gets its status and errors reported, since
+        the remaining checks would just repeat the failure.
+
+        Args:
+            health_info: The health information returned by the health check
+            verbose: Also report migration and table checks
+
+        Returns:
+            Whether the database is healthy
+        """
+
+        healthy = health_info["healthy"]
+        sections = [DatabaseUtil._health_status_section(health_info)]
+
+        if not healthy:
+            sections.append(DatabaseUtil._errors_section(health_info))
         else:
-            logger.info("No errors encountered during health check")
+            metrics = health_info.get("metrics", {})
+            sections += [
+                DatabaseUtil._health_check_section(health_info),
+                DatabaseUtil._performance_metrics_section(metrics),
+                DatabaseUtil._errors_section(health_info),
+                DatabaseUtil._connection_info_section(),
+            ]
+            if verbose:
+                sections += [
+                    DatabaseUtil._migration_check_section(metrics),
+                    DatabaseUtil._migration_info_section(metrics),
+                    DatabaseUtil._tables_check_section(metrics),
+                ]
+
+        DatabaseUtil._log_sections(*sections)
+        return healthy
 
     @staticmethod
-    def log_connection_data():
-        """Log database connection information (with sensitive data masked)"""
+    def is_database_healthy(health_info: dict[str, Any]) -> bool:
+        """Determines if the database is healthy or not"""
 
-        logger.info(f"{"=" * 20} DATABASE CONNECTION INFO {"=" * 20}")
+        DatabaseUtil._log_sections(DatabaseUtil._health_status_section(health_info))
+        return health_info["healthy"]
 
-        db_url = str(settings.database.DATABASE_URL.get_secret_value())
-        masked_url = DatabaseUtil.mask_db_url(db_url)
+    @staticmethod
+    def log_health_checks(health_info: dict[str, Any]):
+        """Displays all health checks"""
 
-        logger.info(f"Database URL: {masked_url}")
-        logger.info(f"Pool size: {settings.database.DB_POOL_SIZE}")
-        logger.info(f"Max overflow: {settings.database.DB_MAX_OVERFLOW}")
+        DatabaseUtil._log_sections(DatabaseUtil._health_check_section(health_info))
 
     @staticmethod
-    def check_migration_status(health_info: dict[str, Any]):
-        """Check and log migration status"""
+    def log_performance_metrics(health_info: dict[str, Any]):
+        """Logs database performance metrics"""
 
-        logger.info(f"{"=" * 20} DATABASE MIGRATION CHECK {"=" * 20}")
+        DatabaseUtil._log_sections(
+            DatabaseUtil._performance_metrics_section(health_info.get("metrics", {}))
+        )
 
-        metrics = health_info.get("metrics", {})
-        current_revision = metrics.get("current_revision")
-        has_pending = metrics.get("pending_migrations", False)
+    @staticmethod
+    def log_errors_encountered(health_info: dict[str, Any]):
+        """Log any errors encountered during health checks"""
 
-        if current_revision:
-            logger.info(f"Current migration revision: {current_revision[:8]}")
-        else:
-            logger.info("No migrations applied")
+        DatabaseUtil._log_sections(DatabaseUtil._errors_section(health_info))
 
-        if has_pending:
-            logger.warning("Pending migrations detected")
+    @staticmethod
+    def log_connection_data():
+        """Log database connection information (with sensitive data masked)"""
+
+        DatabaseUtil._log_sections(DatabaseUtil._connection_info_section())
 
     @staticmethod
-    def log_migration_info(health_info: dict[str, Any]):
-        """Log detailed migration information"""
+    def check_migration_status(health_info: dict[str, Any]):
+        """Check and log migration status"""
 
-        logger.info(f"{"=" * 20} DATABASE MIGRATION INFO {"=" * 20}")
+        DatabaseUtil._log_sections(
+            DatabaseUtil._migration_check_section(health_info.get("metrics", {}))
+        )
 
-        metrics = health_info.get("metrics", {})
-        current_revision = metrics.get("current_revision")
+    @staticmethod
+    def log_migration_info(health_info: dict[str, Any]):
+        """Log detailed migration information"""
 
-        if current_revision:
-            logger.info(f"Migration status: {current_revision[:8]} applied")
-        else:
-            logger.info("Migration status: No migrations applied")
+        DatabaseUtil._log_sections(
+            DatabaseUtil._migration_info_section(health_info.get("metrics", {}))
+        )
 
     @staticmethod
     def verify_tables_exist(health_info: dict[str, Any]):
         """Verify that required tables exist in the database"""
 
-        logger.info(f"{"=" * 20} DATABASE TABLES CHECK {"=" * 20}")
-
-        metrics = health_info.get("metrics", {})
-        existing_tables = metrics.get("existing_tables", [])
-
-        if existing_tables:
-            logger.info(
-                f"Database tables verified: {len(existing_tables)} tables found"
-            )
-        else:
-            logger.warning("No tables found in database")
+        DatabaseUtil._log_sections(
+            DatabaseUtil._tables_check_section(health_info.get("metrics", {}))
+        )
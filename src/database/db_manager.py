@@ -8,6 +8,7 @@ from typing import Optional, AsyncGenerator, Dict, Any
 from contextlib import asynccontextmanager
 
 from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -26,6 +27,38 @@ from src.utils.helper import Cryptography
 
 logger = get_logger(__name__)
 
+CORE_TABLES = ("chat_session", "plan", "user")
+# Rows inserted by DatabaseSeeder.seed_plans()
+DEFAULT_PLANS = [
+    {
+        "name": "free",
+        "token_limit_daily": 10000,
+        "document_limit": 5,
+        "session_limit": 1,
+        "price_monthly": Decimal("0.00"),
+        "is_active": True,
+    },
+]
+
+_CORE_TABLES_SQL = ", ".join(f"'{name}'" for name in CORE_TABLES)
+
+_HEALTH_INFO_QUERY = text(
+    f"""
+    SELECT
+        ARRAY(
+            SELECT table_name::text
+            FROM information_schema.tables
+            WHERE table_schema = 'public'
+            AND table_name IN ({_CORE_TABLES_SQL})
+            ORDER BY table_name
+        ) AS existing_tables,
+        pg_size_pretty(pg_database_size(current_database())) AS db_size,
+        (
+            SELECT count(*) FROM pg_stat_activity WHERE state = 'active'
+        ) AS active_connections
+    """
+)
+
 
 class DatabaseEngine:
     """
@@ -52,9 +85,15 @@ class DatabaseEngine:
         """
         Initialize the database connection and engine.
 
+        Calling this again once initialized is a no-op, so callers share the
+        existing connection pool instead of creating a new engine.
+
         Raises:
             RuntimeError: If initialization fails.
         """
+        if self._is_initialized:
+            return
+
         try:
             await self._connection.connect()
             self._is_initialized = True
@@ -72,7 +111,7 @@ class DatabaseEngine:
             raise DatabaseException(
                 message="Database initialization failed.",
                 error_code="DB_INIT_FAILED",
-                stack_trace=str(e),
+                stack_trace=e,
             ) from e
 
     async def shutdown(self) -> None:
@@ -88,7 +127,7 @@ class DatabaseEngine:
             raise DatabaseException(
                 message="The database failed to shutdown",
                 error_code="DB_SHUTDOWN_ERROR",
-                stack_trace=str(e),
+                stack_trace=e,
             ) from e
 
     @asynccontextmanager
@@ -213,43 +252,51 @@ class DatabaseEngine:
             async with self.get_session() as session:
                 start_time = time.time()
 
-                # Basic connectivity check
+                # Connectivity, core tables and size/activity metrics in one round-trip
                 try:
-                    await session.execute(text("SELECT 1"))
+                    row = (await session.execute(_HEALTH_INFO_QUERY)).one()
                     health_info["checks"]["connectivity"] = True
                     query_time = time.time() - start_time
                     health_info["metrics"]["query_response_time"] = query_time
                 except Exception as e:
-                    health_info["checks"]["connectivity"] = False
-                    health_info["errors"].append(f"Connectivity failed: {str(e)}")
-                    return health_info
-
-                # Check if core tables exist
-                try:
-                    result = await session.execute(
-                        text(
-                            """
-                            SELECT table_name 
-                            FROM information_schema.tables  
-                            WHERE table_schema = 'public' 
-                            AND table_name IN ('user', 'plan', 'chat_session')
-                            ORDER BY table_name
-                        """
+                    health_info["errors"].append(f"Health query failed: {str(e)}")
+                    try:
+                        await session.rollback()
+                        await session.execute(text("SELECT 1"))
+                        health_info["checks"]["connectivity"] = True
+                    except Exception as conn_exc:
+                        health_info["checks"]["connectivity"] = False
+                        health_info["errors"].append(
+                            f"Connectivity failed: {str(conn_exc)}"
                         )
+                        return health_info
+                    row = None
+
+                if row is not None:
+                    tables = list(row.existing_tables or [])
+                    health_info["checks"]["core_tables"] = len(tables) >= len(
+                        CORE_TABLES
                     )
-                    tables = [row[0] for row in result.fetchall()]
-                    health_info["checks"]["core_tables"] = len(tables) >= 3
                     health_info["metrics"]["existing_tables"] = tables
+                    health_info["metrics"]["database_size"] = row.db_size
+                    health_info["metrics"]["active_connections"] = (
+                        row.active_connections
+                    )
 
-                    if len(tables) < 3:
-                        missing = set(["user", "plan", "chat_session"]) - set(
+                    if len(tables) < len(CORE_TABLES):
+                        missing = set(CORE_TABLES) - set(
                             tables
                         )  # TODO: COME BACK TO THIS - ADD A LIST OF ALL TABLES/MODELS
                         health_info["errors"].append(f"Missing tables: {missing}")
-
-                except Exception as e:
+                else:
                     health_info["checks"]["core_tables"] = False
-                    health_info["errors"].append(f"Table check failed: {str(e)}")
+
+                # Connection pool usage (no database round-trip)
+                pool = getattr(getattr(self._connection, "engine", None), "pool", None)
+                if pool is not None and hasattr(pool, "checkedout"):
+                    health_info["metrics"]["pool_size"] = pool.size()
+                    health_info["metrics"]["pool_checked_out"] = pool.checkedout()
+                    health_info["metrics"]["pool_overflow"] = pool.overflow()
 
                 # Check migration status
                 try:
@@ -272,26 +319,6 @@ class DatabaseEngine:
                     health_info["checks"]["migrations_current"] = False
                     health_info["errors"].append(f"Migration check failed: {str(e)}")
 
-                # Check database size and basic metrics
-                try:
-                    result = await session.execute(
-                        text(
-                            """
-                            SELECT 
-                            pg_size_pretty(pg_database_size(current_database())) 
-                            as db_size, (SELECT count(*) FROM pg_stat_activity 
-                            WHERE state = 'active') as active_connections
-                            """
-                        )
-                    )
-                    row = result.fetchone()
-                    if row:
-                        health_info["metrics"]["database_size"] = row[0]
-                        health_info["metrics"]["active_connections"] = row[1]
-
-                except Exception as e:
-                    health_info["errors"].append(f"Metrics collection failed: {str(e)}")
-
                 # Overall health determination
                 critical_checks = ["connectivity", "core_tables"]
                 health_info["healthy"] = all(
@@ -325,43 +352,44 @@ class DatabaseSeeder:
         """
         self._engine = engine
 
-    async def seed_plans(self) -> None:
-        """
-        Create default subscription plans if they don't exist.
+    @asynccontextmanager
+    async def _session_scope(
+        self, session: Optional[AsyncSession] = None
+    ) -> AsyncGenerator[AsyncSession, None]:
+        """Use the caller's session (and transaction) or open a new one."""
 
-        Creates three plans: free, pro, and enterprise with appropriate limits.
-        """
+        if session is not None:
+            yield session
+            return
 
-        async with self._engine.get_session() as session:
-            # Check if plans already exist
-            result = await session.execute(text("SELECT COUNT(*) FROM plan"))
-            count = result.scalar()
+        async with self._engine.get_session() as new_session:
+            yield new_session
 
-            if count > 0:
-                logger.info("Plans already exist, skipping seed")
-                return
+    async def seed_plans(self, session: Optional[AsyncSession] = None) -> None:
+        """
+        Create default subscription plans if they don't exist.
 
-            # Create default plans
-            plans = [
-                Plan(
-                    name="free",
-                    token_limit_daily=10000,
-                    document_limit=5,
-                    session_limit=1,
-                    price_monthly=Decimal("0.00"),
-                    is_active=True,
-                )
-            ]
+        All plans are written with one batched INSERT ... ON CONFLICT DO NOTHING,
+        so re-running the seed leaves existing plans untouched.
+
+        Args:
+            session: Optional session to run in; a new one is opened otherwise
+        """
 
-            session.add_all(plans)
-            await session.commit()
-            logger.info("Default subscription plans created successfully")
+        async with self._session_scope(session) as session:
+            stmt = pg_insert(Plan).on_conflict_do_nothing(index_elements=["name"])
+            await session.execute(stmt, DEFAULT_PLANS)
+            logger.info(
+                "Default subscription plans ensured: %s",
+                ", ".join(plan["name"] for plan in DEFAULT_PLANS),
+            )
 
     async def create_test_user(
         self,
         username: str = "TestUser",
         email: str = "test@example.com",
         password: str = "P@ssword123",
+        session: Optional[AsyncSession] = None,
     ) -> None:
         """
         Create a test user for development purposes.
@@ -370,9 +398,10 @@ class DatabaseSeeder:
             username: Username for the test user
             email: Email address for the test user
             password: Plain password (will be hashed)
+            session: Optional session to run in; a new one is opened otherwise
         """
 
-        async with self._engine.get_session() as session:
+        async with self._session_scope(session) as session:
             # Get free plan ID
             result = await session.execute(
                 text("SELECT id FROM plan WHERE name = 'free' LIMIT 1")
@@ -385,7 +414,7 @@ class DatabaseSeeder:
                     error_code="NO_FREE_PLAN_FOUND", message="Free plan not found"
                 )
 
-            # Check if user already exists
+            # Checked up front so an existing user doesn't cost a password hash
             result = await session.execute(
                 text('SELECT COUNT(*) FROM "user" WHERE email = :email'),
                 {"email": email},
@@ -399,17 +428,18 @@ class DatabaseSeeder:
             hashed_password = await Cryptography.hash_password(password)
 
             # Create test user
-            test_user = User(
-                username=username,
-                email=email,
-                hashed_password=hashed_password,
-                plan_id=plan_id,
-                email_verified=True,
-                is_active=True,
+            stmt = pg_insert(User).on_conflict_do_nothing()
+            await session.execute(
+                stmt,
+                {
+                    "username": username,
+                    "email": email.lower(),
+                    "hashed_password": hashed_password,
+                    "plan_id": plan_id,
+                    "email_verified": True,
+                    "is_active": True,
+                },
             )
-
-            session.add(test_user)
-            await session.commit()
             logger.info("Test user created: %s (password: %s)", email, password)
 
     async def seed_all(self) -> None:
@@ -417,17 +447,19 @@ class DatabaseSeeder:
         Run all seeding operations in the correct order.
 
         This method ensures plans are created before users that reference them.
+        Everything runs in one transaction, so a failure leaves no partial seed.
         """
         try:
-            await self.seed_plans()
-            await self.create_test_user()
+            async with self._engine.get_session() as session:
+                await self.seed_plans(session)
+                await self.create_test_user(session=session)
             logger.info("Database seeding completed successfully")
         except Exception as e:
             logger.error("Database seeding failed: %s", e)
             raise DatabaseException(
                 message="An error occurred during database seeding",
                 error_code="DB_SEEDING_FAILED",
-                stack_trace=str(e),
+                stack_trace=e,
             ) from e
 
 
@@ -469,7 +501,7 @@ class DatabaseManager:
             raise DatabaseException(
                 message="Failed to initialize database connection for application",
                 error_code="APP_DB_INIT_FAILED",
-                stack_trace=str(e),
+                stack_trace=e,
             ) from e
 
     async def setup_database(self, with_seed_data: bool = True) -> None:
@@ -543,7 +575,7 @@ class DatabaseManager:
             raise DatabaseException(
                 message="Databased failed to reset",
                 error_code="DB_RESET_FAILED",
-                stack_trace=str(e),
+                stack_trace=e,
             ) from e
 
     async def shutdown(self) -> None:
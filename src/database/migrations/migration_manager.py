@@ -2,6 +2,8 @@
 This module provides migration management using Alembic.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List
 
@@ -28,6 +30,13 @@ logger = get_logger(__name__)
 # logger = DatabaseLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _get_database_url() -> str:
+    """Unwrap the configured database URL once; it is fixed for the process."""
+
+    return str(settings.database.DATABASE_URL.get_secret_value())
+
+
 class MigrationManager:
     """
     This class provides a clean interface for managing database migrations
@@ -46,12 +55,14 @@ class MigrationManager:
         self._connection = connection or PostgresConnection()
         self._alembic_cfg: Optional[Config] = None
         self._migrations_path = Path(settings.database.DB_MIGRATION_DIR)
+        self._applied_cache: Optional[frozenset[str]] = None
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def _get_sync_database_url() -> str:
         """Convert async database URL to a sync URL for migrations."""
 
-        database_url = str(settings.database.DATABASE_URL.get_secret_value())
+        database_url = _get_database_url()
         if database_url.startswith("postgresql+asyncpg"):
             return database_url.replace("postgresql+asyncpg", "postgresql+psycopg2")
 
@@ -95,6 +106,9 @@ class MigrationManager:
             file_template = settings.database.DB_MIGRATION_FILE_TEMPLATE
             self._alembic_cfg.set_main_option("file_template", file_template)
 
+            # Run all pending migrations in a single transaction
+            self._alembic_cfg.set_main_option("transactional_ddl", "true")
+
             logger.debug("A new alembic config has been created")
 
             return self._alembic_cfg
@@ -124,7 +138,7 @@ class MigrationManager:
             raise DatabaseException(
                 message="Alembic initialization failed during migration",
                 error_code="ALEMBIC_INIT_FAILED",
-                stack_trace=str(e),
+                stack_trace=e,
             ) from e
 
     def _validate_migration_setup(self) -> None:
@@ -179,7 +193,7 @@ class MigrationManager:
             raise DatabaseException(
                 message="Migration creation failed",
                 error_code="MIGRATION_CREATION_FAILED",
-                stack_trace=str(e),
+                stack_trace=e,
             ) from e
 
     def upgrade(self, revision: str = "head") -> None:
@@ -196,13 +210,14 @@ class MigrationManager:
         try:
             config = self._get_alembic_config()
             command.upgrade(config, revision)
+            self.clear_applied_cache()
             logger.info("Database upgraded to revision: %s", revision)
         except Exception as e:
             logger.error("Failed to upgrade database: %s", e)
             raise DatabaseException(
                 message="Database upgrade failed.",
                 error_code="DB_UPDATE_FAILED",
-                stack_trace=str(e),
+                stack_trace=e,
             ) from e
 
     def downgrade(self, revision: str) -> None:
@@ -218,13 +233,14 @@ class MigrationManager:
         try:
             config = self._get_alembic_config()
             command.downgrade(config, revision)
+            self.clear_applied_cache()
             logger.info("Database downgraded to revision: %s", revision)
         except Exception as e:
-            logger.error("Failed to downgrade database: %s", str(e))
+            logger.error("Failed to downgrade database: %s", e)
             raise DatabaseException(
                 message="Database downgrade failed.",
                 error_code="DB_DOWNGRADE_FAILED",
-                stack_trace=str(e),
+                stack_trace=e,
             ) from e
 
     def get_current_revision(self) -> Optional[str]:
@@ -245,12 +261,15 @@ class MigrationManager:
                 logger.info("Current database revision retrieved")
                 return context.get_current_revision()
         except Exception as e:
-            logger.error("Failed to get current revision: %s", str(e))
+            logger.error("Failed to get current revision: %s", e)
             return None
 
-    def get_migration_history(self) -> List[dict]:
+    def get_migration_history(self, limit: Optional[int] = None) -> List[dict]:
         """
-        Get the migration history.
+        Get the migration history, newest first.
+
+        Args:
+            limit: Maximum number of migrations to return (all if None)
 
         Returns:
             List[dict]: List of migration information dictionaries
@@ -262,6 +281,8 @@ class MigrationManager:
 
             history = []
             for revision in script_dir.walk_revisions():
+                if limit is not None and len(history) >= limit:
+                    break
                 history.append(
                     {
                         "revision": revision.revision,
@@ -274,37 +295,75 @@ class MigrationManager:
             return history
 
         except Exception as e:
-            logger.error("Failed to get migration history: %s", str(e))
+            logger.error("Failed to get migration history: %s", e)
             return []
 
+    def clear_applied_cache(self) -> None:
+        """Forget the cached set of applied revisions."""
+
+        self._applied_cache = None
+
+    def _load_applied_revisions(self, script_dir: ScriptDirectory) -> frozenset[str]:
+        """
+        Load every applied revision with a single read of the alembic_version
+        table and cache the result.
+
+        alembic_version only stores the current heads, so the revisions below
+        them are resolved from the on-disk revision map without further queries.
+
+        Raises:
+            DatabaseException: If alembic_version contains duplicate revisions
+        """
+
+        if self._applied_cache is not None:
+            return self._applied_cache
+
+        sync_engine = self._get_sync_engine()
+        try:
+            with sync_engine.connect() as conn:
+                current_heads = MigrationContext.configure(conn).get_current_heads()
+        finally:
+            sync_engine.dispose()
+
+        if len(current_heads) != len(set(current_heads)):
+            raise DatabaseException(
+                message="Duplicate revisions found in alembic_version.",
+                error_code="DUPLICATE_MIGRATION_REVISIONS",
+                details=", ".join(current_heads),
+            )
+
+        applied = frozenset()
+        if current_heads:
+            applied = frozenset(
+                revision.revision
+                for revision in script_dir.iterate_revisions(current_heads, "base")
+            )
+
+        self._applied_cache = applied
+        return applied
+
     def check_pending_migrations(self) -> bool:
         """
         Check if there are pending migrations that haven't been applied.
 
+        The applied revisions are loaded once and cached; call
+        `clear_applied_cache()` after changing the schema to refresh them.
+
         Returns:
             bool: True if there are pending migrations, False otherwise
         """
-        sync_engine = None
         try:
             config = self._get_alembic_config()
             script_dir = ScriptDirectory.from_config(config)
 
-            # Use sync engine for migration checks
-            sync_engine = self._get_sync_engine()
-
-            with sync_engine.connect() as conn:
-                context = MigrationContext.configure(conn)
-                current_rev = context.get_current_revision()
-                head_rev = script_dir.get_current_head()
-
-                return current_rev != head_rev
+            on_disk = {revision.revision for revision in script_dir.walk_revisions()}
+            return bool(on_disk - self._load_applied_revisions(script_dir))
 
+        except DatabaseException:
+            raise
         except Exception as e:
             logger.error("Failed to check pending migrations: %s", e)
             return False
-        finally:
-            if "sync_engine" in locals() and sync_engine is not None:
-                sync_engine.dispose()
 
     def show_current_info(self) -> dict:
         """
@@ -320,7 +379,7 @@ class MigrationManager:
         return {
             "current_revision": current_rev,
             "has_pending_migrations": pending,
-            "database_url": str(settings.database.DATABASE_URL.get_secret_value()),
+            "database_url": _get_database_url(),
             "migrations_path": str(self._migrations_path),
         }
 
@@ -361,34 +420,28 @@ class MigrationSetup:
             versions_path = self._migrations_path / "versions"
             versions_path.mkdir(exist_ok=True)
 
-            # Create __init__.py files
-            (self._migrations_path / "__init__.py").touch()
-            (versions_path / "__init__.py").touch()
-
-            # Create env.py
-            env_file = self._migrations_path / "env.py"
-            if not env_file.exists():
-                with open(env_file, "w", encoding="utf-8") as f:
-                    f.write(ALEMBIC_ENV_TEMPLATE)
-
-            logger.debug("The alembic env file '.env.py' has been created")
-
-            # Create alembic.ini in project root
-            project_root = Path.cwd()
-            alembic_ini = project_root / "alembic.ini"
-            if not alembic_ini.exists():
-                with open(alembic_ini, "w", encoding="utf-8") as f:
-                    f.write(ALEMBIC_INI_TEMPLATE)
-
-            logger.debug("The alembic ini file 'alembic.ini' has been created")
-
-            # Create script.py.mako if it doesn't exist
-            script_template = self._migrations_path / "script.py.mako"
-            if not script_template.exists():
-                with open(script_template, "w", encoding="utf-8") as f:
-                    f.write(SCRIPT_TEMPLATE)
-
-            logger.debug("The alembic script file 'script.py.mako' has been created")
+            # Create __init__.py files, env.py, alembic.ini (in project root) and
+            # script.py.mako. The writes are independent so issue them concurrently.
+            files_to_create = [
+                (self._migrations_path / "__init__.py", ""),
+                (versions_path / "__init__.py", ""),
+                (self._migrations_path / "env.py", ALEMBIC_ENV_TEMPLATE),
+                (Path.cwd() / "alembic.ini", ALEMBIC_INI_TEMPLATE),
+                (self._migrations_path / "script.py.mako", SCRIPT_TEMPLATE),
+            ]
+
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [
+                    executor.submit(self._create_file_if_not_exists, path, content)
+                    for path, content in files_to_create
+                ]
+                for future in futures:
+                    future.result()
+
+            logger.debug(
+                "Alembic files ensured: %s",
+                ", ".join(path.name for path, _ in files_to_create),
+            )
 
             logger.info(f"Migration infrastructure set up at {self._migrations_path}")
 
@@ -398,7 +451,7 @@ class MigrationSetup:
                 message="An error occurred during the setting up of the migration "
                 "infrastructure.",
                 error_code="SETUP_MIGRATION_INFRA_FAILED",
-                stack_trace=str(e),
+                stack_trace=e,
             ) from e
 
     @staticmethod
@@ -406,5 +459,5 @@ class MigrationSetup:
         """Atomically create a file if it doesn't exist."""
         if not file_path.exists():
             temp_file = file_path.with_suffix(".tmp")
-            temp_file.write_text(content)
+            temp_file.write_text(content, encoding="utf-8")
             temp_file.rename(file_path)
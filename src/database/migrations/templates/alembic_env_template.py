@@ -27,7 +27,8 @@ from src.config.settings import settings
 
 # Add the project root to Python path
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-sys.path.insert(0, project_root)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 # Alembic Config object
 config = context.config
@@ -67,6 +68,9 @@ def do_run_migrations(connection: Connection) -> None:
         target_metadata=target_metadata,
         compare_type=True,
         compare_server_default=True,
+        # Apply every pending revision inside one transaction (one COMMIT)
+        transactional_ddl=config.get_main_option("transactional_ddl", "true") == "true",
+        transaction_per_migration=False,
     )
     with context.begin_transaction():
         context.run_migrations()
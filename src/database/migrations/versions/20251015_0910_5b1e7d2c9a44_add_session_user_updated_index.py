@@ -0,0 +1,34 @@
+"""Add session user updated index
+
+Revision ID: 5b1e7d2c9a44
+Revises: c4738d0420fe
+Create Date: 2025-10-15 09:10:42.113204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '5b1e7d2c9a44'
+down_revision: Union[str, None] = 'c4738d0420fe'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_session_user_updated',
+        'chat_session',
+        ['user_id', sa.text('updated_at DESC')],
+        unique=False,
+        postgresql_include=['title', 'total_messages'],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        'idx_session_user_updated', table_name='chat_session', if_exists=True
+    )
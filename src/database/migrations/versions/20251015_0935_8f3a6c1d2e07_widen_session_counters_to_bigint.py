@@ -0,0 +1,51 @@
+"""Widen session counters to bigint
+
+Revision ID: 8f3a6c1d2e07
+Revises: 5b1e7d2c9a44
+Create Date: 2025-10-15 09:35:17.502318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '8f3a6c1d2e07'
+down_revision: Union[str, None] = '5b1e7d2c9a44'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'chat_session',
+        'total_messages',
+        existing_type=sa.Integer(),
+        type_=sa.BigInteger(),
+        existing_nullable=False,
+    )
+    op.alter_column(
+        'chat_session',
+        'total_tokens',
+        existing_type=sa.Integer(),
+        type_=sa.BigInteger(),
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'chat_session',
+        'total_tokens',
+        existing_type=sa.BigInteger(),
+        type_=sa.Integer(),
+        existing_nullable=False,
+    )
+    op.alter_column(
+        'chat_session',
+        'total_messages',
+        existing_type=sa.BigInteger(),
+        type_=sa.Integer(),
+        existing_nullable=False,
+    )
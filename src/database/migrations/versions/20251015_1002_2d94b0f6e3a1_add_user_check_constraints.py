@@ -0,0 +1,47 @@
+"""Add user check constraints
+
+Revision ID: 2d94b0f6e3a1
+Revises: 8f3a6c1d2e07
+Create Date: 2025-10-15 10:02:08.640915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '2d94b0f6e3a1'
+down_revision: Union[str, None] = '8f3a6c1d2e07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# `db init` creates the tables with Base.metadata.create_all, which already
+# adds these constraints from User.__table_args__, so only add missing ones
+CHECK_CONSTRAINTS = (
+    ('check_email_format', "email ~* '^[^@]+@[^@]+\\.[^@]+$'"),
+    ('check_positive_tokens_used', 'total_tokens_used >= 0'),
+)
+
+
+def upgrade() -> None:
+    for name, condition in CHECK_CONSTRAINTS:
+        op.execute(
+            f"""
+            DO $$
+            BEGIN
+                IF NOT EXISTS (
+                    SELECT 1 FROM pg_constraint
+                    WHERE conname = '{name}' AND conrelid = '"user"'::regclass
+                ) THEN
+                    ALTER TABLE "user" ADD CONSTRAINT {name} CHECK ({condition});
+                END IF;
+            END $$
+            """
+        )
+
+
+def downgrade() -> None:
+    for name, _ in reversed(CHECK_CONSTRAINTS):
+        op.execute(f'ALTER TABLE "user" DROP CONSTRAINT IF EXISTS {name}')
@@ -0,0 +1,73 @@
+"""Add upload session table
+
+Revision ID: 7c2e9a41b5d3
+Revises: 2d94b0f6e3a1
+Create Date: 2025-10-15 11:20:31.284519
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '7c2e9a41b5d3'
+down_revision: Union[str, None] = '2d94b0f6e3a1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # `db init` may already have created the table with create_all
+    op.create_table(
+        'upload_session',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('user_id', sa.UUID(), nullable=False),
+        sa.Column('storage_key', sa.String(length=512), nullable=False),
+        sa.Column('filename', sa.String(length=255), nullable=False),
+        sa.Column('content_type', sa.String(length=255), nullable=False),
+        sa.Column('size', sa.BigInteger(), nullable=False),
+        sa.Column('status', sa.String(length=16), nullable=False),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            'created_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=True,
+        ),
+        sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.CheckConstraint('size >= 0', name='check_upload_size_positive'),
+        sa.CheckConstraint(
+            "status IN ('pending', 'committed')", name='check_upload_status'
+        ),
+        sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('storage_key'),
+        if_not_exists=True,
+    )
+    op.create_index(
+        'idx_upload_session_user',
+        'upload_session',
+        ['user_id'],
+        unique=False,
+        if_not_exists=True,
+    )
+    op.create_index(
+        'idx_upload_session_status_expires',
+        'upload_session',
+        ['status', 'expires_at'],
+        unique=False,
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        'idx_upload_session_status_expires',
+        table_name='upload_session',
+        if_exists=True,
+    )
+    op.drop_index(
+        'idx_upload_session_user', table_name='upload_session', if_exists=True
+    )
+    op.drop_table('upload_session', if_exists=True)
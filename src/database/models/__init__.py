@@ -8,6 +8,7 @@ declarative Base before being used in migrations, seeding, or database setup.
 from .user_model import User
 from .plan_model import Plan
 from .chat_session_model import ChatSession
+from .upload_session_model import UploadSession
 
 # from .document_model import Document
 # from .chat_message_model import ChatMessage
@@ -17,6 +18,7 @@ __all__ = [
     "User",
     "Plan",
     "ChatSession",
+    "UploadSession",
     # "Document",
     # "ChatMessage",
     # "UsageStats",
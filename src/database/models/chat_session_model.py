@@ -3,17 +3,17 @@ Represents individual conversation sessions between users and the AI assistant.
 """
 
 import uuid
+from datetime import datetime
 from decimal import Decimal
+from typing import TYPE_CHECKING, Optional
 
 from sqlalchemy import (
     Boolean,
     BigInteger,
-    Column,
     Date,
     DateTime,
     Enum,
     ForeignKey,
-    Integer,
     String,
     Text,
     DECIMAL,
@@ -21,13 +21,18 @@ from sqlalchemy import (
     Index,
     UniqueConstraint,
     CheckConstraint,
+    update,
 )
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship, validates
-from sqlalchemy.sql import func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
+from sqlalchemy.sql import func, text
 
 from src.database.models.base_model import Base
 
+if TYPE_CHECKING:
+    from src.database.models.user_model import User
+
 
 class ChatSession(Base):
     """
@@ -53,21 +58,25 @@ class ChatSession(Base):
 
     __tablename__ = "chat_session"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("user.id", ondelete="CASCADE"), nullable=False
     )
-    title = Column(String(255), nullable=True)
-    description = Column(Text, nullable=True)
-    total_messages = Column(Integer, nullable=False, default=0)
-    total_tokens = Column(Integer, nullable=False, default=0)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(
+    title: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    total_messages: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    total_tokens: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
     # Relationships
-    user = relationship("User", back_populates="chat_sessions")
+    user: Mapped["User"] = relationship(back_populates="chat_sessions")
     """documents = relationship(
         "Document", back_populates="session", cascade="all, delete-orphan"
     )
@@ -80,7 +89,51 @@ class ChatSession(Base):
         CheckConstraint("total_messages >= 0", name="check_positive_message_count"),
         CheckConstraint("total_tokens >= 0", name="check_positive_token_count"),
         Index("idx_session_user_created", "user_id", "created_at"),
+        # Covers "most recently active sessions" listings as an index-only scan
+        Index(
+            "idx_session_user_updated",
+            "user_id",
+            text("updated_at DESC"),
+            postgresql_include=["title", "total_messages"],
+        ),
     )
 
+    # Validation
+    @validates("title")
+    def validate_title(self, key, title):
+        """Reject titles longer than the column allows before hitting the DB"""
+        if title is not None and len(title) > 255:
+            raise ValueError("Session title cannot exceed 255 characters")
+        return title
+
+    @classmethod
+    async def increment_counters(
+        cls,
+        session: AsyncSession,
+        session_id: uuid.UUID,
+        n_msgs: int = 0,
+        n_tokens: int = 0,
+    ) -> None:
+        """
+        Atomically add to the cached message and token counters of a session.
+
+        The increment is applied server-side in a single UPDATE, so no
+        read-modify-write round-trip (or row lock held across one) is needed.
+
+        Args:
+            session: The active database session
+            session_id: ID of the chat session to update
+            n_msgs: Number of messages to add
+            n_tokens: Number of tokens to add
+        """
+        await session.execute(
+            update(cls)
+            .where(cls.id == session_id)
+            .values(
+                total_messages=cls.total_messages + n_msgs,
+                total_tokens=cls.total_tokens + n_tokens,
+            )
+        )
+
     def __repr__(self):
         return f"<ChatSession(title='{self.title}', messages={self.total_messages})>"
@@ -0,0 +1,77 @@
+"""
+Tracks files that clients upload straight to storage through a signed URL.
+"""
+
+import uuid
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import BigInteger, CheckConstraint, DateTime, ForeignKey, Index, String
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from src.database.models.base_model import Base
+
+UPLOAD_PENDING = "pending"
+UPLOAD_COMMITTED = "committed"
+
+
+class UploadSession(Base):
+    """
+    A session is recorded as pending when the signed upload URL is handed out,
+    and committed once storage confirms the file is there. Pending sessions
+    that outlive their URL are cleaned up along with any stray object.
+
+    Attributes:
+        id: The ID of the uploaded file
+        user_id: Reference to the file owner
+        storage_key: Key the file is uploaded to
+        filename: Sanitized name of the file
+        content_type: MIME type the client uploads with
+        size: Declared size of the file in bytes
+        status: "pending" until the upload is confirmed, then "committed"
+        expires_at: When the signed upload URL stops being valid
+        created_at: Session creation time
+        completed_at: When the upload was confirmed
+    """
+
+    __tablename__ = "upload_session"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("user.id", ondelete="CASCADE"), nullable=False
+    )
+    storage_key: Mapped[str] = mapped_column(String(512), unique=True, nullable=False)
+    filename: Mapped[str] = mapped_column(String(255), nullable=False)
+    content_type: Mapped[str] = mapped_column(String(255), nullable=False)
+    size: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    status: Mapped[str] = mapped_column(
+        String(16), nullable=False, default=UPLOAD_PENDING
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    completed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+    # Constraints
+    __table_args__ = (
+        CheckConstraint("size >= 0", name="check_upload_size_positive"),
+        CheckConstraint(
+            f"status IN ('{UPLOAD_PENDING}', '{UPLOAD_COMMITTED}')",
+            name="check_upload_status",
+        ),
+        Index("idx_upload_session_user", "user_id"),
+        # Finds the expired pending sessions to clean up
+        Index("idx_upload_session_status_expires", "status", "expires_at"),
+    )
+
+    def __repr__(self):
+        return f"<UploadSession(filename='{self.filename}', status='{self.status}')>"
@@ -3,23 +3,14 @@ Represents user accounts with authentication and subscription information.
 """
 
 import uuid
-from decimal import Decimal
 
 from sqlalchemy import (
     Boolean,
     BigInteger,
     Column,
-    Date,
     DateTime,
-    Enum,
     ForeignKey,
-    Integer,
     String,
-    Text,
-    DECIMAL,
-    JSON,
-    Index,
-    UniqueConstraint,
     CheckConstraint,
 )
 from sqlalchemy.dialects.postgresql import UUID
@@ -28,6 +19,8 @@ from sqlalchemy.sql import func
 
 from src.database.models.base_model import Base
 
+__all__ = ["User"]
+
 
 class User(Base):
     """
@@ -84,20 +77,19 @@ class User(Base):
         "UsageStats", back_populates="user", cascade="all, delete-orphan"
     )"""
 
-    # Validation
+    # Constraints
+    __table_args__ = (
+        CheckConstraint(
+            "email ~* '^[^@]+@[^@]+\\.[^@]+$'", name="check_email_format"
+        ),
+        CheckConstraint("total_tokens_used >= 0", name="check_positive_tokens_used"),
+    )
+
+    # Normalization (format is validated by the API schemas and the DB constraint)
     @validates("email")
-    def validate_email(self, key, email):
-        """Basic email validation"""
-        if "@" not in email or "." not in email.split("@")[1]:
-            raise ValueError("Invalid email format")
+    def normalize_email(self, key, email):
+        """Store emails in lowercase so lookups are case-insensitive"""
         return email.lower()
 
-    @validates("total_tokens_used")
-    def validate_tokens(self, key, tokens):  # TODO: ADD BETTER VALIDATION
-        """Ensure token count is non-negative"""
-        if tokens < 0:
-            raise ValueError("Token count cannot be negative")
-        return tokens
-
     def __repr__(self):
         return f"<User(username='{self.username}', email='{self.email}')>"
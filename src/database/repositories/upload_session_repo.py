@@ -0,0 +1,103 @@
+"""
+This module provides the repository class for interacting with the
+`UploadSession` model.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from fastapi import Depends
+from sqlalchemy import bindparam, delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.db_manager import get_db_session
+from src.database.models.upload_session_model import (
+    UPLOAD_COMMITTED,
+    UPLOAD_PENDING,
+    UploadSession,
+)
+
+_SELECT_USER_UPLOAD = select(UploadSession).where(
+    UploadSession.id == bindparam("file_id"),
+    UploadSession.user_id == bindparam("user_id"),
+)
+
+
+class UploadSessionRepository:
+    """
+    Repository for performing database operations on the UploadSession model.
+
+    Responsibilities:
+        - Record pending direct uploads and confirm them.
+        - Find pending uploads whose signed URL has expired.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def create(self, session_data: Dict[str, Any]) -> UploadSession:
+        """Record a new pending upload, returning it with server defaults."""
+        stmt = insert(UploadSession).values(status=UPLOAD_PENDING, **session_data)
+        result = await self.db.execute(stmt.returning(UploadSession))
+        return result.scalar_one()
+
+    async def get_for_user(
+        self, file_id: UUID, user_id: UUID
+    ) -> Optional[UploadSession]:
+        """Retrieve an upload session, only if it belongs to the given user."""
+        result = await self.db.execute(
+            _SELECT_USER_UPLOAD, {"file_id": file_id, "user_id": user_id}
+        )
+        return result.scalars().first()
+
+    async def mark_committed(
+        self, file_id: UUID, completed_at: datetime
+    ) -> Optional[UploadSession]:
+        """
+        Flip a pending upload to committed and return it.
+
+        Returns None if the upload is not pending, so a confirmation racing
+        another one or the cleanup cannot commit it twice.
+        """
+        stmt = (
+            update(UploadSession)
+            .where(UploadSession.id == file_id, UploadSession.status == UPLOAD_PENDING)
+            .values(status=UPLOAD_COMMITTED, completed_at=completed_at)
+            .returning(UploadSession)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalars().first()
+
+    async def get_expired_pending(
+        self, now: datetime, limit: int = 100
+    ) -> List[UploadSession]:
+        """Retrieve pending uploads whose signed URL expired before `now`."""
+        stmt = (
+            select(UploadSession)
+            .where(
+                UploadSession.status == UPLOAD_PENDING,
+                UploadSession.expires_at < now,
+            )
+            .order_by(UploadSession.expires_at)
+            .limit(limit)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalars().all()
+
+    async def delete_pending(self, file_ids: List[UUID]) -> None:
+        """Delete the given upload sessions if they are still pending."""
+        await self.db.execute(
+            delete(UploadSession).where(
+                UploadSession.id.in_(file_ids),
+                UploadSession.status == UPLOAD_PENDING,
+            )
+        )
+
+
+async def get_upload_session_repository(
+    session: AsyncSession = Depends(get_db_session),
+) -> UploadSessionRepository:
+    """FastAPI dependency for an `UploadSessionRepository`."""
+    return UploadSessionRepository(session)
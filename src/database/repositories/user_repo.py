@@ -3,14 +3,74 @@ This module provides the repository class for interacting with the `User`
 model.
 """
 
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 from uuid import UUID
 
-from sqlalchemy import select, update, delete, func
+from fastapi import Depends, Request
+from sqlalchemy import bindparam, insert, select, update, delete, exists, func
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, raiseload, selectinload
+from sqlalchemy.sql.elements import ColumnElement
 
+from src.database.db_manager import get_db_session
 from src.database.models.user_model import User
 
+# Per-request identity cache, keyed by (lookup field, value)
+UserCache = Dict[Tuple[str, Any], User]
+
+# Prebuilt statements for the hot lookups. They are constructed once and only
+# the bound values change per call, so SQLAlchemy reuses the compiled SQL.
+_SELECT_USER_BY_ID = (
+    select(User)
+    .where(User.id == bindparam("user_id"))
+    .options(
+        joinedload(User.plan),
+        selectinload(User.chat_sessions),
+        raiseload("*"),
+    )
+)
+_SELECT_USER_BY_ID_LEAN = select(User).where(User.id == bindparam("user_id"))
+_SELECT_USER_BY_EMAIL = select(User).where(User.email == bindparam("user_email"))
+_USER_EXISTS = select(exists().where(User.id == bindparam("user_id")))
+_SELECT_AUTH_PAYLOAD = select(User.id, User.hashed_password, User.is_active).where(
+    User.email == bindparam("user_email")
+)
+
+
+@lru_cache(maxsize=128)
+def _criteria_clauses(
+    criteria_key: Tuple[Tuple[str, bool], ...],
+) -> Tuple[ColumnElement[bool], ...]:
+    """
+    Build (and cache) the WHERE clauses for a set of criteria fields.
+
+    Args:
+        criteria_key: Sorted (field, is_null) pairs describing the criteria.
+
+    Returns:
+        Tuple of clauses using a bind parameter named after each field.
+    """
+    return tuple(
+        (
+            getattr(User, field).is_(None)
+            if is_null
+            else getattr(User, field) == bindparam(field)
+        )
+        for field, is_null in criteria_key
+    )
+
+
+def _criteria_filter(
+    criteria: Dict[str, Any],
+) -> Tuple[Tuple[ColumnElement[bool], ...], Dict[str, Any]]:
+    """Return the cached WHERE clauses and bind values for the given criteria."""
+    criteria_key = tuple(
+        sorted((field, value is None) for field, value in criteria.items())
+    )
+    params = {field: value for field, value in criteria.items() if value is not None}
+    return _criteria_clauses(criteria_key), params
+
 
 class UserRepository:
     """
@@ -22,53 +82,136 @@ class UserRepository:
         - Ensure consistent access patterns for the User entity.
     """
 
-    def __init__(self, db: AsyncSession) -> None:
+    def __init__(
+        self, db: AsyncSession, user_cache: Optional[UserCache] = None
+    ) -> None:
+        """
+        Args:
+            db: The session used for all queries.
+            user_cache: Optional per-request cache consulted by `get_by_id` and
+                `get_by_email`. Caching is disabled when not provided.
+        """
         self.db = db
+        self.user_cache = user_cache
 
-    async def create(self, user_data: Dict[str, Any]) -> User:
-        """Create and persist a new user."""
-        user = User(**user_data)
-        self.db.add(user)
-        await self.db.flush()  # Persist without committing yet
+    def _clear_user_cache(self) -> None:
+        """Drop cached users after a mutation so later lookups hit the DB."""
+        if self.user_cache is not None:
+            self.user_cache.clear()
+
+    async def _get_cached(
+        self, key: Tuple[str, Any], stmt, params: Dict[str, Any]
+    ) -> Optional[User]:
+        """Return the cached user for `key`, querying and caching it on a miss."""
+        if self.user_cache is not None and key in self.user_cache:
+            return self.user_cache[key]
+
+        result = await self.db.execute(stmt, params)
+        user = result.scalars().first()
+
+        if user is not None and self.user_cache is not None:
+            self.user_cache[key] = user
         return user
 
+    @staticmethod
+    def _prepare_insert_values(user_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Apply the model's normalization to raw insert values.
+
+        INSERT statements bypass the ORM `@validates` hooks, so the email is
+        lowercased here to match what `User` would store.
+        """
+        if user_data.get("email") is None:
+            return dict(user_data)
+        return {**user_data, "email": user_data["email"].lower()}
+
+    async def create(self, user_data: Dict[str, Any]) -> User:
+        """
+        Create and persist a new user.
+
+        Uses INSERT ... RETURNING so server generated values (e.g. timestamps)
+        come back in the same round-trip, without a follow-up refresh.
+        """
+        stmt = insert(User).values(**self._prepare_insert_values(user_data))
+        result = await self.db.execute(stmt.returning(User))
+        return result.scalar_one()
+
     async def get_by_id(self, user_id: UUID) -> Optional[User]:
-        """Retrieve a user by primary key."""
-        result = await self.db.execute(select(User).where(User.id == user_id))
+        """
+        Retrieve a user by primary key along with their plan and chat sessions.
+
+        Any other relationship access on the result raises instead of silently
+        issuing an extra query.
+        """
+        return await self._get_cached(
+            ("id", user_id), _SELECT_USER_BY_ID, {"user_id": user_id}
+        )
+
+    async def get_by_id_lean(self, user_id: UUID) -> Optional[User]:
+        """
+        Retrieve a user by primary key without eager loading relationships.
+
+        Intended for hot paths (e.g. authentication) that only need the user's
+        own columns; relationships are loaded lazily if accessed.
+        """
+        result = await self.db.execute(_SELECT_USER_BY_ID_LEAN, {"user_id": user_id})
         return result.scalars().first()
 
     async def get_by_email(self, user_email: str) -> Optional[User]:
         """Retrieve a user by email address."""
-        result = await self.db.execute(select(User).where(User.email == user_email))
-        return result.scalars().first()
+        return await self._get_cached(
+            ("email", user_email), _SELECT_USER_BY_EMAIL, {"user_email": user_email}
+        )
+
+    async def get_auth_payload(
+        self, user_email: str
+    ) -> Optional[Tuple[UUID, str, bool]]:
+        """
+        Retrieve only the columns needed to authenticate a user.
+
+        Returns a plain row of (id, hashed_password, is_active) without building
+        a `User` entity, or None if no user has the given email.
+        """
+        result = await self.db.execute(_SELECT_AUTH_PAYLOAD, {"user_email": user_email})
+        return result.first()
 
     async def get_by_criteria(self, criteria: Dict[str, Any]) -> Optional[User]:
         """Retrieve the first user matching given criteria."""
-        stmt = select(User)
-        for field, value in criteria.items():
-            stmt = stmt.where(getattr(User, field) == value)
-        result = await self.db.execute(stmt)
+        clauses, params = _criteria_filter(criteria)
+        result = await self.db.execute(select(User).where(*clauses), params)
         return result.scalars().first()
 
     async def update(self, user_id: UUID, data: Dict[str, Any]) -> Optional[User]:
-        """Update fields on a user and return the updated instance."""
-        stmt = update(User).where(User.id == user_id).values(**data).returning(User)
+        """
+        Update fields on a user and return the updated instance.
+
+        A user already loaded in the session (e.g. through the per-request
+        cache) is refreshed from the RETURNING row instead of being returned
+        with its stale values.
+        """
+        stmt = (
+            update(User)
+            .where(User.id == user_id)
+            .values(**data)
+            .returning(User)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
         result = await self.db.execute(stmt)
+        self._clear_user_cache()
         return result.scalars().first()
 
     async def delete(self, user_id: UUID) -> None:
         """Delete a user by ID."""
         await self.db.execute(delete(User).where(User.id == user_id))
+        self._clear_user_cache()
 
     async def get_all_by_criteria(self, criteria: Dict[str, Any]) -> List[User]:
         """Retrieve all users matching given criteria."""
-        stmt = select(User)
-        for field, value in criteria.items():
-            stmt = stmt.where(getattr(User, field) == value)
-        result = await self.db.execute(stmt)
+        clauses, params = _criteria_filter(criteria)
+        result = await self.db.execute(select(User).where(*clauses), params)
         return result.scalars().all()
 
-    async def exists(self, user_id: UUID) -> Optional[User]:
+    async def exists(self, user_id: UUID) -> bool:
         """
         Check whether a user exists with the given ID.
 
@@ -78,28 +221,54 @@ class UserRepository:
         Returns:
             bool: True if the user exists, False otherwise.
         """
-        stmt = select(1).where(User.id == user_id)
-        result = await self.db.execute(stmt)
-        return result.first() is not None
+        return bool(await self.db.scalar(_USER_EXISTS, {"user_id": user_id}))
+
+    async def get_id_if_exists(self, criteria: Dict[str, Any]) -> Optional[UUID]:
+        """
+        Retrieve only the ID of the first user matching the given criteria.
+
+        Cheaper than `get_by_criteria` when the caller just needs to verify a
+        user and reference it, as no `User` entity is hydrated.
+        """
+        clauses, params = _criteria_filter(criteria)
+        return await self.db.scalar(select(User.id).where(*clauses).limit(1), params)
 
     async def count(self, criteria: Dict[str, Any]) -> int:
         """Count number of users matching criteria."""
-        stmt = select(func.count()).select_from(User)
-        for field, value in criteria.items():
-            stmt = stmt.where(getattr(User, field) == value)
-        result = await self.db.execute(stmt)
+        clauses, params = _criteria_filter(criteria)
+        stmt = select(func.count()).select_from(User).where(*clauses)
+        result = await self.db.execute(stmt, params)
         return result.scalar_one()
 
     async def create_many(self, users: Sequence[Dict[str, Any]]) -> List[User]:
-        """Bulk insert multiple users."""
-        user_objs = [User(**data) for data in users]
-        self.db.add_all(user_objs)
-        await self.db.flush()
-        return user_objs
+        """Bulk insert multiple users using batched multi-row INSERT ... RETURNING."""
+        if not users:
+            return []
+        rows = [self._prepare_insert_values(data) for data in users]
+        result = await self.db.scalars(insert(User).returning(User), rows)
+        return result.all()
+
+    async def insert_many(self, users: Sequence[Dict[str, Any]]) -> int:
+        """
+        Bulk insert multiple users through Core without loading them back.
+
+        Use this over `create_many` when the caller does not need the created
+        `User` instances.
+
+        Returns:
+            int: The number of rows inserted.
+        """
+        if not users:
+            return 0
+        rows = [self._prepare_insert_values(data) for data in users]
+        connection = await self.db.connection()
+        await connection.execute(insert(User), rows)
+        return len(rows)
 
     async def delete_many(self, user_ids: Sequence[UUID]) -> None:
         """Delete multiple users by IDs."""
         await self.db.execute(delete(User).where(User.id.in_(user_ids)))
+        self._clear_user_cache()
 
     async def get_with_pagination(
         self, page: int, limit: int, criteria: Dict[str, Any]
@@ -107,18 +276,52 @@ class UserRepository:
         """
         Retrieve users with pagination.
 
+        The total is computed with a `count(*) OVER ()` window alongside the
+        page rows, so both come back in a single round-trip.
+
         Returns:
             (list_of_users, total_count).
         """
-        stmt = select(User)
-        for field, value in criteria.items():
-            stmt = stmt.where(getattr(User, field) == value)
+        clauses, params = _criteria_filter(criteria)
 
-        total_result = await self.db.execute(
-            select(func.count()).select_from(User).filter(*stmt._where_criteria)
+        stmt = (
+            select(User, func.count().over().label("total"))
+            .where(*clauses)
+            .offset((page - 1) * limit)
+            .limit(limit)
         )
-        total = total_result.scalar_one()
+        rows = (await self.db.execute(stmt, params)).all()
+
+        if not rows:
+            # A page past the end carries no window value to read the total from
+            total = await self.count(criteria) if page > 1 else 0
+            return [], total
+
+        users = [row[0] for row in rows]
+        return users, rows[0].total
 
-        result = await self.db.execute(stmt.offset((page - 1) * limit).limit(limit))
-        users = result.scalars().all()
-        return users, total
+
+def get_request_user_cache(request: Request) -> UserCache:
+    """
+    FastAPI dependency returning the user cache scoped to the current request.
+
+    The cache lives on `request.state`, so it is discarded with the request and
+    never needs cross-request invalidation.
+    """
+    user_cache = getattr(request.state, "user_cache", None)
+    if user_cache is None:
+        user_cache = {}
+        request.state.user_cache = user_cache
+    return user_cache
+
+
+async def get_user_repository(
+    session: AsyncSession = Depends(get_db_session),
+    user_cache: UserCache = Depends(get_request_user_cache),
+) -> UserRepository:
+    """
+    FastAPI dependency for a `UserRepository` backed by the per-request cache.
+
+    Override `get_request_user_cache` in tests to disable or inspect caching.
+    """
+    return UserRepository(session, user_cache=user_cache)
@@ -2,11 +2,20 @@
 Database logger
 """
 
-import json
+import atexit
+import datetime as dt
 import logging
+import queue
+import threading
+import time
+from collections import deque
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional
 
+import orjson
+
 from src.config.settings import settings
 from src.logger.log_format import DatabaseStandardLog, DatabaseErrorLog
 from src.logger.logging_utils import LogLevel
@@ -14,6 +23,7 @@ from src.logger.logging_utils import LogLevel
 # TODO: USE THE DATABASE LOGGER IN THE DATABASE LAYER INSTEAD OF THE REGULAR LOGGER
 
 
+@lru_cache(maxsize=1024)
 def sanitize_path(path: str, project_root: str = "DocuChatAPI") -> str:
     """
     Shorten file paths so they start from the project root (e.g., 'DocuChatAPI/...').
@@ -21,11 +31,35 @@ def sanitize_path(path: str, project_root: str = "DocuChatAPI") -> str:
     if not path:
         return path
     path = Path(path).as_posix()
-    if project_root in path:
-        return path[path.index(project_root) :]
+    root_index = path.find(project_root)
+    if root_index != -1:
+        return path[root_index:]
     return path
 
 
+# (epoch second, "YYYY-MM-DDTHH:MM:SS", UTC offset) for the last formatted second
+_timestamp_cache: tuple[int, str, str] = (-1, "", "")
+
+
+def log_timestamp() -> str:
+    """
+    Return the current local time as an ISO-8601 string with microseconds.
+
+    The date/time and UTC offset parts are only recomputed when the wall-clock
+    second changes; within a second only the fractional part is formatted.
+    """
+    global _timestamp_cache
+
+    second, remainder = divmod(time.time_ns(), 1_000_000_000)
+    cached_second, prefix, offset = _timestamp_cache
+    if second != cached_second:
+        stamp = dt.datetime.fromtimestamp(second).astimezone()
+        prefix = stamp.strftime("%Y-%m-%dT%H:%M:%S")
+        offset = stamp.isoformat()[19:]
+        _timestamp_cache = (second, prefix, offset)
+    return f"{prefix}.{remainder // 1000:06d}{offset}"
+
+
 def sanitize_traceback(tb: str, project_root: str = "DocuChatAPI") -> str:
     """
     Shorten all file paths inside a traceback string.
@@ -37,66 +71,171 @@ def sanitize_traceback(tb: str, project_root: str = "DocuChatAPI") -> str:
 
 class JsonFileHandler(logging.Handler):
     """
-    Logging handler that writes logs as a JSON list in a file.
-    Ensures files exist and maintains logs under {"logs": [...]}.
+    Logging handler that appends logs to a file as JSON Lines (one JSON object
+    per line).
+
+    Entries are buffered in memory and written through a persistently open file
+    handle once `flush_every` entries are pending. A background thread also
+    flushes every `flush_interval` seconds, so a quiet log never holds entries
+    back, and ERROR and above are written immediately. Pending entries are
+    written on close.
     """
 
-    def __init__(self, filename: Path):
+    def __init__(
+        self, filename: Path, flush_every: int = 50, flush_interval: float = 1.0
+    ):
         super().__init__()
         self.filename = filename
         self.filename.parent.mkdir(parents=True, exist_ok=True)
-        if not self.filename.exists():
-            self._write_logs([])
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._buffer: deque[str] = deque()
+        self._stream = self.filename.open("a", encoding="utf-8")
+        self._closing = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically,
+            name=f"JsonFileHandler-flush-{self.filename.name}",
+            daemon=True,
+        )
+        self._flusher.start()
+
+    def _flush_periodically(self) -> None:
+        while not self._closing.wait(self.flush_interval):
+            self.flush()
 
     def emit(self, record: logging.LogRecord):
         log_entry = record.msg
-        if isinstance(log_entry, (DatabaseStandardLog, DatabaseErrorLog)):
-            logs = self._read_logs()
-            logs.append(log_entry.model_dump())
-            self._write_logs(logs)
+        if isinstance(log_entry, dict):
+            self._buffer.append(orjson.dumps(log_entry, default=str).decode("utf-8"))
+            if len(self._buffer) >= self.flush_every or record.levelno >= logging.ERROR:
+                self.flush()
+
+    def flush(self) -> None:
+        """Write all buffered entries to the file in a single call."""
+        with self.lock:
+            if self._buffer and not self._stream.closed:
+                lines = [self._buffer.popleft() for _ in range(len(self._buffer))]
+                self._stream.write("\n".join(lines) + "\n")
+                self._stream.flush()
+
+    def close(self) -> None:
+        self._closing.set()
+        self._flusher.join()
+        with self.lock:
+            try:
+                self.flush()
+            finally:
+                self._stream.close()
+        super().close()
 
-    def _read_logs(self) -> list:
-        try:
-            with self.filename.open("r", encoding="utf-8") as f:
-                data = json.load(f)
-                return data.get("logs", [])
-        except (FileNotFoundError, json.JSONDecodeError):
-            return []
 
-    def _write_logs(self, logs: list) -> None:
-        with self.filename.open("w", encoding="utf-8") as f:
-            json.dump({"logs": logs}, f, indent=4, default=str)
+class DictQueueHandler(QueueHandler):
+    """
+    Queue handler that enqueues records untouched.
+
+    The default `QueueHandler.prepare` formats the record into a string, which
+    would discard the dict entries `JsonFileHandler` expects. The listener runs
+    in the same process, so the record can be passed through as-is.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
 
 
 class DatabaseLogger:
     """
-    Database logger that logs messages into standard-logs.json and error-logs.json.
+    Database logger that logs messages into standard-logs.jsonl and error-logs.jsonl.
+
+    Entries are built directly as plain dicts from the known log fields. When
+    `strict` is enabled they are additionally validated against the
+    `DatabaseStandardLog`/`DatabaseErrorLog` models, which is useful while
+    debugging but too costly for every log call. `strict` defaults to the
+    `VALIDATE_DATABASE_LOGS` logging setting.
+
+    Log calls only push the record onto a queue; a `QueueListener` thread
+    serializes and writes them, so callers on the event loop never block on
+    disk I/O. Call `stop()` on shutdown to drain the queue (it is also
+    registered with `atexit`).
     """
 
-    def __init__(self, source_file: str = __name__):
+    def __init__(self, source_file: str = __name__, strict: Optional[bool] = None):
         log_dir = Path(settings.database.DB_LOG_DIR)
         log_dir.mkdir(parents=True, exist_ok=True)
 
-        self.standard_handler = JsonFileHandler(log_dir / "standard-logs.json")
-        self.error_handler = JsonFileHandler(log_dir / "error-logs.json")
+        self.standard_handler = JsonFileHandler(log_dir / "standard-logs.jsonl")
+        self.standard_handler.addFilter(lambda record: not record.is_error)
+        self.error_handler = JsonFileHandler(log_dir / "error-logs.jsonl")
+        self.error_handler.addFilter(lambda record: record.is_error)
+
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._queue_handler = DictQueueHandler(self._queue)
+        self._listener = QueueListener(
+            self._queue, self.standard_handler, self.error_handler
+        )
+        self._listener.start()
+        self._stopped = False
+        atexit.register(self.stop)
 
         self.source_file = source_file
+        self._sanitized_source = sanitize_path(source_file) if source_file else None
+        self.strict = (
+            settings.logging.VALIDATE_DATABASE_LOGS if strict is None else strict
+        )
         self.logger = logging.getLogger(source_file)
         self.logger.setLevel(logging.DEBUG)
 
-    def _log(self, log_entry, is_error: bool = False):
-        """Internal helper to send log to the right file handler."""
-        handler = self.error_handler if is_error else self.standard_handler
+    def stop(self) -> None:
+        """Drain pending log records and close the file handlers."""
+        if self._stopped:
+            return
+        self._stopped = True
+        atexit.unregister(self.stop)
+        self._listener.stop()
+        self.standard_handler.close()
+        self.error_handler.close()
+
+    def _log(
+        self,
+        level: LogLevel,
+        message: str,
+        action: Optional[str] = None,
+        additional: Optional[dict] = None,
+        is_error: bool = False,
+        exception: Optional[Exception] = None,
+        traceback: Optional[str] = None,
+    ):
+        """Internal helper to build the log entry and send it to the right handler."""
+        levelno = logging.getLevelName(level.value)
+        if not self.logger.isEnabledFor(levelno):
+            return
+
+        log_entry = {
+            "timestamp": log_timestamp(),
+            "level": level.value,
+            "message": message,
+            "source_file": self._sanitized_source,
+            "action": action,
+            "additional": additional,
+        }
+        if is_error:
+            log_entry["exception"] = type(exception).__name__ if exception else None
+            log_entry["traceback"] = sanitize_traceback(traceback)
+
+        if self.strict:
+            model = DatabaseErrorLog if is_error else DatabaseStandardLog
+            log_entry = model(**log_entry).model_dump()
+
         record = logging.LogRecord(
             name=self.logger.name,
-            level=logging.INFO,
+            level=levelno,
             pathname="",
             lineno=0,
             msg=log_entry,
             args=(),
             exc_info=None,
         )
-        handler.emit(record)
+        record.is_error = is_error
+        self._queue_handler.handle(record)
 
     def debug(
         self,
@@ -105,14 +244,7 @@ class DatabaseLogger:
         additional: Optional[dict] = None,
     ):
         """Log a debug message (used for detailed development information)."""
-        log_entry = DatabaseStandardLog(
-            message=message,
-            level=LogLevel.DEBUG,
-            action=action,
-            additional=additional,
-            source_file=sanitize_path(self.source_file) if self.source_file else None,
-        )
-        self._log(log_entry, is_error=False)
+        self._log(LogLevel.DEBUG, message, action, additional)
 
     def info(
         self,
@@ -121,14 +253,7 @@ class DatabaseLogger:
         additional: Optional[dict] = None,
     ):
         """Log an informational message (used for normal operations)."""
-        log_entry = DatabaseStandardLog(
-            message=message,
-            level=LogLevel.INFO,
-            action=action,
-            additional=additional,
-            source_file=sanitize_path(self.source_file) if self.source_file else None,
-        )
-        self._log(log_entry, is_error=False)
+        self._log(LogLevel.INFO, message, action, additional)
 
     def warning(
         self,
@@ -137,14 +262,7 @@ class DatabaseLogger:
         additional: Optional[dict] = None,
     ):
         """Log a warning (used for unexpected situations that are not errors)."""
-        log_entry = DatabaseErrorLog(
-            message=message,
-            level=LogLevel.WARNING,
-            action=action,
-            additional=additional,
-            source_file=sanitize_path(self.source_file) if self.source_file else None,
-        )
-        self._log(log_entry, is_error=True)
+        self._log(LogLevel.WARNING, message, action, additional, is_error=True)
 
     def error(
         self,
@@ -155,16 +273,15 @@ class DatabaseLogger:
         additional: Optional[dict] = None,
     ):
         """Log an error (used when an operation fails)."""
-        log_entry = DatabaseErrorLog(
-            message=message,
-            level=LogLevel.ERROR,
-            source_file=sanitize_path(self.source_file) if self.source_file else None,
-            exception=type(exception).__name__ if exception else None,
-            traceback=sanitize_traceback(traceback),
-            action=action,
-            additional=additional,
+        self._log(
+            LogLevel.ERROR,
+            message,
+            action,
+            additional,
+            is_error=True,
+            exception=exception,
+            traceback=traceback,
         )
-        self._log(log_entry, is_error=True)
 
     def critical(
         self,
@@ -175,13 +292,12 @@ class DatabaseLogger:
         additional: Optional[dict] = None,
     ):
         """Log a critical error (used for severe issues that may crash the program)."""
-        log_entry = DatabaseErrorLog(
-            message=message,
-            level=LogLevel.CRITICAL,
-            source_file=sanitize_path(self.source_file) if self.source_file else None,
-            exception=type(exception).__name__ if exception else None,
-            traceback=sanitize_traceback(traceback),
-            action=action,
-            additional=additional,
+        self._log(
+            LogLevel.CRITICAL,
+            message,
+            action,
+            additional,
+            is_error=True,
+            exception=exception,
+            traceback=traceback,
         )
-        self._log(log_entry, is_error=True)
@@ -2,9 +2,12 @@
 Logger utility for the application with colorized console output.
 """
 
+import atexit
 import logging
 import os
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Optional, Type
 
 from src.config.settings import settings
@@ -46,29 +49,18 @@ def get_log_level(level: LogLevel) -> int:
     return level_mappings.get(level.upper(), 20)
 
 
-def get_logger(
-    name: str, log_dir: Optional[str] = settings.logging.LOG_DIRECTORY
-) -> logging.Logger:
-    """
-    Returns a configured logger that logs colorized messages to the console.
+# Resolved once from LOG_LEVEL and applied to the application's own loggers
+# (see get_logger). The root logger is left alone, so third-party libraries
+# keep their default threshold instead of building records at LOG_LEVEL.
+_LOG_LEVEL = get_log_level(settings.logging.LOG_LEVEL)
 
-    Args:
-        name (str): The logger name (usually __name__).
-        log_dir (Optional[str]): Directory path for logs (not used for now but
-        available for extension).
 
-    Returns:
-        logging.Logger: Configured logger instance.
+def _build_handlers(log_dir: Optional[str]) -> list[logging.Handler]:
+    """
+    Create the handlers that actually write log records (file or console).
     """
 
-    default_logger = logging.getLogger(name)
-
-    log_level = get_log_level(settings.logging.LOG_LEVEL)
-    default_logger.setLevel(log_level)
-
-    # Avoid duplicate handlers
-    if default_logger.handlers:
-        return default_logger
+    log_level = _LOG_LEVEL
 
     # Create formatters
     file_formatter = logging.Formatter(
@@ -91,25 +83,105 @@ def get_logger(
             file_handler = logging.FileHandler(app_log_path, encoding="utf-8")
             file_handler.setLevel(log_level)
             file_handler.setFormatter(file_formatter)
-            default_logger.addHandler(file_handler)
 
             # Error log file (errors only)
             error_log_path = os.path.join(log_dir, "error.log")
             error_handler = logging.FileHandler(error_log_path, encoding="utf-8")
             error_handler.setLevel(logging.ERROR)
             error_handler.setFormatter(file_formatter)
-            default_logger.addHandler(error_handler)
+
+            return [file_handler, error_handler]
         except ValueError:
             # Fallback to console if file logging fails
             console_handler = logging.StreamHandler(sys.stdout)
             console_handler.setFormatter(console_formatter)
-            default_logger.addHandler(console_handler)
-    else:
-        # CONSOLE LOGGING MODE
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(log_level)
-        console_handler.setFormatter(console_formatter)
-        default_logger.addHandler(console_handler)
+            return [console_handler]
+
+    # CONSOLE LOGGING MODE
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setLevel(log_level)
+    console_handler.setFormatter(console_formatter)
+    return [console_handler]
+
+
+# Loggers only enqueue records; the listener thread formats and writes them
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_handlers: Optional[list[logging.Handler]] = None
+_log_listener: Optional[QueueListener] = None
+
+
+def start_log_listener(
+    log_dir: Optional[str] = settings.logging.LOG_DIRECTORY,
+) -> None:
+    """
+    Start the listener thread that writes queued log records. Records queued
+    while the listener is stopped are written once it is started again.
+    """
+    global _log_handlers, _log_listener
+
+    if _log_listener is not None:
+        return
+    if _log_handlers is None:
+        _log_handlers = _build_handlers(log_dir)
+    _log_listener = QueueListener(
+        _log_queue, *_log_handlers, respect_handler_level=True
+    )
+    _log_listener.start()
+
+
+def stop_log_listener() -> None:
+    """
+    Stop the listener thread after writing all pending log records.
+    """
+    global _log_listener
+
+    if _log_listener is not None:
+        listener, _log_listener = _log_listener, None
+        listener.stop()
+
+    # Write records queued while no listener was running (e.g. after shutdown)
+    while True:
+        try:
+            record = _log_queue.get_nowait()
+        except queue.Empty:
+            break
+        for handler in _log_handlers or ():
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+atexit.register(stop_log_listener)
+
+
+def get_logger(
+    name: str, log_dir: Optional[str] = settings.logging.LOG_DIRECTORY
+) -> logging.Logger:
+    """
+    Returns a configured logger that logs colorized messages to the console.
+
+    Records are handed to a shared `QueueHandler`; the file/console handlers
+    run on the `QueueListener` thread, so logging calls don't block on I/O.
+
+    Args:
+        name (str): The logger name (usually __name__).
+        log_dir (Optional[str]): Directory path for logs (not used for now but
+        available for extension).
+
+    Returns:
+        logging.Logger: Configured logger instance.
+    """
+
+    default_logger = logging.getLogger(name)
+
+    log_level = _LOG_LEVEL
+    default_logger.setLevel(log_level)
+
+    # Avoid duplicate handlers
+    if default_logger.handlers:
+        return default_logger
+
+    start_log_listener(log_dir)
+    default_logger.addHandler(QueueHandler(_log_queue))
 
     return default_logger
 
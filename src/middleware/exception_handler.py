@@ -3,12 +3,82 @@ Global exception handler for structured error responses and logging.
 Handles both custom ApiException instances and unexpected errors.
 """
 
-from fastapi import Request, HTTPException, status, FastAPI
-from starlette.responses import JSONResponse
+import logging
+from functools import lru_cache
+from typing import Optional
+
+import orjson
+from fastapi import Request, status, FastAPI
+from starlette.exceptions import HTTPException
+from starlette.responses import JSONResponse, Response
 
 from src.logger.default_logger import logger
 from src.utils.api_exceptions import ApiException
-from src.utils.api_responses import ErrorDetail, ErrorResponse
+from src.utils.api_responses import (
+    ErrorDetail,
+    ErrorResponse,
+    ErrorResponseModel,
+    ORJSONResponse,
+    exception_chain,
+    format_stack_trace,
+)
+
+_API_EXCEPTION_LOG_FORMAT = (
+    "API Exception | Path: %s | Status Code: %d | Error Code: %s | Details: %s"
+)
+_HTTP_EXCEPTION_LOG_FORMAT = "HTTPException | Path: %s | Status: %d | Detail: %s"
+_UNHANDLED_EXCEPTION_LOG_FORMAT = "Unhandled Exception | Path: %s | Error: %s"
+_API_EXCEPTION_TRACE_LOG_FORMAT = "API Exception Trace | Path: %s\n%s"
+
+# Tracebacks are only formatted for logs when DEBUG logging is on
+_capture_tb = logger.isEnabledFor(logging.DEBUG)
+
+
+_JSON_MEDIA_TYPE = "application/json"
+_HTTP_EXCEPTION_MESSAGE = "A request error occurred."
+
+
+@lru_cache(maxsize=64)
+def _default_body(exc_type: type[ApiException]) -> bytes:
+    """Return the rendered error body of an exception raised with its defaults."""
+    return orjson.dumps(exc_type.DEFAULT_RESPONSE.to_dict())
+
+
+# Details of the 404 and 405 errors raised by routing, whose bodies are cached
+_ROUTING_ERRORS = frozenset(
+    {
+        (status.HTTP_404_NOT_FOUND, "Not Found"),
+        (status.HTTP_405_METHOD_NOT_ALLOWED, "Method Not Allowed"),
+    }
+)
+
+
+def _http_error_body(details: str) -> bytes:
+    """Render the error body for an HTTPException detail."""
+    return orjson.dumps(
+        ErrorResponseModel(
+            message=_HTTP_EXCEPTION_MESSAGE,
+            error=ErrorDetail(code="HTTP_EXCEPTION", details=details),
+        ).to_dict()
+    )
+
+
+@lru_cache(maxsize=len(_ROUTING_ERRORS))
+def _routing_error_body(details: str) -> bytes:
+    """Return the rendered body of a routing error (see `_ROUTING_ERRORS`)."""
+    return _http_error_body(details)
+
+
+def _json_body_response(
+    body: bytes, status_code: int, headers: Optional[dict[str, str]] = None
+) -> Response:
+    """Send an already rendered JSON body."""
+    return Response(
+        content=body,
+        status_code=status_code,
+        headers=headers,
+        media_type=_JSON_MEDIA_TYPE,
+    )
 
 
 async def api_exception_handler(request: Request, exc: ApiException) -> JSONResponse:
@@ -16,57 +86,79 @@ async def api_exception_handler(request: Request, exc: ApiException) -> JSONResp
     Handle all exceptions derived from ApiException (custom application errors).
     """
 
+    path = request.url.path
+
     # TODO: MAKE A DEV_LOG_FORMAT AND PROD_LOG_FORMAT
     logger.error(
-        "API Exception | Path: %s | Status Code: %d | Error Code: %s | Details: %s",
-        request.url.path,
+        _API_EXCEPTION_LOG_FORMAT,
+        path,
         exc.status_code,
         exc.error_detail.code,
         exc.error_detail.details or exc.message,
     )
 
-    return ErrorResponse(
-        error=exc.error_detail, message=exc.message, status_code=exc.status_code
+    # Log the captured trace with its causes as a structured field
+    stack_trace = exc.error_detail.stack_trace
+    if _capture_tb and isinstance(stack_trace, BaseException):
+        logger.debug(
+            _API_EXCEPTION_TRACE_LOG_FORMAT,
+            path,
+            format_stack_trace(stack_trace),
+            extra={"exception_chain": exception_chain(stack_trace)},
+        )
+
+    # Exceptions raised with their defaults (e.g. a bare NotFoundException)
+    # share one body, which is rendered once
+    if exc.error_response is type(exc).DEFAULT_RESPONSE:
+        return _json_body_response(_default_body(type(exc)), exc.status_code)
+
+    return ORJSONResponse(
+        status_code=exc.status_code, content=exc.error_response.to_dict()
     )
 
 
 async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
     """
-    Handle FastAPI's native HTTPException errors.
+    Handle FastAPI's and Starlette's native HTTPException errors, including the
+    404 and 405 responses raised by routing.
     """
 
-    error_detail = ErrorDetail(
-        code="HTTP_EXCEPTION",
-        details=str(exc.detail),
-    )
+    path = request.url.path
 
     logger.warning(
-        "HTTPException | Path: %s | Status: %d | Detail: %s",
-        request.url.path,
+        _HTTP_EXCEPTION_LOG_FORMAT,
+        path,
         exc.status_code,
         exc.detail,
     )
 
-    return ErrorResponse(
-        error=error_detail,
-        message="A request error occurred.",
-        status_code=exc.status_code,
-    )
+    # Routing errors such as unknown paths always carry the same detail, so
+    # their bodies are rendered once; any other detail is rendered per request
+    details = str(exc.detail)
+    if (exc.status_code, details) in _ROUTING_ERRORS:
+        body = _routing_error_body(details)
+    else:
+        body = _http_error_body(details)
+    return _json_body_response(body, exc.status_code, exc.headers)
 
 
 async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     """
     Catch-all handler for unexpected runtime exceptions.
     """
+    path = request.url.path
+
+    # Exception messages are effectively unique, so they are not cached
     error_detail = ErrorDetail(
         code="INTERNAL_SERVER_ERROR",
         details=str(exc),
     )
 
-    logger.exception(
-        "Unhandled Exception | Path: %s | Error: %s",
-        request.url.path,
-        str(exc),
+    logger.error(
+        _UNHANDLED_EXCEPTION_LOG_FORMAT,
+        path,
+        exc,
+        exc_info=_capture_tb,
     )
 
     return ErrorResponse(
@@ -76,9 +168,14 @@ async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONR
     )
 
 
+EXCEPTION_HANDLERS = {
+    ApiException: api_exception_handler,
+    HTTPException: http_exception_handler,
+    Exception: unhandled_exception_handler,
+}
+
+
 def setup_exception_handlers(app: FastAPI) -> None:
     """Registers exception handlers to the application."""
 
-    app.add_exception_handler(ApiException, api_exception_handler)
-    app.add_exception_handler(HTTPException, http_exception_handler)
-    app.add_exception_handler(Exception, unhandled_exception_handler)
+    app.exception_handlers.update(EXCEPTION_HANDLERS)
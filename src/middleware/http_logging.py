@@ -2,15 +2,92 @@
 Handles HTTP logging
 """
 
+import asyncio
+import logging
 import time
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from contextlib import suppress
+from typing import Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from src.logger.default_logger import logger
 
+_REQUEST_LOG_FORMAT = "HTTP Request | Method: %s | Path: %s | Client: %s"
+_RESPONSE_LOG_FORMAT = "HTTP Response | Path: %s | Status: %d | Duration: %.2fms"
+
+# Entries queued within this window are written together as one log record
+_LOG_FLUSH_INTERVAL = 0.05
+_LOG_BATCH_SIZE = 200
+_LOG_QUEUE_MAXSIZE = 10_000
+
+_log_queue: Optional[asyncio.Queue] = None
+_log_consumer_task: Optional[asyncio.Task] = None
+
+
+def _format_log_entry(entry: tuple) -> str:
+    kind, *args = entry
+    log_format = _REQUEST_LOG_FORMAT if kind == "req" else _RESPONSE_LOG_FORMAT
+    return log_format % tuple(args)
+
+
+def _enqueue_log_entry(entry: tuple) -> None:
+    """
+    Queue an entry for the background consumer. Falls back to logging directly
+    when the consumer is not running or the queue is full.
+    """
+    if _log_queue is not None:
+        try:
+            _log_queue.put_nowait(entry)
+            return
+        except asyncio.QueueFull:
+            pass
+    logger.info("%s", _format_log_entry(entry))
+
+
+async def _log_consumer(log_queue: asyncio.Queue) -> None:
+    """Drain the queue and write the pending entries as a single log record."""
+    while True:
+        batch = [await log_queue.get()]
+        await asyncio.sleep(_LOG_FLUSH_INTERVAL)
+        while len(batch) < _LOG_BATCH_SIZE:
+            try:
+                batch.append(log_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        try:
+            logger.info("%s", "\n".join(_format_log_entry(entry) for entry in batch))
+        finally:
+            for _ in batch:
+                log_queue.task_done()
+
 
-class HTTPLoggingMiddleware(BaseHTTPMiddleware):
+def start_http_log_consumer() -> None:
+    """Start the background task that writes queued HTTP log entries."""
+    global _log_queue, _log_consumer_task
+
+    if _log_consumer_task is not None and not _log_consumer_task.done():
+        return
+    _log_queue = asyncio.Queue(maxsize=_LOG_QUEUE_MAXSIZE)
+    _log_consumer_task = asyncio.create_task(_log_consumer(_log_queue))
+
+
+async def stop_http_log_consumer() -> None:
+    """Flush the pending HTTP log entries and stop the background task."""
+    global _log_queue, _log_consumer_task
+
+    if _log_consumer_task is None:
+        return
+    log_queue, task = _log_queue, _log_consumer_task
+    _log_queue, _log_consumer_task = None, None
+
+    if not task.done():
+        await log_queue.join()
+    task.cancel()
+    with suppress(asyncio.CancelledError):
+        await task
+
+
+class HTTPLoggingMiddleware:
     """
     Middleware to log incoming HTTP requests and outgoing responses.
 
@@ -19,33 +96,52 @@ class HTTPLoggingMiddleware(BaseHTTPMiddleware):
     - Status code
     - Request processing time
     - Optional: client IP, headers, request body (configurable)
+
+    Implemented as a plain ASGI middleware: the status code is read from the
+    `http.response.start` message, so no Request/Response objects or
+    per-request task group are created.
+
+    Exceptions propagate untouched: unhandled errors are logged once, by the
+    catch-all exception handler, and the response is recorded with status 500.
+
+    Entries are queued and written in batches by the consumer started with
+    `start_http_log_consumer()`. Whether INFO is enabled is checked once when
+    the middleware is built; call `refresh_log_level()` after changing levels.
     """
 
-    async def dispatch(self, request: Request, call_next):
-        start_time = time.time()
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.refresh_log_level()
+
+    def refresh_log_level(self) -> None:
+        """Re-read whether request/response logs are enabled."""
+        self._info_on = logger.isEnabledFor(logging.INFO)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_ns = time.perf_counter_ns()
+        path = scope["path"]
+        status_code = 500
 
         # Log request info
-        logger.info(
-            "HTTP Request | Method: %s | Path: %s | Client: %s",
-            request.method,
-            request.url.path,
-            request.client.host if request.client else "unknown",
-        )
+        if self._info_on:
+            client = scope.get("client")
+            client_host = client[0] if client else "unknown"
+            _enqueue_log_entry(("req", scope["method"], path, client_host))
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
         try:
-            response: Response = await call_next(request)
-        except Exception as exc:
-            logger.exception("Unhandled error while processing request: %s", str(exc))
-            raise
-
-        process_time = (time.time() - start_time) * 1000  # ms
-
-        # Log response info
-        logger.info(
-            "HTTP Response | Path: %s | Status: %d | Duration: %.2fms",
-            request.url.path,
-            response.status_code,
-            process_time,
-        )
-
-        return response
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # Log response info
+            if self._info_on:
+                process_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+                _enqueue_log_entry(("res", path, status_code, process_time_ms))
@@ -3,23 +3,38 @@ Database setup orchestrator that coordinates database initialization,
 migrations, and seeding operations.
 """
 
+import asyncio
+import functools
 import sys
+import time
 from pathlib import Path
+from typing import Any, Optional
 
-from src.database.db_manager import get_database_manager
-from src.database.migrations.migration_manager import MigrationManager, MigrationSetup
+# Add project root to Python path (once, even if this module is re-imported)
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
 
 # from src.logger.default_logger import logger
 from src.logger.default_logger import get_logger
 from src.database.database_utils import DatabaseUtil
 from src.utils.api_exceptions import DatabaseException
 
-# Add project root to Python path
-PROJECT_ROOT = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
-
 logger = get_logger(__name__)
 
+__all__ = ["DatabaseSetupOrchestrator"]
+
+
+@functools.cache
+def _db():
+    """Return the shared database manager, resolved once per process."""
+
+    # Deferred so importing this module doesn't load SQLAlchemy
+    from src.database.db_manager import get_database_manager
+
+    return get_database_manager()
+
+
 # TODO: DO FINAL DATABASE REVIEW AND CLEAN AND THEN COMPLETE TESTS
 
 
@@ -32,15 +47,25 @@ class DatabaseSetupOrchestrator:
     and coordinates between different database components.
     """
 
+    # Health info is reused for this many seconds between status calls
+    _HEALTH_TTL = 1.0
+
     def __init__(self):
         """Initialize the setup orchestrator."""
 
-        self._db_manager = get_database_manager()
+        # Deferred so importing this module doesn't load Alembic
+        from src.database.migrations.migration_manager import (
+            MigrationManager,
+            MigrationSetup,
+        )
+
+        self._db_manager = _db()
         self._migration_manager = MigrationManager()
         self._migration_setup = MigrationSetup(
             migration_manager=self._migration_manager
         )
         self._initialized = False
+        self._cached_health: Optional[tuple[float, dict[str, Any]]] = None
 
     @property
     def db_manager(self):
@@ -61,7 +86,7 @@ class DatabaseSetupOrchestrator:
             raise DatabaseException(
                 message="Failed to initialize database",
                 error_code="DB_INIT_FAILED",
-                stack_trace=str(e),
+                stack_trace=e,
             ) from e
 
     async def setup_migrations_infrastructure(self) -> None:
@@ -72,7 +97,7 @@ class DatabaseSetupOrchestrator:
             raise DatabaseException(
                 message="Failed to setup migration infrastructure",
                 error_code="MIGRATION_SETUP_FAILED",
-                stack_trace=str(e),
+                stack_trace=e,
             ) from e
 
     async def create_initial_migration(self) -> str:
@@ -90,7 +115,7 @@ class DatabaseSetupOrchestrator:
             raise DatabaseException(
                 message="Failed to create initial migration",
                 error_code="INITIAL_MIGRATION_FAILED",
-                stack_trace=str(e),
+                stack_trace=e,
             ) from e
 
     async def apply_migrations(self) -> None:
@@ -101,17 +126,21 @@ class DatabaseSetupOrchestrator:
         try:
             logger.info("Applying database migrations...")
 
-            # Check if there are pending migrations
-            has_pending = self.migration_manager.check_pending_migrations()
+            # Alembic is synchronous, so keep it off the event loop thread
+            has_pending = await asyncio.to_thread(
+                self.migration_manager.check_pending_migrations
+            )
             if has_pending:
-                self.migration_manager.upgrade()
+                await asyncio.to_thread(self.migration_manager.upgrade)
                 logger.info("Migrations applied successfully!")
             else:
                 logger.info("No pending migrations found!")
 
         except Exception as exc:
-            logger.error("Migration application failed: %s", str(exc))
+            logger.error("Migration application failed: %s", exc)
             raise
+        finally:
+            self.migration_manager.clear_applied_cache()
 
     async def reset_database(self) -> None:
         """Reset the entire database (drops all tables and recreates)."""
@@ -124,51 +153,59 @@ class DatabaseSetupOrchestrator:
             raise DatabaseException(
                 message="Database reset failed",
                 error_code="DB_RESET_FAILED",
-                stack_trace=str(e),
+                stack_trace=e,
             ) from e
 
-    async def database_health_check(self) -> None:
-        """Display comprehensive database and migration status."""
-
-        try:
-            # Initialize database connection
-            await self._db_manager.engine.initialize()
-
-            # Get comprehensive health information
-            health_info = await self._db_manager.engine.health_check()
-
-            # Database status
-            DatabaseUtil.is_database_healthy(health_info)
+    async def _get_health_cached(self, use_cache: bool = True) -> dict[str, Any]:
+        """
+        Return the engine's health info, reusing the last result if it is
+        younger than `_HEALTH_TTL` seconds.
+        """
 
-            # Show individual check results
-            DatabaseUtil.log_health_checks(health_info)
+        if use_cache and self._cached_health is not None:
+            fetched_at, health_info = self._cached_health
+            if time.monotonic() - fetched_at < self._HEALTH_TTL:
+                return health_info
 
-            DatabaseUtil.log_performance_metrics(health_info)
+        health_info = await self._db_manager.engine.health_check()
+        self._cached_health = (time.monotonic(), health_info)
+        return health_info
 
-            DatabaseUtil.log_errors_encountered(health_info)
+    async def database_health_check(
+        self, use_cache: bool = True, verbose: bool = False
+    ) -> None:
+        """
+        Display database and migration status.
 
-            # Connection info (with password masking)
-            DatabaseUtil.log_connection_data()
+        Args:
+            use_cache: Reuse health info fetched within the last _HEALTH_TTL seconds
+            verbose: Also report migration and table checks
+        """
 
-            DatabaseUtil.check_migration_status(health_info)
+        health_info = None
+        try:
+            # Initialize database connection
+            await self._db_manager.engine.initialize()
 
-            DatabaseUtil.log_migration_info(health_info)
+            # Get comprehensive health information
+            health_info = await self._get_health_cached(use_cache)
 
-            DatabaseUtil.verify_tables_exist(health_info)
+            # Emit the whole report as a single log record
+            DatabaseUtil.log_full_health_report(health_info, verbose=verbose)
         except DatabaseException as ex:
             logger.error(ex)
         except Exception as exc:
-            logger.warning("Failed to get status: %s", str(exc))
-            # Fallback to basic status if comprehensive check fails
-            logger.debug("Falling back to basic status check...")
-            try:
-                basic_healthy = await self._db_manager.engine.health_check()
+            logger.warning("Failed to get status: %s", exc)
+            # Fallback to basic status from the health info already fetched
+            if health_info is None and self._cached_health is not None:
+                health_info = self._cached_health[1]
+            if health_info is not None:
                 logger.info(
                     "Basic Health Check: %s",
-                    "HEALTHY" if basic_healthy else "UNHEALTHY",
+                    "HEALTHY" if health_info["healthy"] else "UNHEALTHY",
                 )
-            except Exception as basic_exc:
-                logger.error("Basic health check also failed: %s", str(basic_exc))
+            else:
+                logger.error("Basic health check unavailable: health info not fetched")
 
     async def cleanup(self) -> None:
         """Clean up resources."""
@@ -2,6 +2,8 @@
 Main entry point for the application.
 """
 
+import os
+
 from dotenv import load_dotenv
 import uvicorn
 
@@ -102,9 +104,17 @@ python manage.py db status
 """
 
 
-load_dotenv(".env")
+# Set once the .env file has been applied. uvicorn's reload workers inherit
+# the parent's environment, so they skip re-reading the file on every reload.
+_DOTENV_LOADED_FLAG = "DOCUCHAT_DOTENV_LOADED"
+
+if _DOTENV_LOADED_FLAG not in os.environ:
+    load_dotenv(".env", override=False)
+    os.environ[_DOTENV_LOADED_FLAG] = "1"
 
 app = create_app()
 
 if __name__ == "__main__":
+    # uvicorn's default loop ("auto") already picks up uvloop (see
+    # requirements.txt) and falls back to asyncio where it isn't available
     uvicorn.run("src.server:app", host="127.0.0.1", port=5000, reload=True)
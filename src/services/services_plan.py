@@ -1,159 +1,124 @@
 """
 Abstractions and plans for the Chatbot service.
+
+Each service is declared as a Protocol: the concrete implementations will
+receive their dependencies through their own constructors.
 """
 
+from typing import Any, Protocol
+
 
-class AuthService:
+class AuthService(Protocol):
     """Abstraction"""
 
-    def __init__(self, dependencies):
-        self.dependencies = dependencies
+    dependencies: Any
 
-    def register_user(self):
-        pass
+    def register_user(self) -> None: ...
 
-    def login_user(self):
-        pass
+    def login_user(self) -> None: ...
 
-    def logout_user(self):
-        pass
+    def logout_user(self) -> None: ...
 
-    def refresh_access_token(self):
-        pass
+    def refresh_access_token(self) -> None: ...
 
 
-class UserServices:
+class UserServices(Protocol):
     """Abstraction"""
 
-    def __init__(self, dependencies):
-        self.dependencies = dependencies
+    dependencies: Any
 
-    def get_user_details(self):
-        pass
+    def get_user_details(self) -> None: ...
 
-    def update_user_details(self):
-        pass
+    def update_user_details(self) -> None: ...
 
-    def get_user_token_usage(self):
-        pass
+    def get_user_token_usage(self) -> None: ...
 
 
-class ChatbotSessionServices:
+class ChatbotSessionServices(Protocol):
     """Abstraction"""
 
-    def __init__(self, dependencies):
-        self.dependencies = dependencies
+    dependencies: Any
 
-    def get_user_chat_sessions(self):
-        pass
+    def get_user_chat_sessions(self) -> None: ...
 
-    def create_chat_session(self):
-        pass
+    def create_chat_session(self) -> None: ...
 
-    def get_chat_session_details(self):
-        pass
+    def get_chat_session_details(self) -> None: ...
 
-    def delete_chat_session_and_associated_content(self):
-        pass
+    def delete_chat_session_and_associated_content(self) -> None: ...
 
-    def update_chat_session_details(self):
-        pass
+    def update_chat_session_details(self) -> None: ...
 
 
-class DocumentManagementServices:
+class DocumentManagementServices(Protocol):
     """Abstraction"""
 
-    def __init__(self, dependencies):
-        self.dependencies = dependencies
+    dependencies: Any
 
-    def upload_file_to_chat_session(self):
-        pass
+    def upload_file_to_chat_session(self) -> None: ...
 
-    def get_files_uploaded_to_chat_session(self):
-        pass
+    def get_files_uploaded_to_chat_session(self) -> None: ...
 
-    def download_uploaded_file_from_chat_session(self):
-        pass
+    def download_uploaded_file_from_chat_session(self) -> None: ...
 
-    def delete_upload_file_from_chat_session(self):
-        pass
+    def delete_upload_file_from_chat_session(self) -> None: ...
 
 
-class FileUploadService:
+class FileUploadService(Protocol):
     """Abstraction"""
 
-    def __init__(self, dependencies):
-        self.dependencies = dependencies
+    dependencies: Any
 
-    def upload_file(self):
-        pass
+    def upload_file(self) -> None: ...
 
-    def upload_files(self):
-        pass
+    def upload_files(self) -> None: ...
 
-    def get_user_files(self):
-        pass
+    def get_user_files(self) -> None: ...
 
-    def delete_file(self):
-        pass
+    def delete_file(self) -> None: ...
 
-    def delete_files(self):
-        pass
+    def delete_files(self) -> None: ...
 
 
-class ChatbotService:
+class ChatbotService(Protocol):
     """Abstraction"""
 
-    def __init__(self, dependencies):
-        self.dependencies = dependencies
+    dependencies: Any
 
-    def chat_with_chatbot_from_chat_session(self, question):
-        pass
+    def chat_with_chatbot_from_chat_session(self, question) -> None: ...
 
-    def get_messages_from_chat_session(self):
-        pass
+    def get_messages_from_chat_session(self) -> None: ...
 
-    def view_chat_message_from_chat_session(self, msg_id):
-        pass
+    def view_chat_message_from_chat_session(self, msg_id) -> None: ...
 
 
-class ChatbotUtilService:
+class ChatbotUtilService(Protocol):
     """Abstraction"""
 
-    def __init__(self, dependencies):
-        self.dependencies = dependencies
+    dependencies: Any
 
-    def export_chat_session_history_as_pdf(self):
-        pass
+    def export_chat_session_history_as_pdf(self) -> None: ...
 
-    def export_chat_session_history_as_txt(self):
-        pass
+    def export_chat_session_history_as_txt(self) -> None: ...
 
 
-class SearchServices:
+class SearchServices(Protocol):
     """Abstraction"""
 
-    def __init__(self, dependencies):
-        self.dependencies = dependencies
+    dependencies: Any
 
-    def search_chat_sessions_by_keyword(self, keyword):
-        pass
+    def search_chat_sessions_by_keyword(self, keyword) -> None: ...
 
-    def search_chat_sessions_messages_by_keyword(self, keyword):
-        pass
+    def search_chat_sessions_messages_by_keyword(self, keyword) -> None: ...
 
 
-class DashboardServices:
+class DashboardServices(Protocol):
     """Abstraction"""
 
-    def __init__(self, dependencies):
-        self.dependencies = dependencies
+    dependencies: Any
 
-    def get_user_dashboard_summary(self):
-        pass
+    def get_user_dashboard_summary(self) -> None: ...
 
-    def get_dashboard_tokens(self):
-        pass
+    def get_dashboard_tokens(self) -> None: ...
 
-    def get_dashboard_limits(self):
-        pass
+    def get_dashboard_limits(self) -> None: ...
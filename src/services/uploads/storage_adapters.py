@@ -0,0 +1,352 @@
+"""
+Storage backends for uploaded files.
+
+The upload service streams files into a `StorageWriter` chunk by chunk, so no
+backend ever needs the whole file in memory.
+"""
+
+import asyncio
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+import orjson
+
+from src.config.settings import settings
+from src.logger.default_logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class StorageWriter(ABC):
+    """
+    Receives the chunks of a single file. Nothing is visible under the file's
+    key until `commit()` succeeds; `abort()` discards everything written.
+    """
+
+    @abstractmethod
+    async def write(self, chunk: bytes | memoryview) -> None:
+        """Append a chunk. The chunk may be reused by the caller afterwards."""
+
+    @abstractmethod
+    async def commit(self) -> str:
+        """Finish the file and return its storage location."""
+
+    @abstractmethod
+    async def abort(self) -> None:
+        """Discard the partially written file."""
+
+
+class StorageAdapter(ABC):
+    """
+    Abstract class that defines the interface for file storage.
+
+    Usage:
+        - LocalStorageAdapter stores files on disk (development).
+        - Cloud adapters (e.g. S3) are used in production.
+    """
+
+    @abstractmethod
+    def open_writer(
+        self,
+        key: str,
+        content_type: Optional[str] = None,
+        metadata: Optional[dict[str, str]] = None,
+    ) -> StorageWriter:
+        """
+        Return a writer that streams a new file to the given key. `metadata`
+        is stored with the file and returned by `get_file_metadata`.
+        """
+
+    @abstractmethod
+    async def delete_file(self, key: str) -> None:
+        """Delete the file stored under the given key, if it exists."""
+
+    @abstractmethod
+    async def get_file_size(self, key: str) -> Optional[int]:
+        """Return the size of the file under the given key, or None if missing."""
+
+    @abstractmethod
+    async def get_file_metadata(self, key: str) -> Optional[dict[str, str]]:
+        """Return the metadata stored with a file, or None if it is missing."""
+
+    async def create_upload_url(
+        self, key: str, content_type: str, content_length: int
+    ) -> Optional[str]:
+        """
+        Return a signed URL the client can PUT the file to directly, or None
+        if the backend only accepts uploads through the API.
+        """
+        return None
+
+
+def _metadata_path(path: Path) -> Path:
+    """Sidecar file holding a locally stored file's metadata."""
+    return path.with_name(path.name + ".meta.json")
+
+
+class _LocalFileWriter(StorageWriter):
+    """
+    Writes to a temporary `.part` file that is renamed into place on commit.
+
+    Chunks are written straight to the file descriptor with `os.write`, with
+    no buffered file object in between, and each step (open + first write,
+    close + rename) runs in a single worker thread hop. Metadata is written
+    to a sidecar file on commit, before the file itself appears.
+    """
+
+    _OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+    def __init__(self, path: Path, metadata: Optional[dict[str, str]] = None):
+        self._path = path
+        self._part_path = path.with_name(path.name + ".part")
+        self._metadata = metadata
+        self._fd: Optional[int] = None
+
+    def _open(self) -> int:
+        self._part_path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd = os.open(self._part_path, self._OPEN_FLAGS, 0o644)
+        return self._fd
+
+    def _write(self, chunk: bytes | memoryview) -> None:
+        fd = self._fd if self._fd is not None else self._open()
+        view = memoryview(chunk)
+        while view:
+            view = view[os.write(fd, view) :]
+
+    def _close(self) -> None:
+        if self._fd is not None:
+            fd, self._fd = self._fd, None
+            os.close(fd)
+
+    def _commit(self) -> None:
+        if self._fd is None:
+            self._open()
+        self._close()
+        if self._metadata:
+            _metadata_path(self._path).write_bytes(orjson.dumps(self._metadata))
+        os.replace(self._part_path, self._path)
+
+    def _abort(self) -> None:
+        self._close()
+        self._part_path.unlink(missing_ok=True)
+        if self._metadata:
+            _metadata_path(self._path).unlink(missing_ok=True)
+
+    async def write(self, chunk: bytes | memoryview) -> None:
+        await asyncio.to_thread(self._write, chunk)
+
+    async def commit(self) -> str:
+        await asyncio.to_thread(self._commit)
+        return str(self._path)
+
+    async def abort(self) -> None:
+        try:
+            await asyncio.to_thread(self._abort)
+        except OSError as e:
+            logger.warning("Failed to remove partial upload %s: %s", self._part_path, e)
+
+
+class LocalStorageAdapter(StorageAdapter):
+    """Stores files on the local disk under a root directory."""
+
+    def __init__(self, root_directory: str):
+        self._root = Path(root_directory).resolve()
+
+    def _path_for(self, key: str) -> Path:
+        path = (self._root / key).resolve()
+        if not path.is_relative_to(self._root):
+            raise ValueError(f"Storage key escapes the storage root: {key}")
+        return path
+
+    def open_writer(
+        self,
+        key: str,
+        content_type: Optional[str] = None,
+        metadata: Optional[dict[str, str]] = None,
+    ) -> StorageWriter:
+        return _LocalFileWriter(self._path_for(key), metadata)
+
+    @staticmethod
+    def _delete(path: Path) -> None:
+        path.unlink(missing_ok=True)
+        _metadata_path(path).unlink(missing_ok=True)
+
+    async def delete_file(self, key: str) -> None:
+        await asyncio.to_thread(self._delete, self._path_for(key))
+
+    async def get_file_size(self, key: str) -> Optional[int]:
+        try:
+            stat = await asyncio.to_thread(self._path_for(key).stat)
+        except FileNotFoundError:
+            return None
+        return stat.st_size
+
+    @staticmethod
+    def _read_metadata(path: Path) -> Optional[dict[str, str]]:
+        if not path.is_file():
+            return None
+        try:
+            return orjson.loads(_metadata_path(path).read_bytes())
+        except FileNotFoundError:
+            return {}
+
+    async def get_file_metadata(self, key: str) -> Optional[dict[str, str]]:
+        return await asyncio.to_thread(self._read_metadata, self._path_for(key))
+
+
+class _S3FileWriter(StorageWriter):
+    """
+    Spools the chunks to an on-disk temporary file and uploads it on commit.
+
+    boto3's managed transfer switches to a multipart upload above the
+    configured threshold and sends the parts concurrently, reading each part's
+    byte range from the spooled file.
+    """
+
+    def __init__(
+        self,
+        adapter: "CloudStorageAdapter",
+        key: str,
+        content_type: Optional[str],
+        metadata: Optional[dict[str, str]],
+    ):
+        self._adapter = adapter
+        self._key = key
+        self._content_type = content_type
+        self._metadata = metadata
+        self._file: Optional[BinaryIO] = None
+
+    async def write(self, chunk: bytes | memoryview) -> None:
+        if self._file is None:
+            self._file = await asyncio.to_thread(tempfile.TemporaryFile)
+        await asyncio.to_thread(self._file.write, chunk)
+
+    def _upload(self) -> None:
+        if self._file is None:
+            self._file = tempfile.TemporaryFile()
+        self._file.seek(0)
+        extra_args = {}
+        if self._content_type:
+            extra_args["ContentType"] = self._content_type
+        if self._metadata:
+            extra_args["Metadata"] = self._metadata
+        self._adapter.client.upload_fileobj(
+            self._file,
+            self._adapter.bucket,
+            self._key,
+            ExtraArgs=extra_args,
+            Config=self._adapter.transfer_config,
+        )
+
+    async def commit(self) -> str:
+        try:
+            await asyncio.to_thread(self._upload)
+        finally:
+            await self.abort()
+        return f"s3://{self._adapter.bucket}/{self._key}"
+
+    async def abort(self) -> None:
+        # Temporary files are deleted when closed
+        if self._file is not None:
+            await asyncio.to_thread(self._file.close)
+            self._file = None
+
+
+class CloudStorageAdapter(StorageAdapter):
+    """Stores files in an S3 bucket."""
+
+    def __init__(
+        self,
+        bucket: str,
+        region: Optional[str] = None,
+        multipart_chunk_mb: int = 8,
+        max_concurrency: int = 10,
+        upload_url_expiry: int = 900,
+    ):
+        # Imported here so the local backend doesn't require boto3
+        import boto3
+        from boto3.s3.transfer import TransferConfig
+        from botocore.config import Config
+
+        part_size = multipart_chunk_mb * 1024 * 1024
+
+        self.bucket = bucket
+        self.upload_url_expiry = upload_url_expiry
+        # SigV4, so signed upload URLs also bind the declared content length
+        self.client = boto3.client(
+            "s3", region_name=region, config=Config(signature_version="s3v4")
+        )
+        self.transfer_config = TransferConfig(
+            multipart_threshold=part_size,
+            multipart_chunksize=part_size,
+            max_concurrency=max_concurrency,
+            use_threads=True,
+        )
+
+    def open_writer(
+        self,
+        key: str,
+        content_type: Optional[str] = None,
+        metadata: Optional[dict[str, str]] = None,
+    ) -> StorageWriter:
+        return _S3FileWriter(self, key, content_type, metadata)
+
+    async def delete_file(self, key: str) -> None:
+        await asyncio.to_thread(self.client.delete_object, Bucket=self.bucket, Key=key)
+
+    async def _head(self, key: str) -> Optional[dict]:
+        """HEAD the object under the key, returning None if it doesn't exist."""
+        from botocore.exceptions import ClientError
+
+        try:
+            return await asyncio.to_thread(
+                self.client.head_object, Bucket=self.bucket, Key=key
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+                return None
+            raise
+
+    async def get_file_size(self, key: str) -> Optional[int]:
+        head = await self._head(key)
+        return None if head is None else head["ContentLength"]
+
+    async def get_file_metadata(self, key: str) -> Optional[dict[str, str]]:
+        head = await self._head(key)
+        return None if head is None else head["Metadata"]
+
+    async def create_upload_url(
+        self, key: str, content_type: str, content_length: int
+    ) -> Optional[str]:
+        return await asyncio.to_thread(
+            self.client.generate_presigned_url,
+            "put_object",
+            Params={
+                "Bucket": self.bucket,
+                "Key": key,
+                "ContentType": content_type,
+                "ContentLength": content_length,
+            },
+            ExpiresIn=self.upload_url_expiry,
+        )
+
+
+def create_storage_adapter() -> StorageAdapter:
+    """Create the storage adapter selected by the STORAGE_BACKEND setting."""
+
+    backend = settings.files.STORAGE_BACKEND.lower()
+    if backend == "s3":
+        return CloudStorageAdapter(
+            bucket=settings.files.S3_BUCKET_NAME,
+            region=settings.files.S3_REGION,
+            multipart_chunk_mb=settings.files.S3_MULTIPART_CHUNK_MB,
+            max_concurrency=settings.files.S3_MAX_CONCURRENCY,
+            upload_url_expiry=settings.files.S3_UPLOAD_URL_EXPIRY_SECONDS,
+        )
+    if backend == "local":
+        return LocalStorageAdapter(settings.files.UPLOAD_DIRECTORY)
+
+    raise ValueError(f"Unknown storage backend: {settings.files.STORAGE_BACKEND}")
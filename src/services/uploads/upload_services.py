@@ -2,51 +2,464 @@
 Responsible for all upload related operations.
 """
 
+import asyncio
+import hashlib
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+from uuid import UUID, uuid4
+
+import zstandard as zstd
+from fastapi import UploadFile
+
+from src.config.settings import settings
+from src.logger.default_logger import get_logger
+from src.services.uploads.storage_adapters import StorageAdapter, StorageWriter
+from src.utils.api_exceptions import (
+    ApiException,
+    BadRequestException,
+    DocumentNotFoundException,
+    DocumentUploadException,
+    FileSizeException,
+    FileTypeException,
+)
+
+from src.database.models.upload_session_model import UPLOAD_PENDING
+
+if TYPE_CHECKING:
+    from src.database.repositories.upload_session_repo import (
+        UploadSessionRepository,
+    )
+
+logger = get_logger(__name__)
+
 # TODO: NORMALIZE AND REVIEW TABLES
 
+# Uploads are read in chunks of this size, so memory use doesn't grow with
+# the file size
+_CHUNK_SIZE = 1 << 20
+
+# Compressed files are stored with this suffix and content type
+_COMPRESSED_SUFFIX = ".zst"
+_COMPRESSED_CONTENT_TYPE = "application/zstd"
+
+# Bytes of the file inspected to detect its MIME type
+_MIME_SNIFF_SIZE = 4096
+
+# Storage metadata key holding the detected MIME type. Compressed files are
+# stored as application/zstd, so this is the only place their real type lives.
+MIME_TYPE_METADATA_KEY = "mime-type"
+
+# MIME type and leading bytes of each supported extension. Text formats have
+# no signature and are only checked for binary (NUL) bytes.
+_FILE_SIGNATURES: dict[str, tuple[str, Optional[bytes]]] = {
+    ".pdf": ("application/pdf", b"%PDF-"),
+    ".docx": (
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        b"PK\x03\x04",
+    ),
+    ".txt": ("text/plain", None),
+    ".md": ("text/markdown", None),
+}
+
+# Read buffers are reused across uploads instead of allocated per chunk
+_BUFFER_POOL_SIZE = 16
+_buffer_pool: deque[bytearray] = deque(maxlen=_BUFFER_POOL_SIZE)
+
+
+def _borrow_buffer() -> bytearray:
+    try:
+        return _buffer_pool.pop()
+    except IndexError:
+        return bytearray(_CHUNK_SIZE)
+
+
+def _return_buffer(buffer: bytearray) -> None:
+    _buffer_pool.append(buffer)
+
+
+def _max_file_size() -> int:
+    return settings.files.MAX_FILE_SIZE_MB * 1024 * 1024
+
+
+def _file_size_exception() -> FileSizeException:
+    return FileSizeException(
+        details=f"Maximum file size is {settings.files.MAX_FILE_SIZE_MB} MB"
+    )
+
+
+def _validate_upload(filename: Optional[str], size: Optional[int]) -> tuple[str, str]:
+    """
+    Check an upload's extension and declared size.
+
+    Returns:
+        The sanitized filename and its lower-cased extension
+    """
+
+    # Drop any directory components sent by the client
+    filename = Path(filename or "").name
+    extension = Path(filename).suffix.lower()
+    if extension not in settings.files.ALLOWED_FILE_EXTENSIONS:
+        allowed = ", ".join(settings.files.ALLOWED_FILE_EXTENSIONS)
+        raise FileTypeException(details=f"Allowed file types: {allowed}")
+
+    if size is not None and size > _max_file_size():
+        raise _file_size_exception()
+
+    return filename, extension
+
+
+def _detect_mime_type(head: bytes, extension: str) -> str:
+    """
+    Detect the MIME type of a file from its first bytes and check that it
+    matches the file's extension.
+    """
+
+    if extension not in _FILE_SIGNATURES:
+        return "application/octet-stream"
+
+    mime_type, signature = _FILE_SIGNATURES[extension]
+    if signature is None:
+        matches = b"\x00" not in head
+    else:
+        matches = head.startswith(signature)
+
+    if not matches:
+        raise FileTypeException(
+            details=f"The file content does not match its {extension} extension"
+        )
+    return mime_type
+
+
+def _storage_key(user_id: UUID, file_id: UUID, extension: str) -> str:
+    return f"users/{user_id}/files/{file_id}{extension}"
+
 
 class FileUploadService:
-    """Abstraction"""
+    """Handles uploading, listing and deleting user files."""
 
-    def __init__(self, dependencies):
-        self.dependencies = dependencies
+    def __init__(
+        self,
+        storage: StorageAdapter,
+        upload_sessions: Optional["UploadSessionRepository"] = None,
+    ):
+        """
+        Args:
+            storage: Where uploaded files are stored
+            upload_sessions: Records direct uploads; required by
+                `create_upload_url`, `complete_upload` and
+                `cleanup_expired_uploads`
+        """
+        self.storage = storage
+        self._upload_sessions = upload_sessions
 
-    def upload_file(self):
-        """Handles file uploads"""
+    @property
+    def upload_sessions(self) -> "UploadSessionRepository":
+        if self._upload_sessions is None:
+            raise RuntimeError("Direct uploads need an UploadSessionRepository")
+        return self._upload_sessions
 
-        # Receive upload request
+    async def upload_file(self, upload: UploadFile, user_id: UUID) -> dict[str, Any]:
+        """
+        Handles file uploads.
 
-        # Assign a unique file id
+        The file is streamed from the request to storage in fixed-size chunks,
+        validated and hashed as it goes, so it is never held in memory whole.
+
+        Args:
+            upload: The uploaded file
+            user_id: ID of the user who owns the file
 
-        # Validate file
-        # - Allowed extension
-        # - Max file size not exceeded
-        # - Security checks (sanitize filename, check MIME type)
+        Returns:
+            The file ID and metadata, including its storage location
+        """
+
+        # Validate file (the size is checked again while streaming)
+        filename, extension = _validate_upload(upload.filename, upload.size)
+        max_size = _max_file_size()
 
-        # Pre-processing compression if file size exceeds MAX
-        # - compress file
-        # - store compressed file as the canonical raw file
-        # - meta records og size + comp size
-        # - FileCompressionService
+        # Assign a unique file id
+        file_id = uuid4()
+        key = _storage_key(user_id, file_id, extension)
+
+        # Compression runs chunk by chunk as the file streams in; the
+        # compressed file is stored as the canonical raw file
+        compressor = None
+        if settings.files.COMPRESS_UPLOADS:
+            compressor = zstd.ZstdCompressor(
+                level=settings.files.UPLOAD_COMPRESSION_LEVEL, threads=-1
+            ).compressobj()
+            key += _COMPRESSED_SUFFIX
 
         # Storage
         # - dev: on disks in users/ user123/ files/
         # - prod: upload external storage like AWS, S3
-        # - Store meta in db table as well as content (opt) save_metadata()
-        # - StorageAdapter: LocalStorageAdapter + CloudStorageAdapter depends on ENV
+        # TODO: Store meta in db table as well as content (opt) save_metadata()
+        writer: Optional[StorageWriter] = None
+        hasher = hashlib.sha256()
+        size = 0
+        stored_size = 0
+        committed = False
+        buffer = _borrow_buffer()
+        buffer_reusable = True
+        try:
+            read = await asyncio.to_thread(upload.file.readinto, buffer)
+
+            # The MIME type is detected once, from the first chunk, and stored
+            # in the file's storage metadata so it never has to be sniffed again
+            mime_type = _detect_mime_type(
+                bytes(buffer[: min(read, _MIME_SNIFF_SIZE)]), extension
+            )
+            writer = self.storage.open_writer(
+                key,
+                content_type=_COMPRESSED_CONTENT_TYPE if compressor else mime_type,
+                metadata={MIME_TYPE_METADATA_KEY: mime_type},
+            )
+
+            while read:
+                size += read
+                if size > max_size:
+                    raise _file_size_exception()
+
+                chunk = memoryview(buffer)[:read]
+                hasher.update(chunk)
+                if compressor is not None:
+                    # zstd releases the GIL, so compress off the event loop
+                    chunk = await asyncio.to_thread(compressor.compress, chunk)
+                if chunk:
+                    stored_size += len(chunk)
+                    await writer.write(chunk)
+
+                read = await asyncio.to_thread(upload.file.readinto, buffer)
+
+            if compressor is not None:
+                tail = compressor.flush()
+                stored_size += len(tail)
+                await writer.write(tail)
+
+            location = await writer.commit()
+            committed = True
+        except (FileSizeException, FileTypeException):
+            raise
+        except Exception as e:
+            logger.error("Failed to upload file %s: %s", filename, e)
+            raise DocumentUploadException(details=str(e)) from e
+        except BaseException:
+            # On cancellation a worker thread may still be reading from or
+            # writing a view of the buffer, so it must not be handed out again
+            buffer_reusable = False
+            raise
+        finally:
+            # Runs on cancellation too, so no partial or temporary file is
+            # left behind
+            if writer is not None and not committed:
+                await writer.abort()
+            if buffer_reusable:
+                _return_buffer(buffer)
+
+        logger.info("Uploaded file %s (%d bytes) to %s", file_id, size, location)
 
-        """
-            StorageAdapter:
-            - save_file()
-            - delete_file()
-            - get_file(filename)
-            - get_files()
-        """
         # Return response
         # - File ID + metadata + storage URL/file path
+        return {
+            "file_id": str(file_id),
+            "filename": filename,
+            "mime_type": mime_type,
+            "size": size,
+            "stored_size": stored_size,
+            "compressed": compressor is not None,
+            "sha256": hasher.hexdigest(),
+            "location": location,
+        }
 
-    def upload_files(self):
-        pass
+    async def create_upload_url(
+        self,
+        filename: str,
+        size: int,
+        content_type: str,
+        user_id: UUID,
+    ) -> dict[str, Any]:
+        """
+        Let the client upload a file straight to storage.
+
+        The request metadata is validated, a pending upload is recorded for
+        the file and a short-lived signed URL is returned. The client PUTs the
+        file to it, so the bytes never pass through the API process, then
+        calls `complete_upload` to confirm it.
+
+        Args:
+            filename: Name of the file to upload
+            size: Size of the file in bytes
+            content_type: MIME type the client will upload with
+            user_id: ID of the user who owns the file
+
+        Returns:
+            The file ID, the URL to upload the file to and when the URL expires
+        """
+
+        filename, extension = _validate_upload(filename, size)
+
+        file_id = uuid4()
+        key = _storage_key(user_id, file_id, extension)
+
+        upload_url = await self.storage.create_upload_url(key, content_type, size)
+        if upload_url is None:
+            raise BadRequestException(
+                error_code="DIRECT_UPLOAD_UNSUPPORTED",
+                details="The storage backend does not support direct uploads",
+            )
+
+        expires_at = datetime.now(timezone.utc) + timedelta(
+            seconds=settings.files.S3_UPLOAD_URL_EXPIRY_SECONDS
+        )
+        await self.upload_sessions.create(
+            {
+                "id": file_id,
+                "user_id": user_id,
+                "storage_key": key,
+                "filename": filename,
+                "content_type": content_type,
+                "size": size,
+                "expires_at": expires_at,
+            }
+        )
+
+        return {
+            "file_id": str(file_id),
+            "filename": filename,
+            "upload_url": upload_url,
+            "expires_at": expires_at.isoformat(),
+        }
+
+    async def complete_upload(self, file_id: UUID, user_id: UUID) -> dict[str, Any]:
+        """
+        Confirm a direct upload once the client has PUT the file.
+
+        Storage is checked for the file under the upload's key and its size is
+        compared with the declared one before the upload is committed.
+        Confirming an already committed upload returns it again.
+
+        Args:
+            file_id: ID returned by `create_upload_url`
+            user_id: ID of the user who owns the file
+
+        Returns:
+            The file ID and metadata, including its storage key
+        """
+
+        upload = await self.upload_sessions.get_for_user(file_id, user_id)
+        if upload is None:
+            raise DocumentNotFoundException(details=f"No upload with id {file_id}")
+
+        if upload.status == UPLOAD_PENDING:
+            stored_size = await self.storage.get_file_size(upload.storage_key)
+            if stored_size is None:
+                raise DocumentUploadException(
+                    details="The file has not been uploaded yet"
+                )
+            if stored_size != upload.size:
+                await self.storage.delete_file(upload.storage_key)
+                raise FileSizeException(
+                    details=(
+                        f"Expected {upload.size} bytes, "
+                        f"but {stored_size} bytes were uploaded"
+                    )
+                )
+
+            committed = await self.upload_sessions.mark_committed(
+                file_id, datetime.now(timezone.utc)
+            )
+            if committed is None:
+                raise DocumentNotFoundException(
+                    details=f"Upload {file_id} is no longer pending"
+                )
+            upload = committed
+            logger.info("Confirmed direct upload %s", file_id)
+
+        return {
+            "file_id": str(upload.id),
+            "filename": upload.filename,
+            "mime_type": upload.content_type,
+            "size": upload.size,
+            "status": upload.status,
+            "location": upload.storage_key,
+        }
+
+    async def cleanup_expired_uploads(self, limit: int = 100) -> int:
+        """
+        Delete pending uploads whose signed URL has expired, together with any
+        object the client uploaded but never confirmed.
+
+        Args:
+            limit: Maximum number of uploads cleaned up in one call
+
+        Returns:
+            The number of uploads cleaned up
+        """
+
+        expired = await self.upload_sessions.get_expired_pending(
+            datetime.now(timezone.utc), limit
+        )
+        if not expired:
+            return 0
+
+        await asyncio.gather(
+            *(self.storage.delete_file(upload.storage_key) for upload in expired)
+        )
+        await self.upload_sessions.delete_pending([upload.id for upload in expired])
+        return len(expired)
+
+    async def upload_files(
+        self, files: list[UploadFile], user_id: UUID, max_concurrency: int = 8
+    ) -> dict[str, list[dict[str, Any]]]:
+        """
+        Upload several files concurrently.
+
+        At most `max_concurrency` files are streamed at once. A failing file
+        doesn't fail the batch; it is reported under "failed" instead.
+
+        Args:
+            files: The uploaded files
+            user_id: ID of the user who owns the files
+            max_concurrency: Maximum number of files uploaded at the same time
+
+        Returns:
+            The metadata of the uploaded files and the errors of the failed ones
+        """
+
+        max_files = settings.files.MAX_FILES_PER_UPLOAD
+        if len(files) > max_files:
+            raise BadRequestException(
+                error_code="TOO_MANY_FILES",
+                details=f"At most {max_files} files can be uploaded at once",
+            )
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def upload_one(upload: UploadFile) -> dict[str, Any]:
+            async with semaphore:
+                return await self.upload_file(upload, user_id)
+
+        results = await asyncio.gather(
+            *(upload_one(upload) for upload in files), return_exceptions=True
+        )
+
+        uploaded, failed = [], []
+        for upload, result in zip(files, results):
+            if isinstance(result, ApiException):
+                failed.append(
+                    {
+                        "filename": upload.filename,
+                        "error": result.error_detail.to_dict(),
+                    }
+                )
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                uploaded.append(result)
+
+        return {"uploaded": uploaded, "failed": failed}
 
     def get_user_files(self):
         pass
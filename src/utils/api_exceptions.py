@@ -2,11 +2,38 @@
 This module defines custom exceptions for the API.
 """
 
-from typing import Optional
+import sys
+from functools import lru_cache
+from http import HTTPStatus
+from typing import Callable, Optional, TypeVar
 
-from fastapi import HTTPException, status
+from fastapi import HTTPException
 
-from src.utils.api_responses import ErrorDetail
+from src.utils.api_responses import ErrorDetail, ErrorResponseModel, StackTrace
+
+
+@lru_cache(maxsize=256)
+def _cached_error_detail(code: str) -> ErrorDetail:
+    """Return the shared `ErrorDetail` for a code without details or a stack trace."""
+    return ErrorDetail(code=code)
+
+
+def _error_detail(
+    code: str, details: Optional[str], stack_trace: Optional[StackTrace]
+) -> ErrorDetail:
+    """Build an `ErrorDetail`, sharing the cached one when there is nothing to add."""
+    if details is None and stack_trace is None:
+        return _cached_error_detail(code)
+    return ErrorDetail(code=code, details=details, stack_trace=stack_trace)
+
+
+@lru_cache(maxsize=256)
+def _cached_response(code: str, message: str) -> ErrorResponseModel:
+    """
+    Return the shared error body for an exception raised without details or a
+    stack trace. The returned instance is shared and must not be mutated.
+    """
+    return ErrorResponseModel(message=message, error=_cached_error_detail(code))
 
 
 # TODO: REMEMBER THAT YOU LOG ERRORS BEFORE YOU RAISE THEM AND THE EXC HANDLERS ALSO LOG ERRORS, SO DUPLICATE LOGS
@@ -18,11 +45,32 @@ class ApiException(HTTPException):
     Inherits from HTTPException.
     """
 
+    # Every attribute set in __init__ has a slot, so instances never allocate
+    # the lazily created exception __dict__. Subclasses don't need their own
+    # __slots__: BaseException already reserves the dict slot.
+    __slots__ = (
+        "error_detail",
+        "message",
+        "_error_response",
+        "status_code",
+        "detail",
+        "headers",
+    )
+
+    STATUS_CODE = int(HTTPStatus.INTERNAL_SERVER_ERROR)
+    DEFAULT_MESSAGE = "An unexpected error occurred."
+    DEFAULT_CODE = "INTERNAL_SERVER_ERROR"
+
+    # The shared error body of an exception raised with its defaults, set by
+    # @api_exception
+    DEFAULT_RESPONSE: Optional[ErrorResponseModel] = None
+
     def __init__(
         self,
         error_detail: ErrorDetail,
-        status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR,
-        message: str = "An unexpected error occurred.",
+        status_code: int = STATUS_CODE,
+        message: str = DEFAULT_MESSAGE,
+        error_response: Optional[ErrorResponseModel] = None,
     ):
         """
         Initializes the ApiError.
@@ -32,465 +80,349 @@ class ApiException(HTTPException):
             information.
             status_code: The HTTP status code for the response.
             message: A high-level message for the error response.
+            error_response: A prebuilt response body for error_detail and
+            message, reused as is. Otherwise it is built on first access.
         """
 
         self.error_detail = error_detail
         self.message = message
+        self._error_response = error_response
+
+        # Same attributes HTTPException.__init__ would set, without its
+        # argument normalisation
+        Exception.__init__(self)
+        self.status_code = status_code
+        self.detail = message
+        self.headers = None
+
+    @property
+    def error_response(self) -> ErrorResponseModel:
+        """
+        The response body for this error. Built on first access, so exceptions
+        that are caught and handled internally never build one.
+        """
+
+        if self._error_response is None:
+            error_detail = self.error_detail
+            if error_detail.details is None and error_detail.stack_trace is None:
+                self._error_response = _cached_response(error_detail.code, self.message)
+            else:
+                self._error_response = ErrorResponseModel(
+                    message=self.message, error=error_detail
+                )
+        return self._error_response
+
+    @staticmethod
+    def of(
+        code: str,
+        details: Optional[str] = None,
+        stack_trace: Optional[StackTrace] = None,
+        message: Optional[str] = None,
+        *,
+        capture_trace: bool = False,
+    ) -> "ApiException":
+        """
+        Create the exception registered for an error code, e.g.
+        `ApiException.of("USER_NOT_FOUND", details=...)`.
+
+        Args:
+            code: The error code, a key of ERROR_CODES
+            details: Specific information about the error
+            stack_trace: The stack trace, included in development responses
+            message: Overrides the error code's default message
+            capture_trace: Use the exception currently being handled as the
+            stack trace
+
+        Returns:
+            An instance of the exception class registered for the code
+        """
+
+        try:
+            cls = EXCEPTION_REGISTRY[code]
+        except KeyError:
+            raise ValueError(f"Unknown error code: {code!r}") from None
+
+        return cls(
+            error_code=code,
+            details=details,
+            stack_trace=stack_trace,
+            message=cls.DEFAULT_MESSAGE if message is None else message,
+            capture_trace=capture_trace,
+        )
 
-        super().__init__(status_code=status_code, detail=message)
+
+_ExceptionT = TypeVar("_ExceptionT", bound=type[ApiException])
+
+
+def api_exception(
+    default_code: str, default_message: str, status_code: Optional[int] = None
+) -> Callable[[_ExceptionT], _ExceptionT]:
+    """
+    Class decorator that sets an exception's default error code, message and
+    status code and gives it the standard constructor:
+
+        __init__(error_code=default_code, details=None, stack_trace=None,
+                 message=default_message, *, capture_trace=False)
+
+    `capture_trace=True` records the exception currently being handled as the
+    stack trace; its traceback is only formatted if a response or a DEBUG log
+    includes it.
+
+    The status code is inherited from the parent class when omitted. Classes
+    that define their own `__init__` keep it and only receive the defaults.
+
+    The error body for the defaults is built once here; raising the exception
+    without arguments reuses it instead of building a new one.
+    """
+
+    def decorator(cls: _ExceptionT) -> _ExceptionT:
+        status_ = cls.STATUS_CODE if status_code is None else int(status_code)
+
+        cls.STATUS_CODE = status_
+        cls.DEFAULT_CODE = default_code
+        cls.DEFAULT_MESSAGE = default_message
+        cls.DEFAULT_RESPONSE = _cached_response(default_code, default_message)
+
+        if "__init__" in cls.__dict__:
+            return cls
+
+        template_detail = _cached_error_detail(default_code)
+        template_response = cls.DEFAULT_RESPONSE
+
+        def __init__(
+            self,
+            error_code: str = default_code,
+            details: Optional[str] = None,
+            stack_trace: Optional[StackTrace] = None,
+            message: str = default_message,
+            *,
+            capture_trace: bool = False,
+        ):
+            if capture_trace and stack_trace is None:
+                stack_trace = sys.exception()
+
+            if (
+                details is None
+                and stack_trace is None
+                and error_code == default_code
+                and message == default_message
+            ):
+                ApiException.__init__(
+                    self,
+                    error_detail=template_detail,
+                    status_code=status_,
+                    message=message,
+                    error_response=template_response,
+                )
+                return
+
+            ApiException.__init__(
+                self,
+                error_detail=_error_detail(error_code, details, stack_trace),
+                status_code=status_,
+                message=message,
+            )
+
+        __init__.__qualname__ = f"{cls.__qualname__}.__init__"
+        cls.__init__ = __init__
+        return cls
+
+    return decorator
 
 
 # ======================= 4xx Client Errors =======================
 
 
+@api_exception(
+    "BAD_REQUEST", "The request is invalid or malformed.", HTTPStatus.BAD_REQUEST
+)
 class BadRequestException(ApiException):
     """
     Used for 400 request errors, handling Bad/Malformed requests.
     """
 
-    def __init__(
-        self,
-        error_code: str = "BAD_REQUEST",
-        details: Optional[str] = None,
-        stack_trace: Optional[
-            str
-        ] = None,  # TODO: CONSIDER CHANGING THE STACK_TRACE TYPE TO EXCEPTION
-        message: str = "The request is invalid or malformed.",
-    ):
-        error_detail = ErrorDetail(
-            code=error_code, details=details, stack_trace=stack_trace
-        )
-        super().__init__(
-            error_detail=error_detail,
-            status_code=status.HTTP_400_BAD_REQUEST,
-            message=message,
-        )
-
 
+@api_exception(
+    "UNAUTHORIZED",
+    "Authentication is required to access this resource.",
+    HTTPStatus.UNAUTHORIZED,
+)
 class UnauthorizedException(ApiException):
     """
     Used for 401 request errors, handling unauthorized/unauthenticated requests.
     """
 
-    def __init__(
-        self,
-        error_code: str = "UNAUTHORIZED",
-        details: Optional[str] = None,
-        stack_trace: Optional[str] = None,
-        message: str = "Authentication is required to access this resource.",
-    ):
-        error_detail = ErrorDetail(
-            code=error_code, details=details, stack_trace=stack_trace
-        )
-        super().__init__(
-            error_detail=error_detail,
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            message=message,
-        )
-
 
+@api_exception(
+    "FORBIDDEN",
+    "You do not have permission to access this resource.",
+    HTTPStatus.FORBIDDEN,
+)
 class ForbiddenException(ApiException):
     """
     Used for 403 request errors, handling forbidden request errors or
     authorization failures.
     """
 
-    def __init__(
-        self,
-        error_code: str = "FORBIDDEN",
-        details: Optional[str] = None,
-        stack_trace: Optional[str] = None,
-        message: str = "You do not have permission to access this resource.",
-    ):
-        error_detail = ErrorDetail(
-            code=error_code, details=details, stack_trace=stack_trace
-        )
-        super().__init__(
-            error_detail=error_detail,
-            status_code=status.HTTP_403_FORBIDDEN,
-            message=message,
-        )
-
 
+@api_exception(
+    "NOT_FOUND", "The requested resource was not found.", HTTPStatus.NOT_FOUND
+)
 class NotFoundException(ApiException):
     """
     Used for 404 request errors, handling resource not found errors.
     """
 
-    def __init__(
-        self,
-        error_code: str = "NOT_FOUND",
-        details: Optional[str] = None,
-        stack_trace: Optional[str] = None,
-        message: str = "The requested resource was not found.",
-    ):
-        error_detail = ErrorDetail(
-            code=error_code, details=details, stack_trace=stack_trace
-        )
-        super().__init__(
-            error_detail=error_detail,
-            status_code=status.HTTP_404_NOT_FOUND,
-            message=message,
-        )
-
 
+@api_exception(
+    "CONFLICT",
+    "The request conflicts with the current state of the resource.",
+    HTTPStatus.CONFLICT,
+)
 class ConflictException(ApiException):
     """
     Used for 409 request errors, handling resource conflicts and duplicate entries.
     """
 
-    def __init__(
-        self,
-        error_code: str = "CONFLICT",
-        details: Optional[str] = None,
-        stack_trace: Optional[str] = None,
-        message: str = "The request conflicts with the current state of the resource.",
-    ):
-        error_detail = ErrorDetail(
-            code=error_code, details=details, stack_trace=stack_trace
-        )
-        super().__init__(
-            error_detail=error_detail,
-            status_code=status.HTTP_409_CONFLICT,
-            message=message,
-        )
-
 
+@api_exception(
+    "UNPROCESSABLE_ENTITY",
+    "The request is well-formed but contains semantic errors.",
+    HTTPStatus.UNPROCESSABLE_ENTITY,
+)
 class UnprocessableEntityException(ApiException):
     """
     Used for 422 request errors, handling semantic validation errors and well-formed
     but invalid requests.
     """
 
-    def __init__(
-        self,
-        error_code: str = "UNPROCESSABLE_ENTITY",
-        details: Optional[str] = None,
-        stack_trace: Optional[str] = None,
-        message: str = "The request is well-formed but contains semantic errors.",
-    ):
-        error_detail = ErrorDetail(
-            code=error_code, details=details, stack_trace=stack_trace
-        )
-        super().__init__(
-            error_detail=error_detail,
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            message=message,
-        )
-
 
+@api_exception(
+    "TOO_MANY_REQUESTS",
+    "Rate limit exceeded. Please try again later.",
+    HTTPStatus.TOO_MANY_REQUESTS,
+)
 class TooManyRequestsException(ApiException):
     """
     Used for 429 request errors, handling rate limiting and quota exceeded scenarios.
     """
 
-    def __init__(
-        self,
-        error_code: str = "TOO_MANY_REQUESTS",
-        details: Optional[str] = None,
-        stack_trace: Optional[str] = None,
-        message: str = "Rate limit exceeded. Please try again later.",
-    ):
-        error_detail = ErrorDetail(
-            code=error_code, details=details, stack_trace=stack_trace
-        )
-        super().__init__(
-            error_detail=error_detail,
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            message=message,
-        )
-
 
 # ======================= 5xx Server Errors =======================
 
 
+@api_exception(
+    "INTERNAL_SERVER_ERROR",
+    "An unexpected error occurred on the server.",
+    HTTPStatus.INTERNAL_SERVER_ERROR,
+)
 class InternalServerException(ApiException):
     """
     Used for 500 server errors, handling unexpected internal server failures.
     """
 
-    def __init__(
-        self,
-        error_code: str = "INTERNAL_SERVER_ERROR",
-        details: Optional[str] = None,
-        stack_trace: Optional[str] = None,
-        message: str = "An unexpected error occurred on the server.",
-    ):
-        error_detail = ErrorDetail(
-            code=error_code, details=details, stack_trace=stack_trace
-        )
-        super().__init__(
-            error_detail=error_detail,
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            message=message,
-        )
-
 
+@api_exception(
+    "SERVICE_UNAVAILABLE",
+    "The service is temporarily unavailable.",
+    HTTPStatus.SERVICE_UNAVAILABLE,
+)
 class ServiceUnavailableException(ApiException):
     """
     Used for 503 server errors, handling temporary service unavailability.
     """
 
-    def __init__(
-        self,
-        error_code: str = "SERVICE_UNAVAILABLE",
-        details: Optional[str] = None,
-        stack_trace: Optional[str] = None,
-        message: str = "The service is temporarily unavailable.",
-    ):
-        error_detail = ErrorDetail(
-            code=error_code, details=details, stack_trace=stack_trace
-        )
-        super().__init__(
-            error_detail=error_detail,
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            message=message,
-        )
-
 
 # ======================= Domain-Specific Exceptions =======================
 
 
+@api_exception("AUTHENTICATION_FAILED", "Invalid credentials provided.")
 class AuthenticationException(UnauthorizedException):
     """
     Used for authentication failures during login/token verification.
     """
 
-    def __init__(
-        self,
-        error_code: str = "AUTHENTICATION_FAILED",
-        details: Optional[str] = None,
-        stack_trace: Optional[str] = None,
-        message: str = "Invalid credentials provided.",
-    ):
-        super().__init__(
-            error_code=error_code,
-            details=details,
-            stack_trace=stack_trace,
-            message=message,
-        )
-
 
+@api_exception("INVALID_TOKEN", "The provided token is invalid or expired.")
 class TokenException(UnauthorizedException):
     """
     Used for JWT token validation failures, expired or malformed tokens.
     """
 
-    def __init__(
-        self,
-        error_code: str = "INVALID_TOKEN",
-        details: Optional[str] = None,
-        stack_trace: Optional[str] = None,
-        message: str = "The provided token is invalid or expired.",
-    ):
-        super().__init__(
-            error_code=error_code,
-            details=details,
-            stack_trace=stack_trace,
-            message=message,
-        )
-
 
+@api_exception("USER_NOT_FOUND", "User with the user id: USER_ID does not exist.")
 class UserNotFoundException(NotFoundException):
     """
     Used when user lookup operations fail to find specified user.
     """
 
-    def __init__(
-        self,
-        error_code: str = "USER_NOT_FOUND",
-        details: Optional[str] = None,
-        stack_trace: Optional[str] = None,
-        message: str = "User with the user id: USER_ID does not exist.",
-    ):
-        super().__init__(
-            error_code=error_code,
-            details=details,
-            stack_trace=stack_trace,
-            message=message,
-        )
-
 
+@api_exception(
+    "USER_ALREADY_EXISTS", "A user with the provided credentials already exists."
+)
 class UserAlreadyExistsException(ConflictException):
     """
     Used during user registration when email/username already exists.
     """
 
-    def __init__(
-        self,
-        error_code: str = "USER_ALREADY_EXISTS",
-        details: Optional[str] = None,
-        stack_trace: Optional[str] = None,
-        message: str = "A user with the provided credentials already exists.",
-    ):
-        super().__init__(
-            error_code=error_code,
-            details=details,
-            stack_trace=stack_trace,
-            message=message,
-        )
-
 
+@api_exception("SESSION_NOT_FOUND", "Chat session cannot be found.")
 class SessionNotFoundException(NotFoundException):
     """
     Used when chat session lookup operations fail to find specified session.
     """
 
-    def __init__(
-        self,
-        error_code: str = "SESSION_NOT_FOUND",
-        details: Optional[str] = None,
-        stack_trace: Optional[str] = None,
-        message: str = "Chat session cannot be found.",
-    ):
-        super().__init__(
-            error_code=error_code,
-            details=details,
-            stack_trace=stack_trace,
-            message=message,
-        )
-
 
+@api_exception("DOCUMENT_NOT_FOUND", "Document cannot be found.")
 class DocumentNotFoundException(NotFoundException):
     """
     Used when document lookup operations fail to find specified document.
     """
 
-    def __init__(
-        self,
-        error_code: str = "DOCUMENT_NOT_FOUND",
-        details: Optional[str] = None,
-        stack_trace: Optional[str] = None,
-        message: str = "Document cannot be found.",
-    ):
-        super().__init__(
-            error_code=error_code,
-            details=details,
-            stack_trace=stack_trace,
-            message=message,
-        )
-
 
+@api_exception("MESSAGE_NOT_FOUND", "Chat message cannot be found.")
 class MessageNotFoundException(NotFoundException):
     """
     Used when chat message lookup operations fail to find specified message.
     """
 
-    def __init__(
-        self,
-        error_code: str = "MESSAGE_NOT_FOUND",
-        details: Optional[str] = None,
-        stack_trace: Optional[str] = None,
-        message: str = "Chat message cannot be found.",
-    ):
-        super().__init__(
-            error_code=error_code,
-            details=details,
-            stack_trace=stack_trace,
-            message=message,
-        )
-
 
+@api_exception("DOCUMENT_UPLOAD_ERROR", "Failed to upload document.")
 class DocumentUploadException(BadRequestException):
     """
     Used when document upload operations fail due to processing errors.
     """
 
-    def __init__(
-        self,
-        error_code: str = "DOCUMENT_UPLOAD_ERROR",
-        details: Optional[str] = None,
-        stack_trace: Optional[str] = None,
-        message: str = "Failed to upload document.",
-    ):
-        super().__init__(
-            error_code=error_code,
-            details=details,
-            stack_trace=stack_trace,
-            message=message,
-        )
-
 
+@api_exception("FILE_SIZE_EXCEEDED", "File size limit exceeded.")
 class FileSizeException(BadRequestException):
     """
     Used when uploaded files exceed maximum size limits.
     """
 
-    def __init__(
-        self,
-        error_code: str = "FILE_SIZE_EXCEEDED",
-        details: Optional[str] = None,
-        stack_trace: Optional[str] = None,
-        message: str = "File size limit exceeded.",
-    ):
-        super().__init__(
-            error_code=error_code,
-            details=details,
-            stack_trace=stack_trace,
-            message=message,
-        )
-
 
+@api_exception("UNSUPPORTED_FILE_TYPE", "The file type is not supported")
 class FileTypeException(BadRequestException):
     """
     Used when uploaded files have unsupported file types or formats.
     """
 
-    def __init__(
-        self,
-        error_code: str = "UNSUPPORTED_FILE_TYPE",
-        details: Optional[str] = None,
-        stack_trace: Optional[str] = None,
-        message: str = "The file type is not supported",
-    ):
-        super().__init__(
-            error_code=error_code,
-            details=details,
-            stack_trace=stack_trace,
-            message=message,
-        )
-
 
+@api_exception("QUOTA_EXCEEDED", "Your quota has been exceeded.")
 class QuotaExceededException(TooManyRequestsException):
     """
     Used when users exceed their usage quotas or subscription limits.
     """
 
-    def __init__(
-        self,
-        error_code: str = "QUOTA_EXCEEDED",
-        details: Optional[str] = None,
-        stack_trace: Optional[str] = None,
-        message: str = "Your quota has been exceeded.",
-    ):
-        super().__init__(
-            error_code=error_code,
-            details=details,
-            stack_trace=stack_trace,
-            message=message,
-        )
-
 
+@api_exception("CHATBOT_ERROR", "An error occurred while processing your request.")
 class ChatbotException(InternalServerException):
     """
     Used when AI/chatbot processing fails or encounters errors.
     """
 
-    def __init__(
-        self,
-        error_code: str = "CHATBOT_ERROR",
-        details: Optional[str] = None,
-        stack_trace: Optional[str] = None,
-        message: str = "An error occurred while processing your request.",
-    ):
-        super().__init__(
-            error_code=error_code,
-            details=details,
-            stack_trace=stack_trace,
-            message=message,
-        )
-
 
+@api_exception("DATABASE_ERROR", "A database error occurred.")
 class DatabaseException(InternalServerException):
     """
     Used when database operations fail or encounter connection issues.
@@ -501,35 +433,27 @@ class DatabaseException(InternalServerException):
         message: str,
         error_code: str = "DATABASE_ERROR",
         details: Optional[str] = None,
-        stack_trace: Optional[str] = None,
+        stack_trace: Optional[StackTrace] = None,
+        *,
+        capture_trace: bool = False,
     ):
-        super().__init__(
-            error_code=error_code,
-            details=details,
-            stack_trace=stack_trace,
+        if capture_trace and stack_trace is None:
+            stack_trace = sys.exception()
+
+        ApiException.__init__(
+            self,
+            error_detail=_error_detail(error_code, details, stack_trace),
+            status_code=self.STATUS_CODE,
             message=message,
         )
 
 
+@api_exception("EXPORT_ERROR", "Failed to export the data.")
 class ExportException(InternalServerException):
     """
     Used when export operations (PDF, TXT) fail to generate or process files.
     """
 
-    def __init__(
-        self,
-        error_code: str = "EXPORT_ERROR",
-        details: Optional[str] = None,
-        stack_trace: Optional[str] = None,
-        message: str = "Failed to export the data.",
-    ):
-        super().__init__(
-            error_code=error_code,
-            details=details,
-            stack_trace=stack_trace,
-            message=message,
-        )
-
 
 # class NetworkException(InternalServerException):
 #     """For external API/network failures"""
@@ -543,61 +467,53 @@ class ExportException(InternalServerException):
 #     """For business rule violations"""
 
 
+@api_exception("VALIDATION_ERROR", "Data validation failed.")
 class ValidationException(UnprocessableEntityException):
     """
     Used when request data fails validation rules or business logic checks.
     """
 
-    def __init__(
-        self,
-        error_code: str = "VALIDATION_ERROR",
-        details: Optional[str] = None,
-        stack_trace: Optional[str] = None,
-        message: str = "Data validation failed.",
-    ):
-        super().__init__(
-            error_code=error_code,
-            details=details,
-            stack_trace=stack_trace,
-            message=message,
-        )
-
 
+@api_exception(
+    "PERMISSION_DENIED", "You do not have permission to perform this action."
+)
 class PermissionException(ForbiddenException):
     """
     Used when users lack required permissions to access resources or perform actions.
     """
 
-    def __init__(
-        self,
-        error_code: str = "PERMISSION_DENIED",
-        details: Optional[str] = None,
-        stack_trace: Optional[str] = None,
-        message: str = "You do not have permission to perform this action.",
-    ):
-        super().__init__(
-            error_code=error_code,
-            details=details,
-            stack_trace=stack_trace,
-            message=message,
-        )
-
 
+@api_exception(
+    "ADMIN_REQUIRED", "Administrator privileges are required to access this resource."
+)
 class AdminRequiredException(ForbiddenException):
     """
     Used when non-admin users attempt to access admin-only resources or endpoints.
     """
 
-    def __init__(
-        self,
-        error_code: str = "ADMIN_REQUIRED",
-        details: Optional[str] = None,
-        stack_trace: Optional[str] = None,
-        message: str = "Administrator privileges are required to access this resource.",
-    ):
-        super().__init__(
-            error_code=error_code,
-            details=details,
-            stack_trace=stack_trace,
-            message=message,
-        )
+
+def _build_exception_registry() -> dict[str, type[ApiException]]:
+    """Map every exception's default error code to its class."""
+
+    registry: dict[str, type[ApiException]] = {}
+    pending = list(ApiException.__subclasses__())
+    while pending:
+        cls = pending.pop()
+        if cls.DEFAULT_CODE in registry:
+            raise RuntimeError(
+                f"Duplicate error code {cls.DEFAULT_CODE!r}: "
+                f"{registry[cls.DEFAULT_CODE].__name__} and {cls.__name__}"
+            )
+        registry[cls.DEFAULT_CODE] = cls
+        pending.extend(cls.__subclasses__())
+    return registry
+
+
+# Look up an exception class by error code, e.g. EXCEPTION_REGISTRY["USER_NOT_FOUND"]
+EXCEPTION_REGISTRY = _build_exception_registry()
+
+# The status code and default message of every error code
+ERROR_CODES: dict[str, tuple[int, str]] = {
+    code: (cls.STATUS_CODE, cls.DEFAULT_MESSAGE)
+    for code, cls in EXCEPTION_REGISTRY.items()
+}
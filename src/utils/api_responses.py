@@ -1,13 +1,16 @@
 """This module defines custom responses for handling API responses."""
 
+import functools
 import json
+import traceback
+from dataclasses import dataclass
+from typing import Any, Mapping, override, Optional
 
-from typing import Any, override, Optional
+import orjson
 from pydantic import BaseModel, Field
 from starlette.responses import JSONResponse
 from fastapi import status
 
-
 # ----------------------- Pydantic Models -----------------------
 
 
@@ -29,22 +32,109 @@ class SuccessResponseModel(ResponseModel):
     )
 
 
-class ErrorDetail(BaseModel):
-    """Pydantic model for detailed error information."""
+# Error bodies are only built from trusted in-process values, so they are
+# plain dataclasses rather than validated Pydantic models.
 
-    code: str = Field(description="Error code representing the type of error.")
 
-    details: Optional[str] = Field(default=None, description="Detailed error message.")
+# A preformatted trace, or the exception whose traceback is formatted on demand
+StackTrace = str | BaseException
 
-    stack_trace: Optional[str] = Field(
-        default=None, description="Optional stack trace for debugging purposes."
-    )
 
+@functools.cache
+def _include_stack_traces() -> bool:
+    """Stack traces are only sent to clients in development."""
+    # Imported on first use so the exception modules don't load the settings
+    from src.config.settings import settings
+
+    return settings.app.ENV == "development"
+
+
+def format_stack_trace(stack_trace: Optional[StackTrace]) -> Optional[str]:
+    """Format a stack trace for output; exceptions are formatted only here."""
+
+    if isinstance(stack_trace, BaseException):
+        return "".join(traceback.format_exception(stack_trace))
+    return stack_trace
+
+
+def exception_chain(exc: BaseException) -> list[dict[str, Any]]:
+    """
+    Describe an exception and its causes, outermost first, as a list of
+    {"type", "message", "location"} entries for structured logs.
+    """
+
+    chain = []
+    seen = set()
+    current: Optional[BaseException] = exc
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        tb = current.__traceback__
+        while tb is not None and tb.tb_next is not None:
+            tb = tb.tb_next
+        chain.append(
+            {
+                "type": type(current).__qualname__,
+                "message": str(current),
+                "location": (
+                    f"{tb.tb_frame.f_code.co_filename}:{tb.tb_lineno}"
+                    if tb is not None
+                    else None
+                ),
+            }
+        )
+        current = current.__cause__ or (
+            None if current.__suppress_context__ else current.__context__
+        )
+    return chain
+
+
+@dataclass(slots=True, frozen=True)
+class ErrorDetail:
+    """Detailed error information."""
+
+    # Error code representing the type of error.
+    code: str
+
+    # Detailed error message.
+    details: Optional[str] = None
+
+    # Optional stack trace for debugging purposes. Passing the exception
+    # defers formatting its traceback until a response actually includes it.
+    stack_trace: Optional[StackTrace] = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Return the error detail as a JSON-serialisable dict. Fields without a
+        value are left out.
+        """
+        data: dict[str, Any] = {"code": self.code}
+        if self.details is not None:
+            data["details"] = self.details
+        if self.stack_trace is not None and _include_stack_traces():
+            data["stack_trace"] = format_stack_trace(self.stack_trace)
+        return data
+
+
+@dataclass(slots=True, frozen=True)
+class ErrorResponseModel:
+    """Body of error responses."""
+
+    # High-level message for the error response.
+    message: str
+
+    # An object containing error details.
+    error: ErrorDetail
 
-class ErrorResponseModel(ResponseModel):
-    """Pydantic model for error responses."""
+    # Always False for errors; kept for parity with ResponseModel.
+    success: bool = False
 
-    error: ErrorDetail = Field(description="An object containing error details.")
+    def to_dict(self) -> dict[str, Any]:
+        """Return the error body as a JSON-serialisable dict."""
+        return {
+            "success": self.success,
+            "message": self.message,
+            "error": self.error.to_dict(),
+        }
 
 
 # ---------------- # Response Classes (extends JSONResponse) ----------------
@@ -59,11 +149,24 @@ class SuccessResponse(JSONResponse):
         message: str = "Request successful",
         status_code: int = status.HTTP_200_OK,
     ):
-        payload = SuccessResponseModel(success=True, message=message, data=data)
+        # Built from trusted in-process values, so validation is skipped
+        payload = SuccessResponseModel.model_construct(
+            success=True, message=message, data=data
+        )
         super().__init__(status_code=status_code, content=payload.model_dump())
 
 
-class ErrorResponse(JSONResponse):
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib json module."""
+
+    media_type = "application/json"
+
+    @override
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+class ErrorResponse(ORJSONResponse):
     """Custom JSON response for error handling."""
 
     def __init__(
@@ -71,9 +174,12 @@ class ErrorResponse(JSONResponse):
         error: ErrorDetail,
         message: str,
         status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR,
+        headers: Optional[Mapping[str, str]] = None,
     ):
-        payload = ErrorResponseModel(success=False, message=message, error=error)
-        super().__init__(status_code=status_code, content=payload.model_dump())
+        payload = ErrorResponseModel(message=message, error=error)
+        super().__init__(
+            status_code=status_code, content=payload.to_dict(), headers=headers
+        )
 
 
 class CustomJSONEncoder(json.JSONEncoder):
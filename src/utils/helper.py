@@ -2,47 +2,102 @@
 This module provides utility classes for common application-wide functionality.
 """
 
-from typing import Any, Coroutine
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 import bcrypt
 
-from src.config.settings import settings
-from src.logger.default_logger import logger
+# bcrypt is CPU-bound and releases the GIL, so it runs on its own bounded pool
+# rather than the default executor shared with file and database I/O
+_password_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="password-hash"
+)
+
+
+def _bcrypt_cost() -> int:
+    # Imported here so importing this module doesn't load the settings; read
+    # per call so the cost can be changed at runtime (e.g. in tests)
+    from src.config.settings import settings
+
+    return settings.auth.BCRYPT_COST
+
+
+def _sync_hash(password: bytes) -> bytes:
+    return bcrypt.hashpw(password, bcrypt.gensalt(_bcrypt_cost()))
+
+
+def _to_bytes(value: str | bytes) -> bytes:
+    return value.encode("utf-8") if isinstance(value, str) else value
 
 
 class Cryptography:
     """Handles all operations that involved with cryptography"""
 
     @staticmethod
-    async def hash_password(password: str) -> str:
+    async def hash_password(password: str | bytes) -> str:
         """
         Hashes a plain-text password using bcrypt with a generated salt.
 
         Args:
-            password (str): The plain-text password to hash.
+            password (str | bytes): The plain-text password to hash.
 
         Returns:
-            bytes: The bcrypt hashed password, including the salt.
+            str: The bcrypt hashed password, including the salt, as stored in
+            the users table.
         """
 
-        SALT_ROUNDS = 12
-        salt = bcrypt.gensalt(SALT_ROUNDS)
-        return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+        loop = asyncio.get_running_loop()
+        hashed = await loop.run_in_executor(
+            _password_executor, _sync_hash, _to_bytes(password)
+        )
+        # bcrypt hashes are ASCII
+        return hashed.decode("ascii")
 
     @staticmethod
-    async def verify_password(password: str, hashed_password: bytes) -> bool:
+    async def verify_password(
+        password: str | bytes, hashed_password: str | bytes
+    ) -> bool:
         """
         Verifies a plain-text password against its bcrypt hash.
 
         Args:
-            password (str): The plain-text password to check.
-            hashed_password (bytes): The bcrypt hashed password retrieved from storage.
+            password (str | bytes): The plain-text password to check.
+            hashed_password (str | bytes): The bcrypt hashed password retrieved
+            from storage.
 
         Returns:
             bool: True if the password matches the hash, False otherwise.
         """
 
-        return bcrypt.checkpw(password.encode("utf-8"), hashed_password)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _password_executor,
+            bcrypt.checkpw,
+            _to_bytes(password),
+            _to_bytes(hashed_password),
+        )
+
+    @staticmethod
+    def needs_rehash(hashed_password: str | bytes) -> bool:
+        """
+        Checks whether a hash was made with a different cost than the configured
+        BCRYPT_COST, so it can be re-hashed after the next successful login.
+
+        Args:
+            hashed_password (str | bytes): The bcrypt hashed password retrieved
+            from storage.
+
+        Returns:
+            bool: True if the hash should be replaced, False otherwise.
+        """
+
+        # bcrypt hashes have the form $2b$<cost>$<salt+hash>
+        try:
+            cost = int(_to_bytes(hashed_password).split(b"$")[2])
+        except (IndexError, ValueError):
+            return True
+        return cost != _bcrypt_cost()
 
 
 class ResponseDelivery:
@@ -0,0 +1,44 @@
+"""
+Shared fixtures for the database tests.
+"""
+
+import uuid
+
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.config.settings import settings
+from src.database.models.plan_model import Plan
+
+DATABASE_URL = str(settings.database.DATABASE_URL.get_secret_value())
+
+
+@pytest_asyncio.fixture
+async def db_session():
+    """A session whose changes are rolled back after the test."""
+
+    engine = create_async_engine(DATABASE_URL)
+    try:
+        async with engine.connect() as connection:
+            transaction = await connection.begin()
+            try:
+                yield AsyncSession(bind=connection, expire_on_commit=False)
+            finally:
+                await transaction.rollback()
+    finally:
+        await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def plan(db_session) -> Plan:
+    """A plan that test users can be subscribed to."""
+
+    plan = Plan(
+        name=f"test-{uuid.uuid4().hex[:8]}",
+        token_limit_daily=0,
+        document_limit=0,
+        session_limit=0,
+    )
+    db_session.add(plan)
+    await db_session.flush()
+    return plan
@@ -2,53 +2,80 @@
 Handles database connection testing.
 """
 
+import os
+
 import asyncpg
 import pytest
+import pytest_asyncio
+from sqlalchemy.engine import make_url
 
 from src.config.settings import settings
 from src.logger.default_logger import logger
 
 DATABASE_URL = str(settings.database.DATABASE_URL.get_secret_value())
 
+# Parsed once here. asyncpg can't take the URL itself, since it rejects
+# SQLAlchemy's "postgresql+asyncpg" scheme.
+_url = make_url(DATABASE_URL)
+DSN_PARAMS = {
+    "host": _url.host,
+    "port": _url.port,
+    "user": _url.username,
+    "password": _url.password,
+    "database": _url.database,
+}
+
+
+@pytest_asyncio.fixture(scope="class", loop_scope="class")
+async def db_pool():
+    """One connection pool shared by every test in the class."""
+
+    # The tests run one-off queries, so caching their prepared statements
+    # would only add work
+    pool = await asyncpg.create_pool(
+        **DSN_PARAMS, min_size=1, max_size=2, statement_cache_size=0
+    )
+    try:
+        yield pool
+    finally:
+        await pool.close()
+
 
+@pytest_asyncio.fixture(loop_scope="class")
+async def conn(db_pool):
+    """A pooled connection, returned to the pool after the test."""
+
+    async with db_pool.acquire() as connection:
+        yield connection
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(
+    not os.getenv("RUN_DB_TESTS"), reason="set RUN_DB_TESTS=1 to run database tests"
+)
+@pytest.mark.asyncio(loop_scope="class")
 class TestDatabaseConnection:
     """Tests if the application can connect to the database"""
 
-    @pytest.mark.asyncio
-    async def test_database_connection(self):
+    async def test_database_connection(self, conn):
         """Tests if the database connection can be successfully made."""
 
-        conn = None
-        try:
-            conn = await asyncpg.connect(DATABASE_URL)
-            result = await conn.fetchval("SELECT version()")
+        result = await conn.fetchval("SELECT version()")
 
-            logger.info(f"Connection successful! PostgresSQL version: {result}")
-            assert result is not None, "Expected PostgresSQL version but got None"
+        logger.info(f"Connection successful! PostgresSQL version: {result}")
+        assert result is not None, "Expected PostgresSQL version but got None"
 
-        finally:
-            if conn is not None:
-                await conn.close()
-
-    @pytest.mark.asyncio
-    async def test_table_creation(self):
+    async def test_table_creation(self, conn):
         """Tests if table creation is possible in the database."""
 
-        conn = None
-        try:
-            conn = await asyncpg.connect(DATABASE_URL)
-            result = await conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS test_table (
-                    id SERIAL PRIMARY KEY,
-                    name VARCHAR(50)
-                )
-                """
+        result = await conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS test_table (
+                id SERIAL PRIMARY KEY,
+                name VARCHAR(50)
             )
+            """
+        )
 
-            logger.info("Table creation successful!")
-            assert result.startswith("CREATE TABLE") or result.startswith("CREATE TABLE IF NOT EXISTS")
-
-        finally:
-            if conn is not None:
-                await conn.close()
+        logger.info("Table creation successful!")
+        assert result.startswith("CREATE TABLE") or result.startswith("CREATE TABLE IF NOT EXISTS")
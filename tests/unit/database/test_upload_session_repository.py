@@ -0,0 +1,70 @@
+"""
+Handles upload session repository testing.
+"""
+
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.database.models.upload_session_model import UPLOAD_COMMITTED
+from src.database.repositories.upload_session_repo import UploadSessionRepository
+from src.database.repositories.user_repo import UserRepository
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(
+    not os.getenv("RUN_DB_TESTS"), reason="set RUN_DB_TESTS=1 to run database tests"
+)
+@pytest.mark.asyncio
+class TestUploadSessionRepository:
+    """Tests the upload session repository against the database"""
+
+    async def _create_upload(self, repo, user_id, expires_in: timedelta):
+        file_id = uuid.uuid4()
+        return await repo.create(
+            {
+                "id": file_id,
+                "user_id": user_id,
+                "storage_key": f"users/{user_id}/files/{file_id}.pdf",
+                "filename": "report.pdf",
+                "content_type": "application/pdf",
+                "size": 1024,
+                "expires_at": datetime.now(timezone.utc) + expires_in,
+            }
+        )
+
+    async def test_upload_lifecycle(self, db_session, plan):
+        """Tests recording, committing and cleaning up direct uploads."""
+
+        suffix = uuid.uuid4().hex[:8]
+        user = await UserRepository(db_session).create(
+            {
+                "username": f"uploader-{suffix}",
+                "email": f"uploader-{suffix}@example.com",
+                "hashed_password": "hash",
+                "plan_id": plan.id,
+            }
+        )
+        repo = UploadSessionRepository(db_session)
+        active = await self._create_upload(repo, user.id, timedelta(minutes=15))
+        expired = await self._create_upload(repo, user.id, timedelta(minutes=-1))
+
+        # Only the owner can see an upload
+        assert await repo.get_for_user(active.id, uuid.uuid4()) is None
+        assert (await repo.get_for_user(active.id, user.id)).status == "pending"
+
+        committed = await repo.mark_committed(active.id, datetime.now(timezone.utc))
+        assert committed.status == UPLOAD_COMMITTED
+        assert committed.completed_at is not None
+        # A second confirmation doesn't commit it again
+        assert await repo.mark_committed(active.id, datetime.now(timezone.utc)) is None
+
+        now = datetime.now(timezone.utc)
+        stale = [upload.id for upload in await repo.get_expired_pending(now)]
+        assert expired.id in stale and active.id not in stale
+
+        await repo.delete_pending(stale)
+        assert await repo.get_for_user(expired.id, user.id) is None
+        assert await repo.get_for_user(active.id, user.id) is not None
@@ -0,0 +1,141 @@
+"""
+Handles user repository testing.
+"""
+
+import os
+import uuid
+
+import pytest
+
+from src.database.models.chat_session_model import ChatSession
+from src.database.models.user_model import User
+from src.database.repositories.user_repo import UserRepository
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(
+    not os.getenv("RUN_DB_TESTS"), reason="set RUN_DB_TESTS=1 to run database tests"
+)
+@pytest.mark.asyncio
+class TestUserRepository:
+    """Tests the user repository against the database"""
+
+    async def test_update_returns_new_values_for_loaded_user(self, db_session, plan):
+        """Tests that updating a user already in the session returns the new row."""
+
+        repo = UserRepository(db_session, user_cache={})
+        suffix = uuid.uuid4().hex[:8]
+        user = await repo.create(
+            {
+                "username": f"old-{suffix}",
+                "email": f"user-{suffix}@example.com",
+                "hashed_password": "hash",
+                "plan_id": plan.id,
+            }
+        )
+
+        # Load the user first, so it is in the session's identity map and cache
+        loaded = await repo.get_by_id(user.id)
+        assert loaded.username == f"old-{suffix}"
+
+        updated = await repo.update(
+            user.id, {"username": f"new-{suffix}", "total_tokens_used": 42}
+        )
+
+        assert updated.username == f"new-{suffix}"
+        assert updated.total_tokens_used == 42
+        assert (await repo.get_by_id(user.id)).username == f"new-{suffix}"
+
+    async def _create_users(self, repo, plan, count: int):
+        suffix = uuid.uuid4().hex[:8]
+        return await repo.create_many(
+            [
+                {
+                    "username": f"user-{suffix}-{index}",
+                    "email": f"User-{suffix}-{index}@Example.com",
+                    "hashed_password": "hash",
+                    "plan_id": plan.id,
+                }
+                for index in range(count)
+            ]
+        )
+
+    async def test_create_many_returns_users_with_lowercased_emails(
+        self, db_session, plan
+    ):
+        """Tests that bulk created users come back as entities, normalized."""
+
+        users = await self._create_users(UserRepository(db_session), plan, 3)
+
+        assert len(users) == 3
+        assert all(isinstance(user, User) for user in users)
+        assert all(user.email == user.email.lower() for user in users)
+        assert all(user.id is not None for user in users)
+
+    async def test_insert_many_returns_count(self, db_session, plan):
+        """Tests the Core bulk insert path."""
+
+        repo = UserRepository(db_session)
+        suffix = uuid.uuid4().hex[:8]
+
+        inserted = await repo.insert_many(
+            [
+                {
+                    "username": f"core-{suffix}-{index}",
+                    "email": f"Core-{suffix}-{index}@Example.com",
+                    "hashed_password": "hash",
+                    "plan_id": plan.id,
+                }
+                for index in range(2)
+            ]
+        )
+
+        assert inserted == 2
+        assert await repo.count({"plan_id": plan.id}) == 2
+        assert await repo.get_by_email(f"core-{suffix}-0@example.com") is not None
+
+    async def test_pagination_last_page_and_past_it(self, db_session, plan):
+        """Tests the window count on the last page and the fallback past it."""
+
+        repo = UserRepository(db_session)
+        await self._create_users(repo, plan, 5)
+        criteria = {"plan_id": plan.id}
+
+        first, total = await repo.get_with_pagination(1, 2, criteria)
+        assert (len(first), total) == (2, 5)
+
+        last, total = await repo.get_with_pagination(3, 2, criteria)
+        assert (len(last), total) == (1, 5)
+
+        past, total = await repo.get_with_pagination(4, 2, criteria)
+        assert (past, total) == ([], 5)
+
+        empty, total = await repo.get_with_pagination(1, 2, {"plan_id": uuid.uuid4()})
+        assert (empty, total) == ([], 0)
+
+    async def test_get_by_id_loads_plan_and_chat_sessions(self, db_session, plan):
+        """Tests that raiseload still lets callers use the eager relationships."""
+
+        repo = UserRepository(db_session)
+        (user,) = await self._create_users(repo, plan, 1)
+        db_session.add(ChatSession(user_id=user.id, title="First chat"))
+        await db_session.flush()
+        db_session.expunge_all()
+
+        loaded = await repo.get_by_id(user.id)
+
+        assert loaded.plan.id == plan.id
+        assert [session.title for session in loaded.chat_sessions] == ["First chat"]
+
+    async def test_columns_only_lookups(self, db_session, plan):
+        """Tests the lookups that skip building a User entity."""
+
+        repo = UserRepository(db_session)
+        (user,) = await self._create_users(repo, plan, 1)
+
+        user_id, hashed_password, is_active = await repo.get_auth_payload(user.email)
+        assert (user_id, hashed_password, is_active) == (user.id, "hash", True)
+        assert await repo.get_auth_payload("nobody@example.com") is None
+
+        assert await repo.get_id_if_exists({"username": user.username}) == user.id
+        assert await repo.get_id_if_exists({"username": "no-such-user"}) is None
@@ -0,0 +1,127 @@
+"""
+Handles testing of the S3 storage adapter against a mocked S3.
+"""
+
+import os
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from src.services.uploads.storage_adapters import CloudStorageAdapter
+
+# The adapter imports boto3 lazily, so only these tests need it
+boto3 = pytest.importorskip("boto3")
+moto = pytest.importorskip("moto")
+
+BUCKET = "docuchat-test"
+MIB = 1024 * 1024
+
+
+@pytest.fixture
+def s3_adapter(monkeypatch):
+    """A CloudStorageAdapter talking to moto's in-memory S3."""
+
+    for name, value in (
+        ("AWS_ACCESS_KEY_ID", "testing"),
+        ("AWS_SECRET_ACCESS_KEY", "testing"),
+        ("AWS_DEFAULT_REGION", "us-east-1"),
+    ):
+        monkeypatch.setenv(name, value)
+    monkeypatch.delenv("AWS_PROFILE", raising=False)
+
+    with moto.mock_aws():
+        # 5 MiB is the smallest part size S3 accepts
+        adapter = CloudStorageAdapter(
+            BUCKET, region="us-east-1", multipart_chunk_mb=5, max_concurrency=4
+        )
+        adapter.client.create_bucket(Bucket=BUCKET)
+        yield adapter
+
+
+async def _write(writer, data: bytes, chunk_size: int = MIB) -> None:
+    for start in range(0, len(data), chunk_size):
+        await writer.write(memoryview(data)[start : start + chunk_size])
+
+
+@pytest.mark.asyncio
+class TestCloudStorageAdapter:
+    """Tests streaming files to S3 and signing direct upload URLs"""
+
+    async def test_large_file_uses_multipart_upload(self, s3_adapter):
+        """A file over the part size is stored as a multipart upload."""
+
+        data = os.urandom(12 * MIB)
+        writer = s3_adapter.open_writer(
+            "users/u/files/big.pdf",
+            content_type="application/pdf",
+            metadata={"mime-type": "application/pdf"},
+        )
+        await _write(writer, data)
+
+        location = await writer.commit()
+
+        assert location == f"s3://{BUCKET}/users/u/files/big.pdf"
+        head = s3_adapter.client.head_object(Bucket=BUCKET, Key="users/u/files/big.pdf")
+        # Multipart ETags end with the number of parts: 5 + 5 + 2 MiB
+        assert head["ETag"].strip('"').endswith("-3")
+        assert head["ContentType"] == "application/pdf"
+        body = s3_adapter.client.get_object(Bucket=BUCKET, Key="users/u/files/big.pdf")
+        assert body["Body"].read() == data
+
+        assert await s3_adapter.get_file_size("users/u/files/big.pdf") == len(data)
+        assert await s3_adapter.get_file_metadata("users/u/files/big.pdf") == {
+            "mime-type": "application/pdf"
+        }
+
+    async def test_small_file_uses_single_put(self, s3_adapter):
+        """A file under the part size is stored with a single PUT."""
+
+        writer = s3_adapter.open_writer("users/u/files/small.txt")
+        await _write(writer, b"hello")
+        await writer.commit()
+
+        head = s3_adapter.client.head_object(
+            Bucket=BUCKET, Key="users/u/files/small.txt"
+        )
+        assert "-" not in head["ETag"]
+        assert head["ContentLength"] == 5
+
+    async def test_commit_and_abort_close_spooled_file(self, s3_adapter):
+        """The spooled temporary file is closed whether the file is kept or not."""
+
+        committed = s3_adapter.open_writer("users/u/files/kept.txt")
+        await _write(committed, b"kept")
+        spooled = committed._file
+        await committed.commit()
+        assert spooled.closed and committed._file is None
+
+        aborted = s3_adapter.open_writer("users/u/files/dropped.txt")
+        await _write(aborted, b"x" * (2 * MIB))
+        spooled = aborted._file
+        await aborted.abort()
+
+        assert spooled.closed and aborted._file is None
+        assert await s3_adapter.get_file_size("users/u/files/dropped.txt") is None
+
+    async def test_missing_file(self, s3_adapter):
+        """Missing keys report no size or metadata instead of raising."""
+
+        assert await s3_adapter.get_file_size("users/u/files/none.txt") is None
+        assert await s3_adapter.get_file_metadata("users/u/files/none.txt") is None
+
+    async def test_create_upload_url_is_signed(self, s3_adapter):
+        """The direct upload URL is a signed, expiring PUT for the key."""
+
+        url = await s3_adapter.create_upload_url(
+            "users/u/files/direct.pdf", "application/pdf", 1024
+        )
+
+        parsed = urlparse(url)
+        query = parse_qs(parsed.query)
+        assert BUCKET in parsed.netloc + parsed.path
+        assert parsed.path.endswith("users/u/files/direct.pdf")
+        assert query["X-Amz-Expires"] == [str(s3_adapter.upload_url_expiry)]
+        assert "X-Amz-Signature" in query
+        # The content type and length are part of the signature
+        signed_headers = query["X-Amz-SignedHeaders"][0].split(";")
+        assert {"content-type", "content-length"} <= set(signed_headers)
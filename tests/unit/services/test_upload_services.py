@@ -0,0 +1,344 @@
+"""
+Handles testing of the upload service.
+"""
+
+import asyncio
+import hashlib
+import io
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+import pytest
+import zstandard as zstd
+from fastapi import UploadFile
+
+from src.config.settings import settings
+from src.services.uploads import upload_services
+from src.services.uploads.storage_adapters import LocalStorageAdapter
+from src.services.uploads.upload_services import (
+    MIME_TYPE_METADATA_KEY,
+    FileUploadService,
+    _detect_mime_type,
+    _validate_upload,
+)
+from src.utils.api_exceptions import (
+    BadRequestException,
+    DocumentNotFoundException,
+    DocumentUploadException,
+    FileSizeException,
+    FileTypeException,
+)
+
+MAX_FILE_SIZE = settings.files.MAX_FILE_SIZE_MB * 1024 * 1024
+
+
+class TestValidateUpload:
+    """Tests the extension and size checks run before an upload is streamed"""
+
+    def test_accepts_allowed_file(self):
+        """An allowed file returns its name and lower-cased extension."""
+
+        assert _validate_upload("Report.PDF", 1024) == ("Report.PDF", ".pdf")
+
+    def test_strips_directory_components(self):
+        """Paths sent by the client are reduced to the file name."""
+
+        filename, _ = _validate_upload("../../etc/notes.txt", None)
+
+        assert filename == "notes.txt"
+
+    @pytest.mark.parametrize("filename", ["script.exe", "archive.tar.gz", "", None])
+    def test_rejects_disallowed_extension(self, filename):
+        """Files without an allowed extension are rejected."""
+
+        with pytest.raises(FileTypeException):
+            _validate_upload(filename, 1024)
+
+    def test_rejects_oversized_file(self):
+        """A declared size over the limit is rejected."""
+
+        with pytest.raises(FileSizeException):
+            _validate_upload("notes.md", MAX_FILE_SIZE + 1)
+
+    def test_accepts_file_at_size_limit(self):
+        """A file exactly at the size limit is allowed."""
+
+        assert _validate_upload("notes.md", MAX_FILE_SIZE) == ("notes.md", ".md")
+
+
+class TestDetectMimeType:
+    """Tests detecting a file's MIME type from its first bytes"""
+
+    @pytest.mark.parametrize(
+        ("head", "extension", "mime_type"),
+        [
+            (b"%PDF-1.7\n", ".pdf", "application/pdf"),
+            (
+                b"PK\x03\x04\x14\x00",
+                ".docx",
+                "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+            ),
+            (b"plain text", ".txt", "text/plain"),
+            (b"# Title", ".md", "text/markdown"),
+        ],
+    )
+    def test_detects_matching_content(self, head, extension, mime_type):
+        """Content matching the extension returns the extension's MIME type."""
+
+        assert _detect_mime_type(head, extension) == mime_type
+
+    @pytest.mark.parametrize(
+        ("head", "extension"),
+        [
+            (b"PK\x03\x04", ".pdf"),
+            (b"%PDF-1.7", ".docx"),
+            (b"text\x00with NUL", ".txt"),
+        ],
+    )
+    def test_rejects_mismatched_content(self, head, extension):
+        """Content that doesn't match the extension is rejected."""
+
+        with pytest.raises(FileTypeException):
+            _detect_mime_type(head, extension)
+
+    def test_unknown_extension_is_octet_stream(self):
+        """Extensions without a known signature fall back to a generic type."""
+
+        assert _detect_mime_type(b"\x00\x01", ".bin") == "application/octet-stream"
+
+
+def _stored_files(root) -> list:
+    return [path for path in root.rglob("*") if path.is_file()]
+
+
+@pytest.fixture
+def service(tmp_path) -> FileUploadService:
+    return FileUploadService(LocalStorageAdapter(str(tmp_path)))
+
+
+@pytest.mark.asyncio
+class TestUploadFile:
+    """Tests streaming an upload to storage in chunks"""
+
+    async def test_streams_file_to_storage(self, service, tmp_path):
+        """A multi-chunk file is stored whole, with its size and hash."""
+
+        content = b"line of text\n" * 200_000  # spans several read chunks
+        upload = UploadFile(io.BytesIO(content), filename="notes.txt")
+
+        result = await service.upload_file(upload, uuid4())
+
+        assert result["size"] == len(content)
+        assert result["sha256"] == hashlib.sha256(content).hexdigest()
+        data = Path(result["location"]).read_bytes()
+        if result["compressed"]:
+            data = zstd.ZstdDecompressor().decompressobj().decompress(data)
+        assert data == content
+
+    async def test_stores_detected_mime_type(self, service, tmp_path):
+        """The detected MIME type is kept in the stored file's metadata."""
+
+        upload = UploadFile(io.BytesIO(b"%PDF-1.7\n..."), filename="report.pdf")
+
+        result = await service.upload_file(upload, uuid4())
+
+        key = Path(result["location"]).relative_to(tmp_path).as_posix()
+        metadata = await service.storage.get_file_metadata(key)
+        assert metadata == {MIME_TYPE_METADATA_KEY: "application/pdf"}
+
+        await service.storage.delete_file(key)
+        assert _stored_files(tmp_path) == []
+
+    async def test_rejects_oversized_stream(self, service, tmp_path, monkeypatch):
+        """A file over the limit fails mid-stream and leaves nothing behind."""
+
+        monkeypatch.setattr(upload_services, "_max_file_size", lambda: 1 << 20)
+        upload = UploadFile(io.BytesIO(b"x" * (3 << 20)), filename="big.txt")
+
+        with pytest.raises(FileSizeException):
+            await service.upload_file(upload, uuid4())
+
+        assert _stored_files(tmp_path) == []
+
+    async def test_cancelled_upload_leaves_no_file(self, service, tmp_path):
+        """Cancelling an upload mid-stream removes the partial file."""
+
+        # Set from the worker thread that reads the upload
+        started = threading.Event()
+
+        class SlowFile(io.BytesIO):
+            def readinto(self, buffer):
+                started.set()
+                return super().readinto(buffer)
+
+        upload = UploadFile(SlowFile(b"x" * (8 << 20)), filename="slow.txt")
+        task = asyncio.create_task(service.upload_file(upload, uuid4()))
+        while not started.is_set():
+            await asyncio.sleep(0.01)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert _stored_files(tmp_path) == []
+
+
+class _SignedUrlStorage(LocalStorageAdapter):
+    """Local storage that hands out a fake signed URL, like S3 would."""
+
+    async def create_upload_url(self, key, content_type, content_length):
+        return f"https://storage.test/{key}"
+
+
+class _InMemoryUploadSessions:
+    """Stands in for UploadSessionRepository."""
+
+    def __init__(self):
+        self.uploads = {}
+
+    async def create(self, session_data):
+        upload = SimpleNamespace(status="pending", completed_at=None, **session_data)
+        self.uploads[upload.id] = upload
+        return upload
+
+    async def get_for_user(self, file_id, user_id):
+        upload = self.uploads.get(file_id)
+        return upload if upload is not None and upload.user_id == user_id else None
+
+    async def mark_committed(self, file_id, completed_at):
+        upload = self.uploads.get(file_id)
+        if upload is None or upload.status != "pending":
+            return None
+        upload.status, upload.completed_at = "committed", completed_at
+        return upload
+
+    async def get_expired_pending(self, now, limit=100):
+        return [
+            upload
+            for upload in self.uploads.values()
+            if upload.status == "pending" and upload.expires_at < now
+        ][:limit]
+
+    async def delete_pending(self, file_ids):
+        for file_id in file_ids:
+            if self.uploads[file_id].status == "pending":
+                del self.uploads[file_id]
+
+
+@pytest.fixture
+def upload_sessions() -> _InMemoryUploadSessions:
+    return _InMemoryUploadSessions()
+
+
+@pytest.fixture
+def direct_service(tmp_path, upload_sessions) -> FileUploadService:
+    return FileUploadService(_SignedUrlStorage(str(tmp_path)), upload_sessions)
+
+
+def _put(tmp_path, upload, content: bytes) -> None:
+    """Simulate the client uploading to the signed URL."""
+    path = tmp_path / upload.storage_key
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+
+
+@pytest.mark.asyncio
+class TestDirectUpload:
+    """Tests signed URL uploads and their pending/committed lifecycle"""
+
+    async def test_records_pending_upload(self, direct_service, upload_sessions):
+        """Handing out a URL records a pending upload for the file and key."""
+
+        user_id = uuid4()
+        result = await direct_service.create_upload_url(
+            "report.pdf", 1024, "application/pdf", user_id
+        )
+
+        upload = upload_sessions.uploads[UUID(result["file_id"])]
+        assert upload.status == "pending"
+        assert upload.user_id == user_id
+        assert result["upload_url"].endswith(upload.storage_key)
+        assert upload.expires_at > datetime.now(timezone.utc)
+
+    async def test_complete_commits_uploaded_file(
+        self, direct_service, upload_sessions, tmp_path
+    ):
+        """Confirming an uploaded file commits it, and is idempotent."""
+
+        user_id = uuid4()
+        result = await direct_service.create_upload_url(
+            "notes.txt", 5, "text/plain", user_id
+        )
+        file_id = UUID(result["file_id"])
+        _put(tmp_path, upload_sessions.uploads[file_id], b"hello")
+
+        completed = await direct_service.complete_upload(file_id, user_id)
+        again = await direct_service.complete_upload(file_id, user_id)
+
+        assert completed["status"] == again["status"] == "committed"
+        assert completed["mime_type"] == "text/plain"
+
+    async def test_complete_requires_uploaded_file(self, direct_service):
+        """A file that was never PUT cannot be confirmed."""
+
+        user_id = uuid4()
+        result = await direct_service.create_upload_url(
+            "notes.txt", 5, "text/plain", user_id
+        )
+
+        with pytest.raises(DocumentUploadException):
+            await direct_service.complete_upload(UUID(result["file_id"]), user_id)
+
+    async def test_complete_rejects_size_mismatch(
+        self, direct_service, upload_sessions, tmp_path
+    ):
+        """A file of another size than declared is deleted and rejected."""
+
+        user_id = uuid4()
+        result = await direct_service.create_upload_url(
+            "notes.txt", 5, "text/plain", user_id
+        )
+        upload = upload_sessions.uploads[UUID(result["file_id"])]
+        _put(tmp_path, upload, b"much more than declared")
+
+        with pytest.raises(FileSizeException):
+            await direct_service.complete_upload(upload.id, user_id)
+
+        assert not (tmp_path / upload.storage_key).exists()
+        assert upload.status == "pending"
+
+    async def test_complete_checks_owner(self, direct_service):
+        """Another user's upload is reported as not found."""
+
+        result = await direct_service.create_upload_url(
+            "notes.txt", 5, "text/plain", uuid4()
+        )
+
+        with pytest.raises(DocumentNotFoundException):
+            await direct_service.complete_upload(UUID(result["file_id"]), uuid4())
+
+    async def test_cleanup_removes_expired_uploads(
+        self, direct_service, upload_sessions, tmp_path
+    ):
+        """Expired pending uploads and their stray objects are deleted."""
+
+        user_id = uuid4()
+        result = await direct_service.create_upload_url(
+            "notes.txt", 5, "text/plain", user_id
+        )
+        upload = upload_sessions.uploads[UUID(result["file_id"])]
+        _put(tmp_path, upload, b"hello")
+        upload.expires_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+
+        assert await direct_service.cleanup_expired_uploads() == 1
+        assert upload_sessions.uploads == {}
+        assert not (tmp_path / upload.storage_key).exists()
+
+    async def test_local_storage_has_no_direct_uploads(self, service):
+        """Backends without signed URLs refuse direct uploads."""
+
+        with pytest.raises(BadRequestException):
+            await service.create_upload_url("notes.txt", 5, "text/plain", uuid4())
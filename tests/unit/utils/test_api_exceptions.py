@@ -0,0 +1,96 @@
+"""
+Handles testing of the API exception classes.
+"""
+
+import pytest
+
+from src.utils.api_exceptions import (
+    ERROR_CODES,
+    EXCEPTION_REGISTRY,
+    ApiException,
+    BadRequestException,
+    FileTypeException,
+    NotFoundException,
+    UserNotFoundException,
+)
+
+
+class TestApiExceptionRegistry:
+    """Tests the defaults set by @api_exception and the code registry"""
+
+    def test_registry_maps_codes_to_classes(self):
+        """Every exception class is registered under its default code."""
+
+        assert EXCEPTION_REGISTRY["NOT_FOUND"] is NotFoundException
+        assert EXCEPTION_REGISTRY["USER_NOT_FOUND"] is UserNotFoundException
+        assert all(cls.DEFAULT_CODE == code for code, cls in EXCEPTION_REGISTRY.items())
+
+    def test_subclass_inherits_status_code(self):
+        """A subclass without its own status code uses its parent's."""
+
+        assert UserNotFoundException.STATUS_CODE == NotFoundException.STATUS_CODE
+        assert FileTypeException.STATUS_CODE == BadRequestException.STATUS_CODE
+
+    def test_default_raise_shares_default_response(self):
+        """Raising with the defaults reuses the prebuilt error body."""
+
+        first, second = UserNotFoundException(), UserNotFoundException()
+
+        assert first.error_response is UserNotFoundException.DEFAULT_RESPONSE
+        assert second.error_response is first.error_response
+
+    def test_details_build_new_response(self):
+        """Custom details get their own error body."""
+
+        exc = UserNotFoundException(details="id 42")
+
+        assert exc.error_response is not UserNotFoundException.DEFAULT_RESPONSE
+        assert exc.error_response.error.details == "id 42"
+
+
+class TestApiExceptionOf:
+    """Tests building exceptions from their error code with ApiException.of"""
+
+    def test_returns_registered_subclass(self):
+        """The exception class registered for the code is instantiated."""
+
+        exc = ApiException.of("USER_NOT_FOUND")
+
+        assert type(exc) is UserNotFoundException
+        assert isinstance(exc, NotFoundException)
+
+    def test_uses_status_and_default_message(self):
+        """The status code and message default to the code's registered values."""
+
+        exc = ApiException.of("UNSUPPORTED_FILE_TYPE")
+
+        assert type(exc) is FileTypeException
+        assert exc.status_code == 400
+        assert exc.message == FileTypeException.DEFAULT_MESSAGE
+        assert exc.error_detail.code == "UNSUPPORTED_FILE_TYPE"
+        assert exc.error_detail.details is None
+
+    def test_overrides_message_and_details(self):
+        """An explicit message and details replace the defaults."""
+
+        exc = ApiException.of("NOT_FOUND", details="no such file", message="Gone")
+
+        assert exc.message == "Gone"
+        assert exc.error_detail.details == "no such file"
+
+    @pytest.mark.parametrize("code", sorted(ERROR_CODES))
+    def test_matches_error_codes(self, code):
+        """Every registered code maps to its documented status and message."""
+
+        status_code, message = ERROR_CODES[code]
+        exc = ApiException.of(code)
+
+        assert exc.status_code == status_code
+        assert exc.message == message
+        assert exc.error_detail.code == code
+
+    def test_unknown_code_raises(self):
+        """An unregistered code is rejected instead of falling back silently."""
+
+        with pytest.raises(ValueError, match="NO_SUCH_CODE"):
+            ApiException.of("NO_SUCH_CODE")
@@ -0,0 +1,123 @@
+"""
+Handles testing of the API response bodies.
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.config.settings import settings
+from src.middleware.exception_handler import setup_exception_handlers
+from src.utils import api_responses
+from src.utils.api_exceptions import NotFoundException, UserNotFoundException
+from src.utils.api_responses import ErrorDetail, ErrorResponseModel
+
+
+@pytest.fixture
+def app_env(monkeypatch):
+    """Set the app environment, resetting the cached stack trace switch."""
+
+    def set_env(env: str) -> None:
+        monkeypatch.setattr(settings.app, "ENV", env)
+        api_responses._include_stack_traces.cache_clear()
+
+    yield set_env
+    api_responses._include_stack_traces.cache_clear()
+
+
+def _error_with_trace() -> ErrorResponseModel:
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError as e:
+        return ErrorResponseModel(
+            message="Failed",
+            error=ErrorDetail(code="INTERNAL_SERVER_ERROR", details="d", stack_trace=e),
+        )
+
+
+class TestErrorResponseModel:
+    """Tests the error body built by ErrorResponseModel.to_dict"""
+
+    def test_includes_stack_trace_in_development(self, app_env):
+        """The formatted stack trace is sent to clients in development."""
+
+        app_env("development")
+        body = _error_with_trace().to_dict()
+
+        assert body["success"] is False
+        assert body["message"] == "Failed"
+        assert body["error"]["code"] == "INTERNAL_SERVER_ERROR"
+        assert body["error"]["details"] == "d"
+        assert "RuntimeError: boom" in body["error"]["stack_trace"]
+
+    def test_omits_stack_trace_outside_development(self, app_env):
+        """The stack trace is never sent to clients in production."""
+
+        app_env("production")
+        body = _error_with_trace().to_dict()
+
+        assert "stack_trace" not in body["error"]
+        assert body["error"]["details"] == "d"
+
+    def test_skips_formatting_outside_development(self, app_env, monkeypatch):
+        """The traceback is never formatted when it won't be sent."""
+
+        def fail(stack_trace):
+            raise AssertionError("stack trace was formatted")
+
+        monkeypatch.setattr(api_responses, "format_stack_trace", fail)
+        app_env("production")
+
+        _error_with_trace().to_dict()
+
+    def test_captured_trace_is_kept_unformatted(self, app_env):
+        """capture_trace keeps the exception itself, formatted only on output."""
+
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError as e:
+            caught = e
+            exc = NotFoundException(details="d", capture_trace=True)
+
+        assert exc.error_detail.stack_trace is caught
+
+        app_env("development")
+        body = exc.error_response.to_dict()
+        assert "RuntimeError: boom" in body["error"]["stack_trace"]
+
+    def test_omits_empty_fields(self, app_env):
+        """Details and stack trace are left out when they have no value."""
+
+        app_env("development")
+        body = ErrorResponseModel(
+            message="Not found", error=ErrorDetail(code="NOT_FOUND")
+        ).to_dict()
+
+        assert body == {
+            "success": False,
+            "message": "Not found",
+            "error": {"code": "NOT_FOUND"},
+        }
+
+    def test_error_responses_have_no_null_fields(self, app_env):
+        """Errors sent by the exception handlers leave out empty fields."""
+
+        app_env("production")
+        app = FastAPI()
+        setup_exception_handlers(app)
+
+        @app.get("/missing-user")
+        def missing_user():
+            raise UserNotFoundException()
+
+        client = TestClient(app)
+
+        assert client.get("/missing-user").json() == {
+            "success": False,
+            "message": UserNotFoundException.DEFAULT_MESSAGE,
+            "error": {"code": "USER_NOT_FOUND"},
+        }
+        assert client.get("/no-such-route").json()["error"] == {
+            "code": "HTTP_EXCEPTION",
+            "details": "Not Found",
+        }